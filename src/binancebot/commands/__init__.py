@@ -38,6 +38,7 @@ from binancebot.commands.optimize_commands import (
     start_backtesting_show,
     start_edge,
     start_hyperopt,
+    start_hyperopt_worker,
     start_lookahead_analysis,
     start_recursive_analysis,
 )
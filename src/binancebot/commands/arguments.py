@@ -43,6 +43,10 @@ ARGS_COMMON_OPTIMIZE = [
     "stake_amount",
     "fee",
     "pairs",
+    "indicator_jobs",
+    "indicator_cache",
+    "dataload_jobs",
+    "ohlcv_base_timeframe",
 ]
 
 ARGS_BACKTEST = [
@@ -58,6 +62,9 @@ ARGS_BACKTEST = [
     "exportdirectory",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_engine",
+    "backtest_jobs",
+    "backtest_profile",
     "AIML_backtest_live_models",
     "backtest_notes",
 ]
@@ -74,6 +81,10 @@ ARGS_HYPEROPT = [
     "print_all",
     "print_json",
     "hyperopt_jobs",
+    "hyperopt_async",
+    "hyperopt_prune_checkpoints",
+    "hyperopt_storage",
+    "hyperopt_study_name",
     "hyperopt_random_state",
     "hyperopt_min_trades",
     "hyperopt_loss",
@@ -81,6 +92,7 @@ ARGS_HYPEROPT = [
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
     "early_stop",
+    "backtest_engine",
 ]
 
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE]
@@ -173,6 +185,7 @@ ARGS_DOWNLOAD_DATA = [
     "erase",
     "dataformat_ohlcv",
     "dataformat_trades",
+    "ohlcv_base_timeframe",
     "trading_mode",
     "prepend_data",
 ]
@@ -383,6 +396,7 @@ class Arguments:
             start_hyperopt,
             start_hyperopt_list,
             start_hyperopt_show,
+            start_hyperopt_worker,
             start_install_ui,
             start_list_data,
             start_list_exchanges,
@@ -537,6 +551,15 @@ class Arguments:
         hyperopt_cmd.set_defaults(func=start_hyperopt)
         self._build_args(optionlist=ARGS_HYPEROPT, parser=hyperopt_cmd)
 
+        # Add hyperopt-worker subcommand
+        hyperopt_worker_cmd = subparsers.add_parser(
+            "hyperopt-worker",
+            help="Evaluate epochs of a distributed hyperopt run.",
+            parents=[_common_parser, _strategy_parser],
+        )
+        hyperopt_worker_cmd.set_defaults(func=start_hyperopt_worker)
+        self._build_args(optionlist=ARGS_HYPEROPT, parser=hyperopt_worker_cmd)
+
         # Add hyperopt-list subcommand
         hyperopt_list_cmd = subparsers.add_parser(
             "hyperopt-list",
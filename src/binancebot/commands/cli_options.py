@@ -258,6 +258,54 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        "--backtest-engine",
+        help="Backtest engine to use. `columnar` keeps candles in NumPy arrays and skips "
+        "candles without signal or open trade "
+        f"(default: `{constants.BACKTEST_ENGINE_DEFAULT}`).",
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "backtest_jobs": Arg(
+        "--backtest-jobs",
+        help="The number of strategies of `--strategy-list` to backtest concurrently "
+        "(backtest worker processes). "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), strategies are backtested one after the other.",
+        type=int,
+        metavar="JOBS",
+    ),
+    "backtest_profile": Arg(
+        "--profile",
+        help="Profile backtesting. Reports time and call counts of backtest phases, "
+        "engine steps and strategy callbacks, and stores them as json and as "
+        "flamegraph stacks in the backtest results directory.",
+        action="store_true",
+        default=False,
+    ),
+    "indicator_jobs": Arg(
+        "--indicator-jobs",
+        help="The number of pairs to populate indicators for concurrently (threads). "
+        "Speeds up indicators computed by libraries releasing the GIL, like TA-Lib. "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), pairs are populated one after the other.",
+        type=int,
+        metavar="JOBS",
+    ),
+    "dataload_jobs": Arg(
+        "--dataload-jobs",
+        help="The number of pairs to load candle data for concurrently (threads). "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), pairs are loaded one after the other.",
+        type=int,
+        metavar="JOBS",
+    ),
+    "indicator_cache": Arg(
+        "--indicator-cache",
+        help="Cache populated indicators on disk and reuse them for unchanged indicator code, "
+        "parameters and candles. Entries are kept for the specified age "
+        f"(default: `{constants.INDICATOR_CACHE_DEFAULT}`).",
+        choices=constants.BACKTEST_CACHE_AGE,
+    ),
     # Hyperopt
     "hyperopt_path": Arg(
         "--hyperopt-path",
@@ -331,6 +379,36 @@ AVAILABLE_CLI_OPTIONS = {
         metavar="JOBS",
         default=-1,
     ),
+    "hyperopt_async": Arg(
+        "--hyperopt-async",
+        help="Submit a new epoch as soon as any hyperopt worker is done, instead of running "
+        "epochs in batches of one epoch per worker. Epochs are numbered in the order they "
+        "finish, so results are not reproducible with --random-state.",
+        action="store_true",
+    ),
+    "hyperopt_prune_checkpoints": Arg(
+        "--hyperopt-prune",
+        help="Abort hopeless epochs early. The backtest of every epoch is checked at INT evenly "
+        "spaced checkpoints, and epochs doing worse than the median of the completed epochs at "
+        "a checkpoint are pruned. Pruned epochs are not saved. Disabled by default.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
+    "hyperopt_storage": Arg(
+        "--hyperopt-storage",
+        help="Run hyperopt distributed, with the study kept in this storage - a database URL "
+        "(e.g. `sqlite:///hyperopt.sqlite`) or the path of a journal file. "
+        "Epochs are evaluated by `hyperopt-worker` processes using the same storage. "
+        "Epochs of workers which send no heartbeat for 5 minutes (e.g. killed workers or lost "
+        "machines) are failed and evaluated again by the remaining workers. Without any "
+        "running workers, hyperopt waits until new workers are started.",
+        metavar="STORAGE",
+    ),
+    "hyperopt_study_name": Arg(
+        "--study-name",
+        help="Name of the study of a distributed hyperopt run (default: strategy name).",
+        metavar="NAME",
+    ),
     "hyperopt_random_state": Arg(
         "--random-state",
         help="Set random state to some positive integer for reproducible hyperopt results.",
@@ -503,6 +581,11 @@ AVAILABLE_CLI_OPTIONS = {
         help="Storage format for downloaded candle (OHLCV) data. (default: `feather`).",
         choices=constants.AVAILABLE_DATAHANDLERS,
     ),
+    "ohlcv_base_timeframe": Arg(
+        "--base-timeframe",
+        help="Only store candles of this timeframe (e.g. `1m`). "
+        "Candles of coarser timeframes are resampled from them when loading.",
+    ),
     "dataformat_trades": Arg(
         "--data-format-trades",
         help="Storage format for downloaded trades data. (default: `feather`).",
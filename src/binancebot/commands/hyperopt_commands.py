@@ -30,8 +30,8 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
         config["user_data_dir"] / "hyperopt_results", config.get("hyperoptexportfilename")
     )
 
-    # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    # Previous evaluations - only summaries, full epochs are loaded when needed
+    epochs, total_epochs = HyperoptTools.load_filtered_summaries(results_file, config)
 
     if not export_csv:
         try:
@@ -49,11 +49,13 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
 
     if epochs and not no_details:
         sorted_epochs = sorted(epochs, key=itemgetter("loss"))
-        results = sorted_epochs[0]
+        results = HyperoptTools.load_epochs(results_file, sorted_epochs[:1])[0]
         HyperoptTools.show_epoch_details(results, total_epochs, print_json, no_header)
 
     if epochs and export_csv:
-        HyperoptTools.export_csv_file(config, epochs, export_csv)
+        HyperoptTools.export_csv_file(
+            config, HyperoptTools.load_epochs(results_file, epochs), export_csv
+        )
 
 
 def start_hyperopt_show(args: dict[str, Any]) -> None:
@@ -75,8 +77,8 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
 
     n = config.get("hyperopt_show_index", -1)
 
-    # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    # Previous evaluations - only summaries, the full epoch is loaded when shown
+    epochs, total_epochs = HyperoptTools.load_filtered_summaries(results_file, config)
 
     filtered_epochs = len(epochs)
 
@@ -94,7 +96,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
         n -= 1
 
     if epochs:
-        val = epochs[n]
+        val = HyperoptTools.load_epochs(results_file, [epochs[n]])[0]
 
         metrics = val["results_metrics"]
         if "strategy_name" in metrics:
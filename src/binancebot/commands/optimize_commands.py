@@ -123,6 +123,28 @@ def start_hyperopt(args: dict[str, Any]) -> None:
         # Same in Edge and Backtesting start() functions.
 
 
+def start_hyperopt_worker(args: dict[str, Any]) -> None:
+    """
+    Start a worker of a distributed hyperopt run
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    # Import here to avoid loading hyperopt module when it's not used
+    try:
+        from binancebot.optimize.hyperopt.hyperopt_worker import HyperoptWorker
+    except ImportError as e:
+        raise OperationalException(
+            f"{e}. Please ensure that the hyperopt dependencies are installed."
+        ) from e
+    # Initialize configuration
+    config = setup_optimize_configuration(args, RunMode.HYPEROPT)
+
+    logger.info("Starting binancebot in Hyperopt worker mode")
+
+    worker = HyperoptWorker(config)
+    worker.start()
+
+
 def start_edge(args: dict[str, Any]) -> None:
     """
     Start Edge script
@@ -6,6 +6,7 @@ from binancebot.constants import (
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
     BACKTEST_CACHE_AGE,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
     HYPEROPT_LOSS_BUILTIN,
@@ -236,6 +237,49 @@ CONF_SCHEMA = {
             "type": "string",
             "enum": BACKTEST_CACHE_AGE,
         },
+        "backtest_engine": {
+            "description": (
+                "Backtest engine. `columnar` stores candles as NumPy arrays and only "
+                "processes candles with a signal or an open trade."
+            ),
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+        },
+        "backtest_jobs": {
+            "description": (
+                "Number of strategies from the strategy list to backtest concurrently. "
+                "-1 uses all CPUs."
+            ),
+            "type": "integer",
+        },
+        "backtest_profile": {
+            "description": "Profile backtest phases, engine steps and strategy callbacks.",
+            "type": "boolean",
+        },
+        "indicator_jobs": {
+            "description": (
+                "Number of pairs to populate indicators for concurrently in optimize modes. "
+                "-1 uses all CPUs."
+            ),
+            "type": "integer",
+        },
+        "dataload_jobs": {
+            "description": (
+                "Number of pairs to load candle data for concurrently in optimize modes. "
+                "-1 uses all CPUs."
+            ),
+            "type": "integer",
+        },
+        "indicator_cache": {
+            "description": "Cache populated indicators on disk for the specified age.",
+            "type": "string",
+            "enum": BACKTEST_CACHE_AGE,
+        },
+        "indicator_cache_size": {
+            "description": "Maximum size of the indicator cache in MB.",
+            "type": "integer",
+            "minimum": 1,
+        },
         # Hyperopt
         "hyperopt_path": {
             "description": "Specify additional lookup path for Hyperopt Loss functions.",
@@ -281,6 +325,33 @@ CONF_SCHEMA = {
             "type": "integer",
             "default": -1,
         },
+        "hyperopt_async": {
+            "description": (
+                "Submit a new hyperopt epoch as soon as any worker is done, instead of "
+                "running epochs in batches of one epoch per worker."
+            ),
+            "type": "boolean",
+        },
+        "hyperopt_prune_checkpoints": {
+            "description": (
+                "Number of checkpoints at which hyperopt epochs are checked, and pruned if "
+                "doing worse than the median of the completed epochs. Set to 0 to disable."
+            ),
+            "type": "integer",
+            "minimum": 0,
+        },
+        "hyperopt_storage": {
+            "description": (
+                "Storage of the study of a distributed hyperopt run - a database URL or the "
+                "path of a journal file. Epochs of workers without heartbeat for 5 minutes are "
+                "evaluated again by the remaining workers."
+            ),
+            "type": "string",
+        },
+        "hyperopt_study_name": {
+            "description": "Name of the study of a distributed hyperopt run.",
+            "type": "string",
+        },
         "hyperopt_random_state": {
             "description": "Random state for hyperopt trials.",
             "type": "integer",
@@ -819,6 +890,18 @@ CONF_SCHEMA = {
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "ohlcv_base_timeframe": {
+            "description": (
+                "Only download and store candles of this timeframe. "
+                "Candles of coarser timeframes are resampled from them when loading."
+            ),
+            "type": "string",
+        },
+        "ohlcv_resample_cache": {
+            "description": "Cache resampled candles on disk.",
+            "type": "boolean",
+            "default": False,
+        },
         "dataformat_trades": {
             "description": "Data format for trade data.",
             "type": "string",
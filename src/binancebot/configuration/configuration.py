@@ -327,6 +327,12 @@ class Configuration:
             ("export", "Parameter --export detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_engine", "Parameter --backtest-engine detected, using {} engine ..."),
+            ("backtest_jobs", "Parameter --backtest-jobs detected: {}"),
+            ("backtest_profile", "Parameter --profile detected, profiling backtesting ..."),
+            ("indicator_jobs", "Parameter --indicator-jobs detected: {}"),
+            ("indicator_cache", "Parameter --indicator-cache={} detected ..."),
+            ("dataload_jobs", "Parameter --dataload-jobs detected: {}"),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("AIML_backtest_live_models", "Parameter --AIML-backtest-live-models detected ..."),
             ("backtest_notes", "Parameter --notes detected: {} ..."),
@@ -363,6 +369,10 @@ class Configuration:
             ("print_json", "Parameter --print-json detected ..."),
             ("export_csv", "Parameter --export-csv detected: {}"),
             ("hyperopt_jobs", "Parameter -j/--job-workers detected: {}"),
+            ("hyperopt_async", "Parameter --hyperopt-async detected ..."),
+            ("hyperopt_prune_checkpoints", "Parameter --hyperopt-prune detected: {}"),
+            ("hyperopt_storage", "Using hyperopt storage: {}"),
+            ("hyperopt_study_name", "Using hyperopt study name: {}"),
             ("hyperopt_random_state", "Parameter --random-state detected: {}"),
             ("hyperopt_min_trades", "Parameter --min-trades detected: {}"),
             ("hyperopt_loss", "Using Hyperopt loss class name: {}"),
@@ -406,6 +416,7 @@ class Configuration:
             ("convert_trades", "Detected --convert: {} - Converting Trade data to OHCV {}"),
             ("dataformat_ohlcv", 'Using "{}" to store OHLCV data.'),
             ("dataformat_trades", 'Using "{}" to store trades data.'),
+            ("ohlcv_base_timeframe", "Resampling candles from {} candles ..."),
             ("show_timerange", "Detected --show-timerange"),
         ]
         self._args_to_config_loop(config, configurations)
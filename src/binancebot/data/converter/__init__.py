@@ -5,6 +5,7 @@ from binancebot.data.converter.converter import (
     ohlcv_to_dataframe,
     order_book_to_dataframe,
     reduce_dataframe_footprint,
+    resample_ohlcv_dataframe,
     trim_dataframe,
     trim_dataframes,
 )
@@ -27,6 +28,7 @@ __all__ = [
     "ohlcv_to_dataframe",
     "order_book_to_dataframe",
     "reduce_dataframe_footprint",
+    "resample_ohlcv_dataframe",
     "trim_dataframe",
     "trim_dataframes",
     "convert_trades_format",
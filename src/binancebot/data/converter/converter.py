@@ -73,16 +73,20 @@ def clean_ohlcv_dataframe(
     :param drop_incomplete: Drop the last candle of the dataframe, assuming it's incomplete
     :return: DataFrame
     """
-    # group by index and aggregate results to eliminate duplicate ticks
-    data = data.groupby(by="date", as_index=False, sort=True).agg(
-        {
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "max",
-        }
-    )
+    if _get_sorted_timestamps(data["date"]) is not None:
+        # Dates are unique and sorted already - nothing to aggregate.
+        data = _select_ohlcv_columns(data)
+    else:
+        # group by index and aggregate results to eliminate duplicate ticks
+        data = data.groupby(by="date", as_index=False, sort=True).agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "volume": "max",
+            }
+        )
     # eliminate partial candle
     if drop_incomplete:
         data.drop(data.tail(1).index, inplace=True)
@@ -94,6 +98,57 @@ def clean_ohlcv_dataframe(
         return data
 
 
+def _select_ohlcv_columns(data: DataFrame) -> DataFrame:
+    """
+    Copy of the OHLCV columns of data, with a default index.
+    """
+    data = data[DEFAULT_DATAFRAME_COLUMNS]
+    data.index = pd.RangeIndex(len(data))
+    return data
+
+
+def _get_sorted_timestamps(dates: pd.Series) -> np.ndarray | None:
+    """
+    Dates as int64 timestamps (in the unit of the dates).
+    :return: None unless dates are datetimes, sorted and unique.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dates) or dates.hasnans:
+        return None
+    timestamps = dates.to_numpy(dtype=dates.dtype.base).view("i8")
+    if len(timestamps) > 1 and np.diff(timestamps).min() <= 0:
+        return None
+    return timestamps
+
+
+def _get_candle_positions(dates: pd.Series, timeframe: str) -> np.ndarray | None:
+    """
+    Position of each date on the candle grid of a fixed-length timeframe, counted in
+    candles from the first date.
+    :return: None unless dates are sorted, unique and each date is the start of the
+        resample bin it falls into.
+    """
+    from binancebot.exchange import timeframe_to_resample_freq, timeframe_to_seconds
+
+    timeframe_seconds = timeframe_to_seconds(timeframe)
+    if timeframe_to_resample_freq(timeframe) != f"{timeframe_seconds}s":
+        # Weekly / monthly / yearly candles
+        return None
+    timestamps = _get_sorted_timestamps(dates)
+    if timestamps is None or len(timestamps) == 0:
+        return None
+    timeframe_delta = pd.Timedelta(seconds=timeframe_seconds)
+    # Resample bins start at midnight of the first day.
+    first = dates.iloc[0]
+    if (first - first.normalize()) % timeframe_delta:
+        return None
+    positions, offsets = np.divmod(
+        timestamps - timestamps[0], timeframe_delta // pd.Timedelta(1, unit=dates.dt.unit)
+    )
+    if offsets.any():
+        return None
+    return positions
+
+
 def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
     """
     Fills up missing data with 0 volume rows,
@@ -102,10 +157,41 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
     """
     from binancebot.exchange import timeframe_to_resample_freq
 
-    ohlcv_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
-    resample_interval = timeframe_to_resample_freq(timeframe)
-    # Resample to create "NAN" values
-    df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
+    positions = _get_candle_positions(dataframe["date"], timeframe)
+    if positions is not None:
+        # Candles are on the grid already - only missing candles need to be inserted.
+        value_columns = DEFAULT_DATAFRAME_COLUMNS[1:]
+        if (
+            positions[-1] == len(positions) - 1
+            and not dataframe[value_columns].isna().to_numpy().any()
+        ):
+            # Complete data
+            return _select_ohlcv_columns(dataframe)
+        full_dates = pd.date_range(
+            dataframe["date"].iloc[0],
+            periods=positions[-1] + 1,
+            freq=pd.Timedelta(timeframe_to_resample_freq(timeframe)),
+            unit=dataframe["date"].dt.unit,
+            name="date",
+        )
+        columns = {}
+        for col in value_columns:
+            columns[col] = np.full(len(full_dates), np.nan)
+            columns[col][positions] = dataframe[col].to_numpy()
+        df = DataFrame(columns, index=full_dates)
+        # Missing candles have no volume
+        df["volume"] = df["volume"].fillna(0)
+    else:
+        ohlcv_dict = {
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "volume": "sum",
+        }
+        resample_interval = timeframe_to_resample_freq(timeframe)
+        # Resample to create "NAN" values
+        df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
 
     # Forwardfill close for missing columns
     df["close"] = df["close"].ffill()
@@ -134,6 +220,57 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
     return df
 
 
+def resample_ohlcv_dataframe(
+    dataframe: DataFrame, timeframe: str, base_timeframe: str
+) -> DataFrame:
+    """
+    Resample candles of base_timeframe to the coarser timeframe.
+    Candles not completely covered by the data (at its start and end) are dropped.
+    Candles without any base candle are omitted - see ohlcv_fill_up_missing_data.
+    :param dataframe: Candle (OHLCV) data of base_timeframe - sorted, with unique dates
+    :param timeframe: Timeframe to resample to. Must be a multiple of base_timeframe.
+    :param base_timeframe: Timeframe of dataframe
+    :return: DataFrame with candles of timeframe
+    """
+    from binancebot.exchange import timeframe_to_resample_freq, timeframe_to_seconds
+
+    if dataframe.empty:
+        return _select_ohlcv_columns(dataframe)
+    dates = dataframe["date"]
+    timeframe_seconds = timeframe_to_seconds(timeframe)
+    resample_interval = timeframe_to_resample_freq(timeframe)
+    if resample_interval == f"{timeframe_seconds}s":
+        # Candles start at multiples of the timeframe since the epoch
+        labels = dates.dt.floor(resample_interval)
+        next_label = labels.iloc[-1] + pd.Timedelta(seconds=timeframe_seconds)
+    else:
+        # Weekly / monthly / yearly candles - roll back to the start of the period
+        offset = pd.tseries.frequencies.to_offset(resample_interval)
+        labels = ((dates.dt.normalize() + pd.Timedelta(days=1)) - offset).dt.as_unit(dates.dt.unit)
+        next_label = labels.iloc[-1] + offset
+
+    label_values = labels.to_numpy(dtype=labels.dtype.base).view("i8")
+    starts = np.flatnonzero(np.diff(label_values, prepend=label_values[0] - 1))
+    ends = np.append(starts[1:], len(label_values)) - 1
+    df = DataFrame(
+        {
+            "date": labels.iloc[starts].to_numpy(dtype=labels.dtype.base),
+            "open": dataframe["open"].to_numpy()[starts],
+            "high": np.fmax.reduceat(dataframe["high"].to_numpy(), starts),
+            "low": np.fmin.reduceat(dataframe["low"].to_numpy(), starts),
+            "close": dataframe["close"].to_numpy()[ends],
+            "volume": np.add.reduceat(np.nan_to_num(dataframe["volume"].to_numpy()), starts),
+        }
+    )
+    df["date"] = df["date"].dt.tz_localize(dates.dt.tz)
+
+    # Drop candles the data only covers partially
+    first = 1 if dates.iloc[0] != labels.iloc[0] else 0
+    last_end = dates.iloc[-1] + pd.Timedelta(seconds=timeframe_to_seconds(base_timeframe))
+    last = len(df) - 1 if last_end < next_label else len(df)
+    return df.iloc[first:last].reset_index(drop=True)
+
+
 def trim_dataframe(
     df: DataFrame, timerange, *, df_date_col: str = "date", startup_candles: int = 0
 ) -> DataFrame:
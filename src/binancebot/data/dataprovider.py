@@ -7,6 +7,7 @@ Common Interface for bot and strategy to access data.
 
 import logging
 from collections import deque
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -19,7 +20,7 @@ from binancebot.constants import (
     ListPairsWithTimeframes,
     PairWithTimeframe,
 )
-from binancebot.data.history import get_datahandler, load_pair_history
+from binancebot.data.history import OhlcvResampler, get_datahandler, load_pair_history
 from binancebot.enums import CandleType, RPCMessageType, RunMode, TradingMode
 from binancebot.exceptions import ExchangeError, OperationalException
 from binancebot.exchange import Exchange, timeframe_to_prev_date, timeframe_to_seconds
@@ -50,6 +51,7 @@ class DataProvider:
         self.__rpc = rpc
         self.__cached_pairs: dict[PairWithTimeframe, tuple[DataFrame, datetime]] = {}
         self.__slice_index: dict[str, int] = {}
+        self.__slice_index_resolver: Callable[[str], int | None] | None = None
         self.__slice_date: datetime | None = None
 
         self.__cached_pairs_backtesting: dict[PairWithTimeframe, DataFrame] = {}
@@ -61,6 +63,7 @@ class DataProvider:
 
         self._default_candle_type = self._config.get("candle_type_def", CandleType.SPOT)
         self._default_timeframe = self._config.get("timeframe", "1h")
+        self._ohlcv_resampler = OhlcvResampler.from_config(self._config)
 
         self.__msg_cache = PeriodicCache(
             maxsize=1000, ttl=timeframe_to_seconds(self._default_timeframe)
@@ -77,6 +80,14 @@ class DataProvider:
         """
         self.__slice_index[pair] = limit_index
 
+    def _set_dataframe_max_index_resolver(self, resolver: Callable[[str], int | None] | None):
+        """
+        Resolve the analyzed dataframe max index lazily, instead of setting it for every pair.
+        Only relevant in backtesting (columnar engine).
+        :param resolver: Callable returning the dataframe index for a pair (or None).
+        """
+        self.__slice_index_resolver = resolver
+
     def _set_dataframe_max_date(self, limit_date: datetime):
         """
         Limit informative dataframe to max specified index.
@@ -328,6 +339,7 @@ class DataProvider:
                 timerange=timerange,
                 data_format=self._config["dataformat_ohlcv"],
                 candle_type=_candle_type,
+                resampler=self._ohlcv_resampler,
             )
         return self.__cached_pairs_backtesting[saved_pair].copy()
 
@@ -393,7 +405,11 @@ class DataProvider:
                 df, date = self.__cached_pairs[pair_key]
             else:
                 df, date = self.__cached_pairs[pair_key]
-                if (max_index := self.__slice_index.get(pair)) is not None:
+                if self.__slice_index_resolver:
+                    max_index = self.__slice_index_resolver(pair)
+                else:
+                    max_index = self.__slice_index.get(pair)
+                if max_index is not None:
                     df = df.iloc[max(0, max_index - MAX_DATAFRAME_CANDLES) : max_index]
                 else:
                     return (DataFrame(), datetime.fromtimestamp(0, tz=UTC))
@@ -432,6 +448,7 @@ class DataProvider:
         # otherwise they're reloaded each time during hyperopt due to with analyze_per_epoch
         # self.__cached_pairs_backtesting = {}
         self.__slice_index = {}
+        self.__slice_index_resolver = None
 
     # Exchange functions
 
@@ -19,3 +19,4 @@ from .history_utils import (
     refresh_data,
     validate_backtest_data,
 )
+from .ohlcv_resampler import OhlcvResampler
@@ -1,7 +1,9 @@
 import logging
+from functools import cache
+from pathlib import Path
 
 from pandas import DataFrame, read_feather, to_datetime
-from pyarrow import dataset
+from pyarrow import Table, dataset, ipc, memory_map
 
 from binancebot.configuration import TimeRange
 from binancebot.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -60,7 +62,10 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
+            if timerange:
+                pairdata = self._read_ohlcv_batches(filename, timerange)
+            else:
+                pairdata = read_feather(filename)
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -79,6 +84,28 @@ class FeatherDataHandler(IDataHandler):
             )
             return DataFrame(columns=self._columns)
 
+    def _read_ohlcv_batches(self, filename: Path, timerange: TimeRange) -> DataFrame:
+        """
+        Read only the record batches of a feather file covering the timerange.
+        Batches are located by reading just the date column of few batches.
+        """
+        with memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            date_reader = ipc.open_file(
+                source,
+                options=ipc.IpcReadOptions(included_fields=[reader.schema.get_field_index("date")]),
+            )
+
+            @cache
+            def get_batch_dates(i: int):
+                dates = date_reader.get_batch(i).column(0)
+                return self._chunk_date(dates[0].as_py()), self._chunk_date(dates[-1].as_py())
+
+            batches = self._get_chunk_range(timerange, reader.num_record_batches, get_batch_dates)
+            return Table.from_batches(
+                [reader.get_batch(i) for i in batches], schema=reader.schema
+            ).to_pandas()
+
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
@@ -103,45 +130,16 @@ class FeatherDataHandler(IDataHandler):
         self.create_dir_if_needed(filename)
         data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
         raise NotImplementedError()
 
-    def _build_arrow_time_filter(self, timerange: TimeRange | None):
-        """
-        Build Arrow predicate filter for timerange filtering.
-        Treats 0 as unbounded (no filter on that side).
-        :param timerange: TimeRange object with start/stop timestamps
-        :return: Arrow filter expression or None if fully unbounded
-        """
-        if not timerange:
-            return None
-
-        # Treat 0 as unbounded
-        start_set = bool(timerange.startts and timerange.startts > 0)
-        stop_set = bool(timerange.stopts and timerange.stopts > 0)
-
-        if not (start_set or stop_set):
-            return None
-
-        ts_field = dataset.field("timestamp")
-        exprs = []
-
-        if start_set:
-            exprs.append(ts_field >= timerange.startts)
-        if stop_set:
-            exprs.append(ts_field <= timerange.stopts)
-
-        if len(exprs) == 1:
-            return exprs[0]
-        else:
-            return exprs[0] & exprs[1]
-
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
@@ -4,24 +4,31 @@ It's subclasses handle and storing data from disk.
 
 """
 
+import hashlib
 import logging
 import re
+import shutil
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import UTC, datetime
 from pathlib import Path
 
 from pandas import DataFrame, to_datetime
+from pyarrow import dataset
 
 from binancebot import misc
 from binancebot.configuration import TimeRange
 from binancebot.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
 from binancebot.data.converter import (
     clean_ohlcv_dataframe,
+    resample_ohlcv_dataframe,
     trades_convert_types,
     trades_df_remove_duplicates,
     trim_dataframe,
 )
+from binancebot.data.history.ohlcv_resampler import OhlcvResampler
 from binancebot.enums import CandleType, TradingMode
 from binancebot.exceptions import OperationalException
 from binancebot.exchange import timeframe_to_seconds
@@ -33,6 +40,9 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # True if ohlcv_append() and trades_append() are implemented, so downloads can add new
+    # data without rewriting the stored data.
+    supports_append = False
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -141,6 +151,77 @@ class IDataHandler(ABC):
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
+    @staticmethod
+    def _build_arrow_time_filter(timerange: TimeRange | None):
+        """
+        Build Arrow predicate filter for timerange filtering.
+        Treats 0 as unbounded (no filter on that side).
+        :param timerange: TimeRange object with start/stop timestamps
+        :return: Arrow filter expression or None if fully unbounded
+        """
+        if not timerange:
+            return None
+
+        # Treat 0 as unbounded
+        start_set = bool(timerange.startts and timerange.startts > 0)
+        stop_set = bool(timerange.stopts and timerange.stopts > 0)
+
+        if not (start_set or stop_set):
+            return None
+
+        # Trade timestamps are in milliseconds
+        ts_field = dataset.field("timestamp")
+        exprs = []
+
+        if start_set:
+            exprs.append(ts_field >= timerange.startts * 1000)
+        if stop_set:
+            exprs.append(ts_field <= timerange.stopts * 1000)
+
+        if len(exprs) == 1:
+            return exprs[0]
+        else:
+            return exprs[0] & exprs[1]
+
+    @staticmethod
+    def _get_chunk_range(
+        timerange: TimeRange | None,
+        chunk_count: int,
+        get_chunk_dates: Callable[[int], tuple[datetime, datetime]],
+    ) -> range:
+        """
+        Chunks (e.g. record batches or row groups) of a date-sorted file covering the timerange.
+        Starts with the last chunk starting at or before the timerange start, and ends with
+        the first chunk ending after the timerange stop - so trimming and validating the loaded
+        data works exactly as if the whole file was loaded.
+        Chunks are located by bisection, so only few chunk dates are needed.
+        :param timerange: Timerange to load
+        :param chunk_count: Number of chunks in the file
+        :param get_chunk_dates: Returns the first and last date of a chunk
+        :return: Range of chunk indexes to load
+        """
+        first, last = 0, chunk_count
+        if timerange and timerange.starttype == "date":
+            first = bisect_right(
+                range(chunk_count), timerange.startdt, key=lambda i: get_chunk_dates(i)[0]
+            )
+            first = max(first - 1, 0)
+        if timerange and timerange.stoptype == "date":
+            last = bisect_right(
+                range(first, chunk_count), timerange.stopdt, key=lambda i: get_chunk_dates(i)[1]
+            )
+            last = min(first + last + 1, chunk_count)
+        return range(first, last)
+
+    @staticmethod
+    def _chunk_date(value) -> datetime:
+        """
+        Convert a date read from file metadata (datetime or milliseconds) to datetime.
+        """
+        if isinstance(value, int):
+            return to_datetime(value, unit="ms", utc=True)
+        return to_datetime(value, utc=True)
+
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         """
         Remove data for this pair
@@ -150,17 +231,16 @@ class IDataHandler(ABC):
         :return: True when deleted, false if file did not exist.
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
-        if filename.exists():
-            filename.unlink()
-            return True
-        return False
+        return self._purge_path(filename)
 
     @abstractmethod
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Stored candles at or after the first date of data are replaced.
+        Only available if supports_append is set.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
@@ -237,12 +317,15 @@ class IDataHandler(ABC):
         """
 
     @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
-        Append data to existing files
+        Append data to existing files.
+        Stored trades at or after the first timestamp of data are replaced.
+        Only available if supports_append is set.
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
 
     @abstractmethod
@@ -276,8 +359,19 @@ class IDataHandler(ABC):
         :return: True when deleted, false if file did not exist.
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
-        if filename.exists():
-            filename.unlink()
+        return self._purge_path(filename)
+
+    @staticmethod
+    def _purge_path(path: Path) -> bool:
+        """
+        Remove stored data - a file, or a directory for data stored in multiple files.
+        :return: True when deleted, false if path did not exist.
+        """
+        if path.is_dir():
+            shutil.rmtree(path)
+            return True
+        if path.exists():
+            path.unlink()
             return True
         return False
 
@@ -375,6 +469,7 @@ class IDataHandler(ABC):
         drop_incomplete: bool = False,
         startup_candles: int = 0,
         warn_no_data: bool = True,
+        resampler: OhlcvResampler | None = None,
     ) -> DataFrame:
         """
         Load cached candle (OHLCV) data for the given pair.
@@ -387,6 +482,7 @@ class IDataHandler(ABC):
         :param startup_candles: Additional candles to load at the start of the period
         :param warn_no_data: Log a warning message when no data is found
         :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :param resampler: Resample candles from the resampler's base timeframe where possible
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
         # Fix startup period
@@ -394,9 +490,14 @@ class IDataHandler(ABC):
         if startup_candles > 0 and timerange_startup:
             timerange_startup.subtract_start(timeframe_to_seconds(timeframe) * startup_candles)
 
-        pairdf = self._ohlcv_load(
-            pair, timeframe, timerange=timerange_startup, candle_type=candle_type
-        )
+        if resampler and resampler.can_resample(timeframe):
+            pairdf = self._ohlcv_load_resampled(
+                pair, timeframe, timerange_startup, candle_type, resampler
+            )
+        else:
+            pairdf = self._ohlcv_load(
+                pair, timeframe, timerange=timerange_startup, candle_type=candle_type
+            )
         if self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data):
             return pairdf
         else:
@@ -419,6 +520,57 @@ class IDataHandler(ABC):
             self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data)
             return pairdf
 
+    def _ohlcv_load_resampled(
+        self,
+        pair: str,
+        timeframe: str,
+        timerange: TimeRange | None,
+        candle_type: CandleType,
+        resampler: OhlcvResampler,
+    ) -> DataFrame:
+        """
+        Load candles resampled from the stored candles of the resampler's base timeframe.
+        Falls back to the stored candles of timeframe if no base candles are stored.
+        """
+        base_timeframe = resampler.base_timeframe
+        fingerprint = self.ohlcv_data_fingerprint(pair, base_timeframe, candle_type)
+        if fingerprint is None:
+            return self._ohlcv_load(pair, timeframe, timerange=timerange, candle_type=candle_type)
+
+        def resample() -> DataFrame:
+            base_df = self._ohlcv_load(
+                pair,
+                base_timeframe,
+                timerange=resampler.get_base_timerange(timeframe, timerange),
+                candle_type=candle_type,
+            )
+            if base_df.empty:
+                return base_df
+            base_df = clean_ohlcv_dataframe(
+                base_df, base_timeframe, pair, fill_missing=False, drop_incomplete=False
+            )
+            return resample_ohlcv_dataframe(base_df, timeframe, base_timeframe)
+
+        return resampler.get_cached(pair, timeframe, candle_type, timerange, fingerprint, resample)
+
+    def ohlcv_data_fingerprint(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> str | None:
+        """
+        Fingerprint of the stored candles, which changes whenever they are modified.
+        Based on the names, sizes and modification times of the files - not on their contents.
+        :return: None if no candles are stored
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            return None
+        files = sorted(filename.iterdir()) if filename.is_dir() else [filename]
+        digest = hashlib.sha1(str(filename).encode())  # noqa: S324
+        for file in files:
+            stat = file.stat()
+            digest.update(f"{file.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
     def _check_empty_df(
         self,
         pairdf: DataFrame,
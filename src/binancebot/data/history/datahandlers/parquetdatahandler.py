@@ -1,6 +1,13 @@
 import logging
+import shutil
+from datetime import datetime
+from functools import cache
+from pathlib import Path
 
-from pandas import DataFrame, read_parquet, to_datetime
+from pandas import DataFrame, Series, concat, read_parquet, to_datetime
+from pandas.api.types import is_datetime64_any_dtype
+from pyarrow import Table, concat_tables
+from pyarrow.parquet import ParquetFile, read_table
 
 from binancebot.configuration import TimeRange
 from binancebot.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -11,9 +18,21 @@ from .idatahandler import IDataHandler
 
 logger = logging.getLogger(__name__)
 
+# Rows per row group of stored OHLCV data - loading a timerange only reads the row groups
+# covering it.
+OHLCV_ROW_GROUP_SIZE = 64 * 1024
+
 
 class ParquetDataHandler(IDataHandler):
+    """
+    Stores data as one parquet file per month, in a directory named like the data file.
+    New data is appended by rewriting only the months it covers.
+    Single parquet files (as stored by older versions) are read as well, and converted
+    to monthly files the first time data is appended.
+    """
+
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    supports_append = True
 
     def ohlcv_store(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
@@ -30,8 +49,16 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        self._store_months(filename, data.reset_index(drop=True).loc[:, self._columns], "date")
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+    def _get_ohlcv_filename(self, pair: str, timeframe: str, candle_type: CandleType) -> Path:
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+        return filename
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -48,16 +75,14 @@ class ParquetDataHandler(IDataHandler):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
-        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
+        filename = self._get_ohlcv_filename(pair, timeframe, candle_type)
         if not filename.exists():
-            # Fallback mode for 1M files
-            filename = self._pair_data_filename(
-                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
-            )
-            if not filename.exists():
-                return DataFrame(columns=self._columns)
+            return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
+            table = self._read_table(filename, "date", timerange)
+            if table is None:
+                return DataFrame(columns=self._columns)
+            pairdata = table.to_pandas()
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -76,17 +101,38 @@ class ParquetDataHandler(IDataHandler):
             )
             return DataFrame(columns=self._columns)
 
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Read from the file metadata where possible.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        filename = self._get_ohlcv_filename(pair, timeframe, candle_type)
+        return self._get_stored_range(filename, "date") or super().ohlcv_data_min_max(
+            pair, timeframe, candle_type
+        )
+
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Stored candles at or after the first date of data are replaced.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+        self._store_months(
+            filename, data.reset_index(drop=True).loc[:, self._columns], "date", append=True
+        )
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -98,35 +144,223 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_parquet(filename)
+        self._store_months(filename, data.reset_index(drop=True), "timestamp")
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
-        Append data to existing files
+        Append data to existing files.
+        Stored trades at or after the first timestamp of data are replaced.
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self.create_dir_if_needed(filename)
+        self._store_months(
+            filename,
+            data.reset_index(drop=True).loc[:, DEFAULT_TRADES_COLUMNS],
+            "timestamp",
+            append=True,
+        )
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
+        Load a pair from file
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - filters data to this range if provided
         :return: List of trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        tradesdata = read_parquet(filename)
+        table = self._read_table(filename, "timestamp", timerange)
+        if table is None:
+            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        # Reading by timerange returns complete files or row groups - filter the exact range.
+        if (time_filter := self._build_arrow_time_filter(timerange)) is not None:
+            table = table.filter(time_filter)
+        return table.to_pandas()
 
-        return tradesdata
+    def trades_data_min_max(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair's trades data.
+        Read from the file metadata where possible.
+        :param pair: Pair to get min/max for
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: (min, max, len)
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        return self._get_stored_range(filename, "timestamp") or super().trades_data_min_max(
+            pair, trading_mode
+        )
+
+    @staticmethod
+    def _get_month_files(path: Path) -> list[Path]:
+        # Files are named by month (YYYY-MM), so sorting by name sorts them by date.
+        return sorted(path.glob("*.parquet"))
+
+    @staticmethod
+    def _get_dates(data: DataFrame, date_col: str) -> Series:
+        dates = data[date_col]
+        if is_datetime64_any_dtype(dates):
+            return dates
+        # Timestamps in milliseconds
+        return to_datetime(dates.astype("int64"), unit="ms", utc=True)
+
+    def _store_months(
+        self, path: Path, data: DataFrame, date_col: str, append: bool = False
+    ) -> None:
+        """
+        Store data as one file per month in the directory path.
+        :param date_col: Column used to split data into months
+        :param append: Only replace stored data at or after the first date of data.
+            Otherwise, all stored data is replaced.
+        """
+        if append:
+            if data.empty:
+                return
+            if path.is_file():
+                # Single file stored by an older version
+                stored = read_parquet(path)
+                start = self._get_dates(data, date_col).iloc[0]
+                data = concat(
+                    [stored[self._get_dates(stored, date_col) < start], data], ignore_index=True
+                )
+                append = False
+        if path.is_file():
+            # Write the monthly files next to the file, and replace the file once complete.
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            self._write_months(tmp_path, data, date_col, append=False)
+            path.unlink()
+            tmp_path.rename(path)
+        else:
+            self._write_months(path, data, date_col, append=append)
+
+    def _write_months(self, path: Path, data: DataFrame, date_col: str, append: bool) -> None:
+        path.mkdir(exist_ok=True)
+        replaced = {f.name: f for f in self._get_month_files(path)}
+        if data.empty:
+            # Only reached when storing (not appending) - remove all stored data
+            for file in replaced.values():
+                file.unlink()
+            return
+        dates = self._get_dates(data, date_col)
+        if append:
+            first_month = f"{dates.iloc[0]:%Y-%m}.parquet"
+            if first_month in replaced:
+                # Keep the part of the first month before the appended data
+                stored = read_parquet(replaced[first_month])
+                data = concat(
+                    [stored[self._get_dates(stored, date_col) < dates.iloc[0]], data],
+                    ignore_index=True,
+                )
+                dates = self._get_dates(data, date_col)
+            replaced = {name: f for name, f in replaced.items() if name >= first_month}
+
+        for month, month_data in data.groupby(dates.dt.strftime("%Y-%m"), sort=True):
+            name = f"{month}.parquet"
+            # Files starting with "." are ignored when reading
+            tmp_file = path / f".{name}.tmp"
+            month_data.to_parquet(tmp_file, index=False, row_group_size=OHLCV_ROW_GROUP_SIZE)
+            tmp_file.replace(path / name)
+            replaced.pop(name, None)
+        for file in replaced.values():
+            file.unlink()
+
+    def _get_row_group_dates(
+        self, parquet_file: ParquetFile, date_col: str
+    ) -> list[tuple[datetime, datetime]] | None:
+        """
+        First and last date of each row group, from the row group statistics.
+        :return: None if the file has no statistics
+        """
+        metadata = parquet_file.metadata
+        date_idx = parquet_file.schema_arrow.get_field_index(date_col)
+        stats = [
+            metadata.row_group(i).column(date_idx).statistics
+            for i in range(metadata.num_row_groups)
+        ]
+        if not all(s is not None and s.has_min_max for s in stats):
+            return None
+        return [(self._chunk_date(s.min), self._chunk_date(s.max)) for s in stats]
+
+    def _read_row_groups(self, filename: Path, date_col: str, timerange: TimeRange) -> Table:
+        """
+        Read only the row groups of a parquet file covering the timerange.
+        Row groups are located by their date statistics - files without statistics
+        are read completely.
+        """
+        with ParquetFile(filename) as parquet_file:
+            dates = self._get_row_group_dates(parquet_file, date_col)
+            if dates is None:
+                return parquet_file.read()
+            row_groups = self._get_chunk_range(timerange, len(dates), dates.__getitem__)
+            return parquet_file.read_row_groups(row_groups)
+
+    def _read_table(self, path: Path, date_col: str, timerange: TimeRange | None) -> Table | None:
+        """
+        Read stored data, limited to the monthly files and row groups covering the timerange.
+        :return: None if no data is stored
+        """
+        if path.is_file():
+            if timerange:
+                return self._read_row_groups(path, date_col, timerange)
+            return read_table(path)
+
+        files = self._get_month_files(path)
+        if not files:
+            return None
+        if not timerange:
+            return concat_tables([read_table(f) for f in files], promote_options="default")
+
+        @cache
+        def get_file_dates(i: int) -> tuple[datetime, datetime]:
+            with ParquetFile(files[i]) as parquet_file:
+                dates = self._get_row_group_dates(parquet_file, date_col)
+            if dates is None:
+                raise ValueError(f"No date statistics in {files[i]}.")
+            return dates[0][0], dates[-1][1]
+
+        selected = self._get_chunk_range(timerange, len(files), get_file_dates)
+        if not selected:
+            return None
+        return concat_tables(
+            [self._read_row_groups(files[i], date_col, timerange) for i in selected],
+            promote_options="default",
+        )
+
+    def _get_stored_range(self, path: Path, date_col: str) -> tuple[datetime, datetime, int] | None:
+        """
+        First and last date and number of rows of stored data, from the file metadata.
+        :return: None if not available from the metadata
+        """
+        files = self._get_month_files(path) if path.is_dir() else [path]
+        if not files or not files[0].is_file():
+            return None
+        count = 0
+        for file in files:
+            with ParquetFile(file) as parquet_file:
+                count += parquet_file.metadata.num_rows
+        with ParquetFile(files[0]) as first, ParquetFile(files[-1]) as last:
+            first_dates = self._get_row_group_dates(first, date_col)
+            last_dates = self._get_row_group_dates(last, date_col)
+        if not first_dates or not last_dates:
+            return None
+        return (
+            first_dates[0][0].to_pydatetime(),
+            last_dates[-1][1].to_pydatetime(),
+            count,
+        )
 
     @classmethod
     def _get_file_extension(cls):
@@ -1,13 +1,17 @@
 import logging
 import operator
+import threading
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from joblib import Parallel, delayed
 from pandas import DataFrame, concat
 
 from binancebot.configuration import TimeRange
 from binancebot.constants import (
     DATETIME_PRINT_FORMAT,
+    DEFAULT_TRADES_COLUMNS,
     DL_DATA_TIMEFRAMES,
     DOCS_LINK,
     Config,
@@ -21,9 +25,10 @@ from binancebot.data.converter import (
     trades_list_to_df,
 )
 from binancebot.data.history.datahandlers import IDataHandler, get_datahandler
+from binancebot.data.history.ohlcv_resampler import OhlcvResampler
 from binancebot.enums import CandleType, TradingMode
 from binancebot.exceptions import OperationalException
-from binancebot.exchange import Exchange
+from binancebot.exchange import Exchange, timeframe_to_seconds
 from binancebot.exchange.exchange_utils import date_minus_candles
 from binancebot.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from binancebot.util import dt_now, dt_ts, format_ms_time, format_ms_time_det
@@ -46,6 +51,7 @@ def load_pair_history(
     data_format: str | None = None,
     data_handler: IDataHandler | None = None,
     candle_type: CandleType = CandleType.SPOT,
+    resampler: OhlcvResampler | None = None,
 ) -> DataFrame:
     """
     Load cached ohlcv history for the given pair.
@@ -61,6 +67,7 @@ def load_pair_history(
     :param data_handler: Initialized data-handler to use.
                          Will be initialized from data_format if not set
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param resampler: Resample candles from the resampler's base timeframe where possible
     :return: DataFrame with ohlcv data, or empty DataFrame
     """
     data_handler = get_datahandler(datadir, data_format, data_handler)
@@ -73,9 +80,38 @@ def load_pair_history(
         drop_incomplete=drop_incomplete,
         startup_candles=startup_candles,
         candle_type=candle_type,
+        resampler=resampler,
     )
 
 
+class _DeferredLogs(logging.Filter):
+    """
+    Holds back log records of the threads loading data, so they can be logged in a
+    deterministic order once all data is loaded.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._local = threading.local()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        records = getattr(self._local, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
+    def call(self, func: Callable[..., DataFrame], **kwargs) -> tuple[DataFrame, list]:
+        """
+        Call func, holding back the log records it emits.
+        """
+        self._local.records = []
+        try:
+            return func(**kwargs), self._local.records
+        finally:
+            del self._local.records
+
+
 def load_data(
     datadir: Path,
     timeframe: str,
@@ -88,6 +124,8 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    jobs: int = 1,
+    resampler: OhlcvResampler | None = None,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -101,6 +139,9 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param jobs: Number of pairs to load concurrently (threads). -1 uses all CPUs.
+        Log messages are emitted in the order of pairs, as when loading sequentially.
+    :param resampler: Resample candles from the resampler's base timeframe where possible
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -108,18 +149,44 @@ def load_data(
         logger.debug(f"Using indicator startup period: {startup_candles} ...")
 
     data_handler = get_datahandler(datadir, data_format)
-
-    for pair in pairs:
-        hist = load_pair_history(
-            pair=pair,
-            timeframe=timeframe,
-            datadir=datadir,
-            timerange=timerange,
-            fill_up_missing=fill_up_missing,
-            startup_candles=startup_candles,
-            data_handler=data_handler,
-            candle_type=candle_type,
-        )
+    load_args = {
+        "timeframe": timeframe,
+        "datadir": datadir,
+        "timerange": timerange,
+        "fill_up_missing": fill_up_missing,
+        "startup_candles": startup_candles,
+        "data_handler": data_handler,
+        "candle_type": candle_type,
+        "resampler": resampler,
+    }
+
+    if jobs != 1 and len(pairs) > 1:
+        deferred_logs = _DeferredLogs()
+        # Loggers of all modules involved in loading data
+        modules = {
+            IDataHandler.__module__,
+            type(data_handler).__module__,
+            clean_ohlcv_dataframe.__module__,
+        }
+        if resampler:
+            modules.add(type(resampler).__module__)
+        loggers = {logging.getLogger(module) for module in modules}
+        for data_logger in loggers:
+            data_logger.addFilter(deferred_logs)
+        try:
+            loaded = Parallel(n_jobs=jobs, prefer="threads")(
+                delayed(deferred_logs.call)(load_pair_history, pair=pair, **load_args)
+                for pair in pairs
+            )
+        finally:
+            for data_logger in loggers:
+                data_logger.removeFilter(deferred_logs)
+    else:
+        loaded = ((load_pair_history(pair=pair, **load_args), []) for pair in pairs)
+
+    for pair, (hist, records) in zip(pairs, loaded, strict=True):
+        for record in records:
+            logging.getLogger(record.name).handle(record)
         if not hist.empty:
             result[pair] = hist
         else:
@@ -174,6 +241,7 @@ def _load_cached_data_for_updating(
     data_handler: IDataHandler,
     candle_type: CandleType,
     prepend: bool = False,
+    tail_only: bool = False,
 ) -> tuple[DataFrame, int | None, int | None]:
     """
     Load cached data to download more data.
@@ -182,6 +250,8 @@ def _load_cached_data_for_updating(
     If that's the case then what's available should be completely overwritten.
     Otherwise downloads always start at the end of the available data to avoid data gaps.
     Note: Only used by download_pair_history().
+    :param tail_only: Only load the last complete candle of the stored data - sufficient
+        when new data is appended to the stored data.
     """
     start = None
     end = None
@@ -191,28 +261,48 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == "date":
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
-    data = data_handler.ohlcv_load(
-        pair,
-        timeframe=timeframe,
-        timerange=None,
-        fill_missing=False,
-        drop_incomplete=True,
-        warn_no_data=False,
-        candle_type=candle_type,
-    )
+    data = DataFrame()
+    if tail_only:
+        data_start, data_end, data_len = data_handler.ohlcv_data_min_max(
+            pair, timeframe, candle_type
+        )
+        if data_len:
+            # Load the last 2 candles - the last one is dropped as incomplete.
+            tail_ts = int(data_end.timestamp()) - timeframe_to_seconds(timeframe)
+            data = data_handler.ohlcv_load(
+                pair,
+                timeframe=timeframe,
+                timerange=TimeRange("date", None, tail_ts, 0),
+                fill_missing=False,
+                drop_incomplete=True,
+                warn_no_data=False,
+                candle_type=candle_type,
+            )
+    if data.empty:
+        # Intentionally don't pass timerange in - since we need to load the full dataset.
+        data = data_handler.ohlcv_load(
+            pair,
+            timeframe=timeframe,
+            timerange=None,
+            fill_missing=False,
+            drop_incomplete=True,
+            warn_no_data=False,
+            candle_type=candle_type,
+        )
+        if not data.empty:
+            data_start = data.iloc[0]["date"]
     if not data.empty:
         if prepend:
-            end = data.iloc[0]["date"]
+            end = data_start
         else:
-            if start and start < data.iloc[0]["date"]:
+            if start and start < data_start:
                 # Earlier data than existing data requested, Update start date
                 logger.info(
                     f"{pair}, {timeframe}, {candle_type}: "
                     f"Requested start date {start:{DATETIME_PRINT_FORMAT}} earlier than local "
-                    f"data start date {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}. "
+                    f"data start date {data_start:{DATETIME_PRINT_FORMAT}}. "
                     f"Use `--prepend` to download data prior "
-                    f"to {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}, or "
+                    f"to {data_start:{DATETIME_PRINT_FORMAT}}, or "
                     "`--erase` to redownload all data."
                 )
             start = data.iloc[-1]["date"]
@@ -251,6 +341,8 @@ def _download_pair_history(
     :return: bool with success state
     """
     data_handler = get_datahandler(datadir, data_handler=data_handler)
+    # Add new candles to the stored data instead of rewriting all of it.
+    append = data_handler.supports_append and not prepend
 
     try:
         if erase:
@@ -264,6 +356,7 @@ def _download_pair_history(
             data_handler=data_handler,
             candle_type=candle_type,
             prepend=prepend,
+            tail_only=append,
         )
 
         logger.info(
@@ -337,7 +430,10 @@ def _download_pair_history(
             f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
         )
 
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+        if append:
+            data_handler.ohlcv_append(pair, timeframe, data=data, candle_type=candle_type)
+        else:
+            data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
@@ -516,17 +612,34 @@ def _download_trades_history(
         if timerange.stoptype == "date":
             until = timerange.stopts * 1000
 
-    trades = data_handler.trades_load(pair, trading_mode)
+    if data_handler.supports_append:
+        # Only load the stored trades needed to continue the download - new trades are
+        # appended to the stored data.
+        first_date, last_date, trades_count = data_handler.trades_data_min_max(pair, trading_mode)
+        stored_start = first_date if trades_count else None
+        trades = (
+            data_handler.trades_load(
+                pair,
+                trading_mode,
+                timerange=TimeRange("date", None, int(last_date.timestamp()) - 5, 0),
+            )
+            if trades_count
+            else DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        )
+    else:
+        trades = data_handler.trades_load(pair, trading_mode)
+        trades_count = len(trades)
+        stored_start = trades.iloc[0]["date"] if not trades.empty else None
 
     # TradesList columns are defined in constants.DEFAULT_TRADES_COLUMNS
     # DEFAULT_TRADES_COLUMNS: 0 -> timestamp
     # DEFAULT_TRADES_COLUMNS: 1 -> id
 
-    if not trades.empty and since > 0 and (since + 1000) < trades.iloc[0]["timestamp"]:
+    if stored_start and since > 0 and (since + 1000) < dt_ts(stored_start):
         # since is before the first trade
         raise ValueError(
             f"Start {format_ms_time_det(since)} earlier than "
-            f"available data ({format_ms_time_det(trades.iloc[0]['timestamp'])}). "
+            f"available data ({format_ms_time_det(dt_ts(stored_start))}). "
             f"Please use `--erase` if you'd like to redownload {pair}."
         )
 
@@ -545,13 +658,13 @@ def _download_trades_history(
 
     logger.debug(
         "Current Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if stored_start is None else f"{stored_start:{DATETIME_PRINT_FORMAT}}",
     )
     logger.debug(
         "Current End: %s",
         "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
     )
-    logger.info(f"Current Amount of trades: {len(trades)}")
+    logger.info(f"Current Amount of trades: {trades_count}")
 
     new_trades = exchange.get_historic_trades(
         pair=pair,
@@ -560,20 +673,27 @@ def _download_trades_history(
         from_id=from_id,
     )
     new_trades_df = trades_list_to_df(new_trades[1])
+    trades_count -= len(trades)
     trades = concat([trades, new_trades_df], axis=0)
     # Remove duplicates to make sure we're not storing data we don't need
     trades = trades_df_remove_duplicates(trades)
-    data_handler.trades_store(pair, trades, trading_mode)
-
+    trades_count += len(trades)
+    if data_handler.supports_append:
+        data_handler.trades_append(pair, trades, trading_mode)
+    else:
+        data_handler.trades_store(pair, trades, trading_mode)
+
+    if stored_start is None and not trades.empty:
+        stored_start = trades.iloc[0]["date"]
     logger.debug(
         "New Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if stored_start is None else f"{stored_start:{DATETIME_PRINT_FORMAT}}",
     )
     logger.debug(
         "New End: %s",
         "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
     )
-    logger.info(f"New Amount of trades: {len(trades)}")
+    logger.info(f"New Amount of trades: {trades_count}")
     return True
 
 
@@ -684,7 +804,7 @@ def download_data_main(config: Config) -> None:
     download_data(config, exchange)
 
 
-def download_data(
+def download_data(  # noqa: C901
     config: Config,
     exchange: Exchange,
     *,
@@ -719,6 +839,10 @@ def download_data(
     expanded_pairs = dynamic_expand_pairlist(config, available_pairs)
     if "timeframes" not in config:
         config["timeframes"] = DL_DATA_TIMEFRAMES
+    if base_timeframe := config.get("ohlcv_base_timeframe"):
+        # Other timeframes are resampled from the base timeframe when loading.
+        logger.info(f"Only downloading the base timeframe {base_timeframe}.")
+        config["timeframes"] = [base_timeframe]
 
     if len(expanded_pairs) == 0:
         logger.warning(
@@ -0,0 +1,162 @@
+"""
+Candles of coarser timeframes, resampled from the stored candles of a base timeframe.
+
+With `ohlcv_base_timeframe` configured, only the base timeframe needs to be downloaded and
+stored. Resampled candles are cached in memory - and on disk if `ohlcv_resample_cache` is
+enabled - keyed by pair, timeframe, candle type, timerange and a fingerprint of the stored
+base candles.
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from copy import deepcopy
+from pathlib import Path
+from threading import Lock
+
+from pandas import DataFrame, RangeIndex
+from pandas.tseries.frequencies import to_offset
+from pyarrow import ArrowException, feather
+
+from binancebot.configuration import TimeRange
+from binancebot.constants import Config
+from binancebot.enums import CandleType
+from binancebot.exchange import timeframe_to_resample_freq, timeframe_to_seconds
+from binancebot.misc import pair_to_filename
+
+
+logger = logging.getLogger(__name__)
+
+# Number of resampled dataframes kept in memory, shared by all resamplers.
+RESAMPLE_MEMORY_CACHE_SIZE = 64
+
+_memory_cache: OrderedDict[str, DataFrame] = OrderedDict()
+_memory_cache_lock = Lock()
+
+
+class OhlcvResampler:
+    """
+    Resamples candles of coarser timeframes from the candles of the base timeframe,
+    caching the results.
+    """
+
+    def __init__(self, base_timeframe: str, cache_dir: Path | None = None) -> None:
+        self.base_timeframe = base_timeframe
+        self._cache_dir = cache_dir
+        if self._cache_dir:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Config) -> "OhlcvResampler | None":
+        """
+        Create a resampler for the configured base timeframe.
+        :return: None if no base timeframe is configured
+        """
+        base_timeframe = config.get("ohlcv_base_timeframe")
+        if not base_timeframe:
+            return None
+        cache_dir = None
+        if config.get("ohlcv_resample_cache"):
+            cache_dir = config["user_data_dir"] / "ohlcv_cache"
+        return cls(base_timeframe, cache_dir)
+
+    def can_resample(self, timeframe: str) -> bool:
+        """
+        Check if candles of timeframe can be resampled from the base timeframe - i.e. if
+        timeframe is coarser and each of its candles consists of whole base candles.
+        """
+        base_seconds = timeframe_to_seconds(self.base_timeframe)
+        timeframe_seconds = timeframe_to_seconds(timeframe)
+        if timeframe_seconds <= base_seconds:
+            return False
+        resample_interval = timeframe_to_resample_freq(timeframe)
+        if resample_interval == f"{timeframe_seconds}s":
+            return timeframe_seconds % base_seconds == 0
+        # Weekly / monthly / yearly candles start at midnight
+        return 86400 % base_seconds == 0 and to_offset(resample_interval).n == 1
+
+    @staticmethod
+    def get_base_timerange(timeframe: str, timerange: TimeRange | None) -> TimeRange | None:
+        """
+        Timerange of the base candles needed to resample the candles in timerange.
+        """
+        if not timerange or timerange.stoptype != "date":
+            return timerange
+        base_timerange = deepcopy(timerange)
+        # The last candle starting before the end of timerange needs the base candles up to
+        # its own end. Calendar months and years can be one day longer than the timeframe.
+        base_timerange.stopts += timeframe_to_seconds(timeframe) + 86400
+        return base_timerange
+
+    def get_cached(
+        self,
+        pair: str,
+        timeframe: str,
+        candle_type: CandleType,
+        timerange: TimeRange | None,
+        fingerprint: str,
+        resample: Callable[[], DataFrame],
+    ) -> DataFrame:
+        """
+        Get resampled candles from the cache, resampling them if not cached yet.
+        :param fingerprint: Fingerprint of the stored base candles
+        :param resample: Resamples the candles
+        :return: DataFrame with ohlcv data
+        """
+        timerange_key = f"{timerange.startts}_{timerange.stopts}" if timerange else "all"
+        # The fingerprint comes last - _store() replaces entries with other fingerprints.
+        key = (
+            f"{pair_to_filename(pair)}-{timeframe}-{candle_type}-{self.base_timeframe}-"
+            f"{timerange_key}-{fingerprint}"
+        )
+
+        with _memory_cache_lock:
+            if (dataframe := _memory_cache.get(key)) is not None:
+                _memory_cache.move_to_end(key)
+                return dataframe.copy()
+
+        filename = self._get_filename(key)
+        dataframe = self._load(filename)
+        if dataframe is None:
+            logger.debug(f"Resampling {pair}, {timeframe} from {self.base_timeframe} candles.")
+            dataframe = resample()
+            self._store(filename, dataframe)
+
+        with _memory_cache_lock:
+            _memory_cache[key] = dataframe
+            while len(_memory_cache) > RESAMPLE_MEMORY_CACHE_SIZE:
+                _memory_cache.popitem(last=False)
+        return dataframe.copy()
+
+    def _get_filename(self, key: str) -> Path | None:
+        if not self._cache_dir:
+            return None
+        return self._cache_dir / f"{key}.feather"
+
+    @staticmethod
+    def _load(filename: Path | None) -> DataFrame | None:
+        if not filename or not filename.is_file():
+            return None
+        try:
+            return feather.read_table(filename).to_pandas()
+        except (OSError, ArrowException) as e:
+            logger.warning(f"Could not load resampled candles from {filename}: {e}")
+            filename.unlink(missing_ok=True)
+            return None
+
+    @staticmethod
+    def _store(filename: Path | None, dataframe: DataFrame) -> None:
+        if not filename or not isinstance(dataframe.index, RangeIndex):
+            return
+        # Only keep the latest fingerprint per pair, timeframe, candle type and timerange -
+        # entries with older fingerprints are outdated.
+        prefix = filename.name.rsplit("-", 1)[0]
+        for outdated in filename.parent.glob(f"{prefix}-*.feather"):
+            outdated.unlink(missing_ok=True)
+        tmp_file = filename.with_suffix(".tmp")
+        try:
+            dataframe.to_feather(tmp_file, compression="lz4")
+            tmp_file.replace(filename)
+        except (OSError, ValueError, ArrowException) as e:
+            logger.warning(f"Could not store resampled candles in the cache: {e}")
+            tmp_file.unlink(missing_ok=True)
@@ -160,6 +160,59 @@ def _calc_drawdown_series(
     return max_drawdown_df
 
 
+def _calc_drawdown_arrays(
+    trades: pd.DataFrame, *, date_col: str, value_col: str, starting_balance: float
+) -> tuple[pd.Series, np.ndarray, dict[str, np.ndarray]]:
+    """
+    Drawdown series as numpy arrays - with a zero entry at the start, like _calc_drawdown_series.
+    :return: Tuple (dates, order, arrays) - trades[date_col], the positions of the trades sorted
+             by date and the arrays "cumulative", "high_value", "drawdown" and "drawdown_relative".
+    """
+    dates = trades[date_col]
+    values = trades[value_col].to_numpy()
+    if (
+        dates.dtype.kind != "M"
+        or dates.hasnans
+        or values.dtype.kind != "f"
+        or np.isnan(values).any()
+    ):
+        # Missing values or dates not in datetime format - use the pandas implementation
+        profit_results = trades.sort_values(date_col).reset_index(drop=True)
+        max_drawdown_df = _calc_drawdown_series(
+            profit_results,
+            date_col=date_col,
+            value_col=value_col,
+            starting_balance=starting_balance,
+        )
+        arrays = {
+            col: max_drawdown_df[col].to_numpy()
+            for col in ("cumulative", "high_value", "drawdown", "drawdown_relative")
+        }
+        return profit_results[date_col], np.arange(len(profit_results)), arrays
+
+    # Same sort as DataFrame.sort_values()
+    order = np.argsort(dates.values, kind="quicksort")
+    cumulative = np.cumsum(values[order])
+    high_value = np.maximum(0, np.maximum.accumulate(cumulative))
+    if starting_balance:
+        cumulative_balance = starting_balance + cumulative
+        max_balance = starting_balance + high_value
+        drawdown_relative = (max_balance - cumulative_balance) / max_balance
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown_relative = (high_value - cumulative) / high_value
+    arrays = {
+        col: np.concatenate(([0.0], arr))
+        for col, arr in (
+            ("cumulative", cumulative),
+            ("high_value", high_value),
+            ("drawdown", cumulative - high_value),
+            ("drawdown_relative", drawdown_relative),
+        )
+    }
+    return dates, order, arrays
+
+
 def calculate_underwater(
     trades: pd.DataFrame,
     *,
@@ -225,36 +278,37 @@ def calculate_max_drawdown(
     if len(trades) == 0:
         raise ValueError("Trade dataframe empty.")
 
-    profit_results = trades.sort_values(date_col).reset_index(drop=True)
-    max_drawdown_df = _calc_drawdown_series(
-        profit_results, date_col=date_col, value_col=value_col, starting_balance=starting_balance
+    dates, order, max_drawdown = _calc_drawdown_arrays(
+        trades, date_col=date_col, value_col=value_col, starting_balance=starting_balance
     )
-    # max_drawdown_df has an extra zero row at the start
+    # max_drawdown arrays have an extra zero entry at the start
+    high_value = max_drawdown["high_value"]
+    cumulative = max_drawdown["cumulative"]
 
     # Calculate maximum drawdown
     idxmin = (
-        max_drawdown_df["drawdown_relative"].idxmax()
+        np.nanargmax(max_drawdown["drawdown_relative"])
         if relative
-        else max_drawdown_df["drawdown"].idxmin()
+        else np.nanargmin(max_drawdown["drawdown"])
     )
-    high_idx = max_drawdown_df.iloc[: idxmin + 1]["high_value"].idxmax()
-    high_date = profit_results.at[max(high_idx - 1, 0), date_col]
-    low_date = profit_results.at[max(idxmin - 1, 0), date_col]
-    high_val = max_drawdown_df.at[high_idx, "cumulative"]
-    low_val = max_drawdown_df.at[idxmin, "cumulative"]
-    max_drawdown_rel = max_drawdown_df.at[idxmin, "drawdown_relative"]
+    high_idx = np.nanargmax(high_value[: idxmin + 1])
+    high_date = dates.iloc[order[max(high_idx - 1, 0)]]
+    low_date = dates.iloc[order[max(idxmin - 1, 0)]]
+    high_val = cumulative[high_idx]
+    low_val = cumulative[idxmin]
+    max_drawdown_rel = max_drawdown["drawdown_relative"][idxmin]
 
     # Calculate current drawdown
-    current_high_idx = max_drawdown_df["high_value"].iloc[:-1].idxmax()
-    current_high_date = profit_results.at[max(current_high_idx - 1, 0), date_col]
-    current_high_value = max_drawdown_df.iloc[-1]["high_value"]
-    current_cumulative = max_drawdown_df.iloc[-1]["cumulative"]
+    current_high_idx = np.nanargmax(high_value[:-1])
+    current_high_date = dates.iloc[order[max(current_high_idx - 1, 0)]]
+    current_high_value = high_value[-1]
+    current_cumulative = cumulative[-1]
     current_drawdown_abs = current_high_value - current_cumulative
-    current_drawdown_relative = max_drawdown_df.iloc[-1]["drawdown_relative"]
+    current_drawdown_relative = max_drawdown["drawdown_relative"][-1]
 
     return DrawDownResult(
         # Max drawdown
-        drawdown_abs=abs(max_drawdown_df.loc[idxmin, "drawdown"]),
+        drawdown_abs=abs(max_drawdown["drawdown"][idxmin]),
         high_date=high_date,
         low_date=low_date,
         high_value=high_val,
@@ -312,12 +366,13 @@ def calculate_expectancy(trades: pd.DataFrame) -> tuple[float, float]:
     expectancy_ratio = 100.0
 
     if len(trades) > 0:
-        winning_trades = trades.loc[trades["profit_abs"] > 0]
-        losing_trades = trades.loc[trades["profit_abs"] < 0]
-        profit_sum = winning_trades["profit_abs"].sum()
-        loss_sum = abs(losing_trades["profit_abs"].sum())
-        nb_win_trades = len(winning_trades)
-        nb_loss_trades = len(losing_trades)
+        profit_abs = trades["profit_abs"]
+        winning_profit = profit_abs[profit_abs > 0]
+        losing_profit = profit_abs[profit_abs < 0]
+        profit_sum = winning_profit.sum()
+        loss_sum = abs(losing_profit.sum())
+        nb_win_trades = len(winning_profit)
+        nb_loss_trades = len(losing_profit)
 
         average_win = (profit_sum / nb_win_trades) if nb_win_trades > 0 else 0
         average_loss = (loss_sum / nb_loss_trades) if nb_loss_trades > 0 else 0
@@ -348,7 +403,7 @@ def calculate_sortino(
 
     expected_returns_mean = total_profit.sum() / days_period
 
-    down_stdev = np.std(trades.loc[trades["profit_abs"] < 0, "profit_abs"] / starting_balance)
+    down_stdev = np.std(total_profit[trades["profit_abs"] < 0])
 
     if down_stdev != 0 and not np.isnan(down_stdev):
         sortino_ratio = expected_returns_mean / down_stdev * np.sqrt(365)
@@ -388,11 +443,16 @@ def calculate_sharpe(
 
 
 def calculate_calmar(
-    trades: pd.DataFrame, min_date: datetime, max_date: datetime, starting_balance: float
+    trades: pd.DataFrame,
+    min_date: datetime,
+    max_date: datetime,
+    starting_balance: float,
+    drawdown: DrawDownResult | None = None,
 ) -> float:
     """
     Calculate calmar
     :param trades: DataFrame containing trades (requires columns close_date and profit_abs)
+    :param drawdown: Max drawdown of the trades (value_col profit_abs) - calculated if not given
     :return: calmar
     """
     if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
@@ -407,9 +467,10 @@ def calculate_calmar(
 
     # calculate max drawdown
     try:
-        drawdown = calculate_max_drawdown(
-            trades, value_col="profit_abs", starting_balance=starting_balance
-        )
+        if drawdown is None:
+            drawdown = calculate_max_drawdown(
+                trades, value_col="profit_abs", starting_balance=starting_balance
+            )
         max_drawdown = drawdown.relative_account_drawdown
     except ValueError:
         max_drawdown = 0
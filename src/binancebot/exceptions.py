@@ -25,6 +25,13 @@ class DependencyException(FreqtradeException):
     """
 
 
+class BacktestPruned(FreqtradeException):
+    """
+    Backtest was aborted at a checkpoint, as its intermediate result was not good enough.
+    Only raised when hyperopt pruning is enabled.
+    """
+
+
 class PricingError(DependencyException):
     """
     Subclass of DependencyException.
@@ -2706,6 +2706,18 @@ class Exchange:
         if cache:
             if (pair, timeframe, c_type) in self._klines:
                 old = self._klines[(pair, timeframe, c_type)]
+                if not ohlcv_df.empty:
+                    # Only candles overlapping with the new candles need to be merged -
+                    # the remaining cached candles are clean already.
+                    overlap = old["date"] >= ohlcv_df["date"].iloc[0]
+                    ohlcv_df = clean_ohlcv_dataframe(
+                        concat([old[overlap], ohlcv_df], axis=0),
+                        timeframe,
+                        pair,
+                        fill_missing=False,
+                        drop_incomplete=False,
+                    )
+                    old = old[~overlap]
                 # Reassign so we return the updated, combined df
                 ohlcv_df = clean_ohlcv_dataframe(
                     concat([old, ohlcv_df], axis=0),
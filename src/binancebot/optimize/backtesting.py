@@ -5,12 +5,20 @@ This module contains the backtesting logic
 """
 
 import logging
+import sys
 from collections import defaultdict
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
 
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from joblib.externals import cloudpickle
 from numpy import isnan, nan
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, Timestamp
 
 from binancebot import constants
 from binancebot.configuration import TimeRange, validate_config_consistency
@@ -33,7 +41,7 @@ from binancebot.enums import (
     RunMode,
     TradingMode,
 )
-from binancebot.exceptions import DependencyException, OperationalException
+from binancebot.exceptions import BacktestPruned, DependencyException, OperationalException
 from binancebot.exchange import (
     amount_to_contract_precision,
     price_to_precision,
@@ -49,7 +57,18 @@ from binancebot.ft_types import (
 # from binancebot.leverage.liquidation_price import update_liquidation_prices  # Module not available
 from binancebot.mixins import LoggingMixin
 from binancebot.optimize.backtest_caching import get_strategy_run_id
+from binancebot.optimize.bt_columnar import (
+    ColumnarSliceIndex,
+    DetailColumns,
+    DetailWindow,
+    ExitScanner,
+    PairColumns,
+    PairSignalCache,
+)
+from binancebot.optimize.bt_profiler import ENGINE_STEPS, STRATEGY_CALLBACKS, BacktestProfiler
 from binancebot.optimize.bt_progress import BTProgress
+from binancebot.optimize.datastore import attach_shared, store_shared
+from binancebot.optimize.indicator_cache import IndicatorCache
 from binancebot.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -59,8 +78,8 @@ from binancebot.optimize.optimize_reports import (
 )
 from binancebot.persistence import (
     CustomDataWrapper,
+    LocalOrder,
     LocalTrade,
-    Order,
     PairLocks,
     Trade,
     disable_database_use,
@@ -72,6 +91,7 @@ from binancebot.resolvers import ExchangeResolver, StrategyResolver
 from binancebot.strategy.interface import IStrategy
 from binancebot.strategy.strategy_wrapper import strategy_safe_wrapper
 from binancebot.util import FtPrecise, dt_now
+from binancebot.util.dry_run_wallet import get_dry_run_wallet
 from binancebot.util.migrations import migrate_data
 from binancebot.wallets import Wallets
 
@@ -212,10 +232,54 @@ class Backtesting:
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
         self.dynamic_pairlist: bool = self.config.get("enable_dynamic_pairlist", False)
+        self.backtest_engine: str = self.config.get(
+            "backtest_engine", constants.BACKTEST_ENGINE_DEFAULT
+        )
+        if self.backtest_engine == "columnar" and self.dynamic_pairlist:
+            logger.warning(
+                "Columnar backtest engine does not support dynamic pairlists. "
+                "Falling back to the default backtest engine."
+            )
+            self.backtest_engine = constants.BACKTEST_ENGINE_DEFAULT
+        self.indicator_cache: IndicatorCache | None = None
+        self._init_indicator_cache()
+        # Signal independent backtest data per pair - only assigned by hyperopt, where the
+        # same candles are backtested with changing signals.
+        self.signal_cache: dict[str, PairSignalCache | None] | None = None
         migrate_data(config, self.exchange)
 
         self.init_backtest()
 
+        self.profiler: BacktestProfiler | None = None
+        self._init_profiler()
+
+    def _init_indicator_cache(self) -> None:
+        """
+        Cache populated indicators on disk if --indicator-cache is used.
+        """
+        if self.config.get("indicator_cache", constants.INDICATOR_CACHE_DEFAULT) == "none":
+            return
+        if self.config.get("AIML", {}).get("enabled", False):
+            logger.warning("Indicator cache is not supported with AIML.")
+        elif self.config.get("analyze_per_epoch", False):
+            # Indicators change with the parameters of every epoch - caching them would
+            # only add disk I/O.
+            logger.info("Indicator cache is not used with analyze_per_epoch.")
+        else:
+            self.indicator_cache = IndicatorCache(self.config)
+
+    def _init_profiler(self) -> None:
+        """
+        Profile backtest phases, engine steps and strategy callbacks if --profile is used.
+        """
+        if not self.config.get("backtest_profile", False):
+            return
+        self.profiler = BacktestProfiler()
+        self.profiler.instrument(self, ENGINE_STEPS)
+        self.profiler.instrument(self.wallets, ("update",), "wallets.")
+        for strat in self.strategylist:
+            self.profiler.instrument(strat, STRATEGY_CALLBACKS, "strategy.")
+
     def _validate_pairlists_for_backtesting(self):
         if "VolumePairList" in self.pairlists.name_list:
             raise OperationalException(
@@ -269,7 +333,7 @@ class Backtesting:
 
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
-        self.detail_data: dict[str, DataFrame] = {}
+        self.detail_data: dict[str, DetailColumns] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -317,6 +381,8 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            jobs=self.config.get("dataload_jobs", 1),
+            resampler=history.OhlcvResampler.from_config(self.config),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -346,7 +412,7 @@ class Backtesting:
         Loads backtest detail data (smaller timeframe) if necessary.
         """
         if self.timeframe_detail:
-            self.detail_data = history.load_data(
+            detail_data = history.load_data(
                 datadir=self.config["datadir"],
                 pairs=self.pairlists.whitelist,
                 timeframe=self.timeframe_detail,
@@ -355,7 +421,11 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                jobs=self.config.get("dataload_jobs", 1),
+                resampler=history.OhlcvResampler.from_config(self.config),
             )
+            # Split once into sorted columns - lookups per main candle are binary searches.
+            self.detail_data = {pair: DetailColumns(df) for pair, df in detail_data.items()}
         else:
             self.detail_data = {}
         if self.trading_mode == TradingMode.FUTURES:
@@ -373,6 +443,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.FUNDING_RATE,
+                jobs=self.config.get("dataload_jobs", 1),
             )
 
             # For simplicity, assign to CandleType.Mark (might contain index candles!)
@@ -385,6 +456,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                jobs=self.config.get("dataload_jobs", 1),
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -456,6 +528,72 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
+    def _get_pair_signals(
+        self, processed: dict[str, DataFrame], pair: str
+    ) -> DataFrame | PairSignalCache:
+        """
+        Generate signals for one pair, trim the startup period and shift the signals
+        by one candle.
+        Used by backtest() - so keep this optimized for performance.
+
+        :param processed: a processed dictionary with format {pair, data}. The pair's entry
+        gets replaced by the trimmed dataframe.
+        :return: The pair's signal cache if available (signals are spliced into the cached
+        data) - otherwise the trimmed and shifted signal dataframe.
+        """
+        pair_data = processed[pair]
+        if not pair_data.empty:
+            # Cleanup from prior runs
+            pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
+        df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
+        # Update dataprovider cache
+        self.dataprovider._set_cached_df(
+            pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+        )
+
+        pair_cache = self._get_pair_signal_cache(pair, df_analyzed)
+        if pair_cache is not None:
+            processed[pair] = pair_cache.update(df_analyzed)
+            return pair_cache
+
+        # Trim startup period from analyzed dataframe
+        df_analyzed = processed[pair] = pair_data = trim_dataframe(
+            df_analyzed, self.timerange, startup_candles=self.required_startup
+        )
+
+        # Create a copy of the dataframe before shifting, that way the entry signal/tag
+        # remains on the correct candle for callbacks.
+        df_analyzed = df_analyzed.copy()
+
+        # To avoid using data from future, we use entry/exit signals shifted
+        # from the previous candle
+        for col in HEADERS[5:]:
+            tag_col = col in ("enter_tag", "exit_tag")
+            if col in df_analyzed.columns:
+                df_analyzed[col] = (
+                    df_analyzed.loc[:, col].replace([nan], [0 if not tag_col else None]).shift(1)
+                )
+            elif not df_analyzed.empty:
+                df_analyzed[col] = 0 if not tag_col else None
+
+        return df_analyzed.drop(df_analyzed.head(1).index)
+
+    def _get_pair_signal_cache(self, pair: str, df_analyzed: DataFrame) -> PairSignalCache | None:
+        """
+        Get the signal cache for this pair - creating it on first use, and recreating it
+        if the pair's candles no longer match the cached candles.
+        Only available if a signal cache was assigned (hyperopt).
+        """
+        if self.signal_cache is None:
+            return None
+        if pair in self.signal_cache:
+            pair_cache = self.signal_cache[pair]
+            if pair_cache is None or pair_cache.matches(df_analyzed):
+                return pair_cache
+        pair_cache = PairSignalCache.create(df_analyzed, self.timerange, self.required_startup)
+        self.signal_cache[pair] = pair_cache
+        return pair_cache
+
     def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
@@ -470,49 +608,40 @@ class Backtesting:
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
-        for pair in processed.keys():
-            pair_data = processed[pair]
+        for pair in processed:
             self.check_abort()
             self.progress.increment()
-
-            if not pair_data.empty:
-                # Cleanup from prior runs
-                pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
-            df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
-            # Update dataprovider cache
-            self.dataprovider._set_cached_df(
-                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
-            )
-
-            # Trim startup period from analyzed dataframe
-            df_analyzed = processed[pair] = pair_data = trim_dataframe(
-                df_analyzed, self.timerange, startup_candles=self.required_startup
-            )
-
-            # Create a copy of the dataframe before shifting, that way the entry signal/tag
-            # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
-
-            # To avoid using data from future, we use entry/exit signals shifted
-            # from the previous candle
-            for col in HEADERS[5:]:
-                tag_col = col in ("enter_tag", "exit_tag")
-                if col in df_analyzed.columns:
-                    df_analyzed[col] = (
-                        df_analyzed.loc[:, col]
-                        .replace([nan], [0 if not tag_col else None])
-                        .shift(1)
-                    )
-                elif not df_analyzed.empty:
-                    df_analyzed[col] = 0 if not tag_col else None
-
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            df_analyzed = self._get_pair_signals(processed, pair)
+            if isinstance(df_analyzed, PairSignalCache):
+                data[pair] = df_analyzed.rows()
+                continue
 
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_ohlcv_as_columns(self, processed: dict[str, DataFrame]) -> dict[str, PairColumns]:
+        """
+        Columnar engine equivalent of _get_ohlcv_as_lists.
+        Converts processed dataframes into contiguous per-pair NumPy columns.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
+        data: dict[str, PairColumns] = {}
+        self.progress.init_step(BacktestState.CONVERT, len(processed))
+
+        for pair in processed:
+            self.check_abort()
+            self.progress.increment()
+            df_analyzed = self._get_pair_signals(processed, pair)
+            if isinstance(df_analyzed, PairSignalCache):
+                data[pair] = df_analyzed.columns
+            elif not df_analyzed.empty:
+                data[pair] = PairColumns(df_analyzed)
+        return data
+
     def _get_close_rate(
         self,
         row: tuple,
@@ -747,7 +876,7 @@ class Backtesting:
         )
 
     def _try_close_open_order(
-        self, order: Order | None, trade: LocalTrade, current_date: datetime, row: tuple
+        self, order: LocalOrder | None, trade: LocalTrade, current_date: datetime, row: tuple
     ) -> bool:
         """
         Check if an order is open and if it should've filled.
@@ -782,7 +911,7 @@ class Backtesting:
         return False
 
     def _process_exit_order(
-        self, order: Order, trade: LocalTrade, current_time: datetime, row: tuple, pair: str
+        self, order: LocalOrder, trade: LocalTrade, current_time: datetime, row: tuple, pair: str
     ):
         """
         Takes an exit order and processes it, potentially closing the trade.
@@ -898,7 +1027,7 @@ class Backtesting:
         if self.handle_similar_order(trade, close_rate, amount, trade.exit_side, exit_candle_time):
             return None
 
-        order = Order(
+        order = LocalOrder(
             id=self.order_id_counter,
             ft_trade_id=trade.id,
             order_date=exit_candle_time,
@@ -922,6 +1051,7 @@ class Backtesting:
         )
         order._trade_bt = trade
         trade.orders.append(order)
+        LocalTrade.mark_bt_trade_changed(trade)
         return trade
 
     def _check_trade_exit(
@@ -1192,7 +1322,7 @@ class Backtesting:
 
             trade.adjust_stop_loss(trade.open_rate, self.strategy.stoploss, initial=True)
 
-            order = Order(
+            order = LocalOrder(
                 id=self.order_id_counter,
                 ft_trade_id=trade.id,
                 ft_is_open=True,
@@ -1217,6 +1347,7 @@ class Backtesting:
             )
             order._trade_bt = trade
             trade.orders.append(order)
+            LocalTrade.mark_bt_trade_changed(trade)
             self._try_close_open_order(order, trade, current_time, row)
             trade.recalc_trade_from_orders()
 
@@ -1302,6 +1433,7 @@ class Backtesting:
                 self.canceled_exit_orders += 1
             # canceled orders are removed from the trade
             del trade.orders[trade.orders.index(order)]
+            LocalTrade.mark_bt_trade_changed(trade)
 
     def handle_similar_order(
         self, trade: LocalTrade, price: float, amount: float, side: str, current_time: datetime
@@ -1323,7 +1455,7 @@ class Backtesting:
         return False
 
     def check_order_cancel(
-        self, trade: LocalTrade, order: Order, current_time: datetime
+        self, trade: LocalTrade, order: LocalOrder, current_time: datetime
     ) -> bool | None:
         """
         Check if current analyzed order has to be canceled.
@@ -1345,16 +1477,18 @@ class Backtesting:
                 else:
                     # Close additional entry order
                     del trade.orders[trade.orders.index(order)]
+                    LocalTrade.mark_bt_trade_changed(trade)
                     return False
             if order.side == trade.exit_side:
                 self.timedout_exit_orders += 1
                 # Close exit order and retry exiting on next signal.
                 del trade.orders[trade.orders.index(order)]
+                LocalTrade.mark_bt_trade_changed(trade)
                 return False
         return None
 
     def check_order_replace(
-        self, trade: LocalTrade, order: Order, current_time, row: tuple
+        self, trade: LocalTrade, order: LocalOrder, current_time, row: tuple
     ) -> bool:
         """
         Check if current analyzed entry order has to be replaced and do so.
@@ -1385,6 +1519,7 @@ class Backtesting:
                 return False
             else:
                 del trade.orders[trade.orders.index(order)]
+                LocalTrade.mark_bt_trade_changed(trade)
                 if is_entry:
                     self.canceled_entry_orders += 1
                 else:
@@ -1512,26 +1647,23 @@ class Backtesting:
             return exiting_dir
         return None
 
-    def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
+    def get_detail_data(self, pair: str, row: tuple) -> DetailWindow | None:
         """
         Spread into detail data
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
-        detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
-
-        if len(detail_data) == 0:
-            return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        current_detail_ns = row[DATE_IDX].value
+        return self.detail_data[pair].window(
+            current_detail_ns,
+            current_detail_ns + self.timeframe_secs * 1_000_000_000,
+            (
+                row[LONG_IDX],
+                row[ELONG_IDX],
+                row[SHORT_IDX],
+                row[ESHORT_IDX],
+                row[ENTER_TAG_IDX],
+                row[EXIT_TAG_IDX],
+            ),
+        )
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1597,7 +1729,7 @@ class Backtesting:
             strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
                 current_time=current_time
             )
-            pair_detail_cache: dict[str, list[tuple]] = {}
+            pair_detail_cache: dict[str, DetailWindow] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
 
@@ -1677,8 +1809,331 @@ class Backtesting:
                 yield current_time_det, pair, row, is_last_row, trade_dir
             self.progress.increment()
 
+    def _get_columnar_schedule(
+        self,
+        data: dict[str, PairColumns],
+        pair_positions: dict[str, int],
+        first_ns: int,
+        end_ns: int,
+        timeframe_ns: int,
+    ) -> tuple[list[tuple[int, int, int]], np.ndarray, list[str]]:
+        """
+        Precalculate when each pair needs to be processed by the columnar engine.
+        :return: Tuple of
+            - entry candidates as (loop time, pair position, row index), sorted by processing order
+            - boolean array marking main candles on which at least one pair has data.
+            - pairs with data in the backtest range, sorted by their first processing time
+        """
+        candle_count = max((end_ns - first_ns) // timeframe_ns + 1, 0)
+        candle_has_rows = np.zeros(candle_count, dtype=bool)
+        candidate_times = [np.array([], dtype="int64")]
+        candidate_pairs = [np.array([], dtype="int64")]
+        candidate_rows = [np.array([], dtype="int64")]
+        first_processed: list[tuple[int, int, str]] = []
+        for pair, columns in data.items():
+            processed_at = columns.schedule(first_ns, timeframe_ns)
+            in_range = processed_at <= end_ns
+            candle_has_rows[(processed_at[in_range] - first_ns) // timeframe_ns] = True
+            if in_range.any():
+                first_processed.append((int(processed_at[in_range][0]), pair_positions[pair], pair))
+            rows = np.flatnonzero(columns.entry_candidates(self._can_short) & in_range)
+            candidate_times.append(processed_at[rows])
+            candidate_pairs.append(np.full(len(rows), pair_positions[pair], dtype="int64"))
+            candidate_rows.append(rows)
+
+        times = np.concatenate(candidate_times)
+        positions = np.concatenate(candidate_pairs)
+        rows = np.concatenate(candidate_rows)
+        order = np.lexsort((positions, times))
+        candidates = list(
+            zip(
+                times[order].tolist(),
+                positions[order].tolist(),
+                rows[order].tolist(),
+                strict=True,
+            )
+        )
+        return candidates, candle_has_rows, [pair for _, _, pair in sorted(first_processed)]
+
+    def _get_exit_scanner(self) -> ExitScanner | None:
+        """
+        Exit look-ahead for the columnar engine.
+        Only available if open trades can't change on a candle without a (vectorizable)
+        stoploss, ROI, trailing stop or exit signal condition - so for spot strategies without
+        custom stoploss, custom ROI, custom exit and position adjustment.
+        """
+        strategy = self.strategy
+        if (
+            self.trading_mode != TradingMode.SPOT
+            or self._position_stacking
+            or self.timeframe_detail
+            or strategy.position_adjustment_enable
+            or strategy.use_custom_stoploss
+            or strategy.use_custom_roi
+            or type(strategy).custom_exit is not IStrategy.custom_exit
+        ):
+            return None
+        return ExitScanner(
+            minimal_roi=strategy.minimal_roi,
+            stoploss=strategy.stoploss,
+            use_exit_signal=strategy.use_exit_signal,
+            trailing_stop=strategy.trailing_stop,
+            trailing_stop_positive=strategy.trailing_stop_positive,
+            trailing_stop_positive_offset=strategy.trailing_stop_positive_offset,
+            trailing_only_offset_is_reached=strategy.trailing_only_offset_is_reached,
+        )
+
+    @staticmethod
+    def _add_due_candidates(
+        pairs_to_process: dict[str, int | None],
+        pairs: list[str],
+        candidates: list[tuple[int, int, int]],
+        candidate_idx: int,
+        current_ns: int,
+    ) -> int:
+        """
+        Add entry candidates due on the current candle to pairs_to_process.
+        Pairs with open trades keep their position (and no fixed row).
+        :return: Index of the first candidate not yet due
+        """
+        while candidate_idx < len(candidates) and candidates[candidate_idx][0] <= current_ns:
+            _, pos, row_index = candidates[candidate_idx]
+            pairs_to_process.setdefault(pairs[pos], row_index)
+            candidate_idx += 1
+        return candidate_idx
+
+    def _get_open_pair_row_index(
+        self,
+        pair: str,
+        data: dict[str, PairColumns],
+        current_ns: int,
+        exit_scanner: ExitScanner | None,
+    ) -> int | None:
+        """
+        Row to process for a pair with open trades - or None if the pair has no row on this
+        candle, or the exit scanner determined that the candle can be skipped.
+        """
+        if pair not in data or (exit_scanner and exit_scanner.is_skipped(pair, current_ns)):
+            return None
+        row_index = data[pair].index_at(current_ns)
+        if row_index is not None and exit_scanner:
+            exit_scanner.resume(pair, LocalTrade.bt_trades_open_pp[pair], data[pair], row_index)
+        return row_index
+
+    def _get_next_step(
+        self,
+        step: int,
+        candidates: list[tuple[int, int, int]],
+        candidate_idx: int,
+        exit_scanner: ExitScanner | None,
+        first_ns: int,
+        timeframe_ns: int,
+    ) -> int:
+        """
+        Next loop step on which at least one pair needs to be processed - the earliest of
+        the next entry candidate and the next candle of every pair with open trades.
+        Candles in between are idle and can be skipped entirely.
+        """
+        next_step = step + 1
+        events = []
+        if candidate_idx < len(candidates):
+            events.append(candidates[candidate_idx][0])
+        for trade in LocalTrade.bt_trades_open:
+            resume_ns = exit_scanner.resume_at(trade.pair) if exit_scanner else None
+            if resume_ns is None:
+                return next_step
+            events.append(resume_ns)
+        if not events:
+            # Nothing left to process.
+            return sys.maxsize
+        return max(-(-(min(events) - first_ns) // timeframe_ns), next_step)
+
+    def _time_pair_generator_columnar(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        pairs: list[str],
+        data: dict[str, PairColumns],
+    ):
+        """
+        Backtest time and pair generator for the columnar engine.
+        Equivalent to time_pair_generator(), but only yields pairs which have an entry
+        candidate or an open trade on the current candle. All other pairs can't act on
+        this candle, so their rows are never materialized.
+        Candles on which no pair needs to be processed are skipped entirely - unless the
+        strategy implements bot_loop_start, which is called for every candle.
+        :returns: generator of (current_time, pair, row, is_last_row, trade_dir)
+            where is_last_row is a boolean indicating if this is the data end date.
+        """
+        self.progress.init_step(
+            BacktestState.BACKTEST, int((end_date - start_date) / self.timeframe_td)
+        )
+        timeframe_ns = self.timeframe_secs * 1_000_000_000
+        first_ns = Timestamp(start_date + self.timeframe_td).value
+        end_ns = Timestamp(end_date).value
+        pair_positions = {pair: i for i, pair in enumerate(pairs)}
+        candidates, candle_has_rows, pairs_in_range = self._get_columnar_schedule(
+            data, pair_positions, first_ns, end_ns, timeframe_ns
+        )
+        candidate_idx = 0
+        # The list-based engine adds pairs to bt_trades_open_pp when they are first processed.
+        # Register them in the same order, as trades left open are force-exited in this order.
+        LocalTrade.bt_trades_open_pp.update(
+            {pair: LocalTrade.bt_trades_open_pp[pair] for pair in pairs_in_range}
+        )
+
+        slice_index = ColumnarSliceIndex(data, pairs, self.required_startup, timeframe_ns)
+        self.dataprovider._set_dataframe_max_index_resolver(slice_index)
+        exit_scanner = self._get_exit_scanner()
+        last_rows = {pair: columns.processed_until(end_ns) - 1 for pair, columns in data.items()}
+        skip_idle = type(self.strategy).bot_loop_start is IStrategy.bot_loop_start
+        step_count = len(candle_has_rows)
+
+        step = 0
+        while step < step_count:
+            # Loop for each main candle with activity.
+            self.check_abort()
+            current_ns = first_ns + step * timeframe_ns
+            current_time = start_date + self.timeframe_td * (step + 1)
+
+            # Pairs that have open trades should be processed first
+            open_pairs = list(dict.fromkeys(t.pair for t in LocalTrade.bt_trades_open))
+            slice_index.start_candle(current_ns, open_pairs)
+
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=current_time
+            )
+            if candle_has_rows[step]:
+                self.dataprovider._set_dataframe_max_date(current_time)
+
+            pair_detail_cache: dict[str, DetailWindow] = {}
+            pair_tradedir_cache: dict[str, LongShort | None] = {}
+            pairs_with_open_trades = list(open_pairs)
+
+            pairs_to_process: dict[str, int | None] = dict.fromkeys(open_pairs)
+            candidate_idx = self._add_due_candidates(
+                pairs_to_process, pairs, candidates, candidate_idx, current_ns
+            )
+
+            for pair, row_index in pairs_to_process.items():
+                slice_index.set_pair(pair)
+                if row_index is None:
+                    # Pair with open trade
+                    row_index = self._get_open_pair_row_index(pair, data, current_ns, exit_scanner)
+                    if row_index is None:
+                        continue
+
+                row = data[pair][row_index]
+                trade_dir = self.check_for_trade_entry(row)
+                pair_tradedir_cache[pair] = trade_dir
+
+                pair_has_open_trades = len(LocalTrade.bt_trades_open_pp[pair]) > 0
+                if pair in pairs_with_open_trades and not pair_has_open_trades:
+                    # Pair has had open trades which closed in the current main candle.
+                    continue
+                if pair_has_open_trades and pair not in pairs_with_open_trades:
+                    pairs_with_open_trades.append(pair)
+
+                if (
+                    (trade_dir is not None or pair_has_open_trades)
+                    and self.timeframe_detail_td
+                    and pair in self.detail_data
+                ):
+                    # Spread candle into detail timeframe and cache that.
+                    pair_detail = self.get_detail_data(pair, row)
+                    if pair_detail is not None:
+                        pair_detail_cache[pair] = pair_detail
+                        row = pair_detail[0]
+
+                yield current_time, pair, row, current_time == end_date, trade_dir
+
+                if exit_scanner:
+                    exit_scanner.schedule(
+                        pair,
+                        LocalTrade.bt_trades_open_pp[pair],
+                        data[pair],
+                        row_index,
+                        last_rows[pair],
+                    )
+
+            slice_index.finish_candle()
+
+            if pair_detail_cache:
+                yield from self._detail_pair_generator_columnar(
+                    current_time,
+                    end_date,
+                    pair_positions,
+                    pair_detail_cache,
+                    pair_tradedir_cache,
+                    pairs_with_open_trades,
+                )
+            step = (
+                self._get_next_step(
+                    step, candidates, candidate_idx, exit_scanner, first_ns, timeframe_ns
+                )
+                if skip_idle
+                else step + 1
+            )
+            self.progress.set_new_value(min(step, step_count))
+
+    def _detail_pair_generator_columnar(
+        self,
+        current_time: datetime,
+        end_date: datetime,
+        pair_positions: dict[str, int],
+        pair_detail_cache: dict[str, DetailWindow],
+        pair_tradedir_cache: dict[str, LongShort | None],
+        pairs_with_open_trades: list[str],
+    ):
+        """
+        Loop the detail candles of one main candle - only for pairs with detail data.
+        """
+        for current_time_det, _, _, idx in self._time_generator_det(
+            current_time, current_time + self.timeframe_td
+        ):
+            if idx == 0:
+                # The main candle has already been processed.
+                continue
+            # Pairs that have open trades should be processed first
+            new_pairlist = list(
+                dict.fromkeys(
+                    [t.pair for t in LocalTrade.bt_trades_open if t.pair in pair_detail_cache]
+                    + sorted(pair_detail_cache, key=lambda p: pair_positions.get(p, len(p)))
+                )
+            )
+            for pair in new_pairlist:
+                detail_data = pair_detail_cache[pair]
+                if len(detail_data) <= idx:
+                    continue
+                row = detail_data[idx]
+                trade_dir = pair_tradedir_cache.get(pair)
+
+                if self.strategy.ignore_expired_candle(
+                    current_time - self.timeframe_td,  # last closed candle is 1 timeframe away.
+                    current_time_det,
+                    self.timeframe_secs,
+                    trade_dir is not None,
+                ):
+                    # Ignore late entries eventually
+                    trade_dir = None
+
+                self.dataprovider._set_dataframe_max_date(current_time_det)
+
+                pair_has_open_trades = len(LocalTrade.bt_trades_open_pp[pair]) > 0
+                if pair in pairs_with_open_trades and not pair_has_open_trades:
+                    continue
+                if pair_has_open_trades and pair not in pairs_with_open_trades:
+                    pairs_with_open_trades.append(pair)
+
+                yield current_time_det, pair, row, current_time_det == end_date, trade_dir
+
     def backtest(
-        self, processed: dict, start_date: datetime, end_date: datetime
+        self,
+        processed: dict,
+        start_date: datetime,
+        end_date: datetime,
+        checkpoints: list[datetime] | None = None,
+        on_checkpoint: Callable[[int, dict[str, Any]], bool] | None = None,
     ) -> BacktestContentTypeIcomplete:
         """
         Implement backtesting functionality
@@ -1691,35 +2146,28 @@ class Backtesting:
         optimize memory usage!
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
+        :param checkpoints: Sorted dates at which on_checkpoint is called
+        :param on_checkpoint: Called with the checkpoint index and the intermediate metrics
+            (see _get_checkpoint_metrics()). Returning True aborts the backtest.
+        :raises BacktestPruned: if on_checkpoint aborted the backtest
         :return: DataFrame with trades (results of backtesting)
         """
         self.reset_backtest(self.enable_protections)
         # Ensure wallets are up-to-date (important for --strategy-list)
         self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
-
-        # Loop timerange and get candle for each pair at that point in time
-        for (
-            current_time,
-            pair,
-            row,
-            is_last_row,
-            trade_dir,
-        ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
-            if not self._can_short or trade_dir is None:
-                # No need to reverse position if shorting is disabled or there's no new signal
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-            else:
-                # Conditionally call backtest_loop a 2nd time if shorting is enabled,
-                # a position closed and a new signal in the other direction is available.
+        if self.backtest_engine == "columnar":
+            data: dict = self._get_ohlcv_as_columns(processed)
+            pair_generator = self._time_pair_generator_columnar
+        else:
+            # Use dict of lists with data for performance
+            # (looping lists is a lot faster than pandas DataFrames)
+            data = self._get_ohlcv_as_lists(processed)
+            pair_generator = self.time_pair_generator
 
-                for _ in (0, 1):
-                    a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-                    if not a or a == trade_dir:
-                        # the trade didn't close or position change is in the same direction
-                        break
+        generator = pair_generator(start_date, end_date, list(data.keys()), data)
+        if checkpoints and on_checkpoint:
+            generator = self._checkpoint_generator(generator, checkpoints, on_checkpoint)
+        self._backtest_main_loop(generator)
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
@@ -1738,6 +2186,71 @@ class Backtesting:
             "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
         }
 
+    def _checkpoint_generator(
+        self,
+        pair_generator,
+        checkpoints: list[datetime],
+        on_checkpoint: Callable[[int, dict[str, Any]], bool],
+    ):
+        """
+        Pass through pair_generator, calling on_checkpoint once the backtest reaches a checkpoint.
+        :raises BacktestPruned: if on_checkpoint returns True
+        """
+        step = 0
+        for item in pair_generator:
+            current_time = item[0]
+            while step < len(checkpoints) and current_time >= checkpoints[step]:
+                if on_checkpoint(step, self._get_checkpoint_metrics(current_time)):
+                    raise BacktestPruned(f"Backtest pruned at {current_time}.")
+                step += 1
+            yield item
+
+    def _get_checkpoint_metrics(self, current_time: datetime) -> dict[str, Any]:
+        """
+        Intermediate metrics of the running backtest, based on the trades closed so far.
+        """
+        starting_balance = get_dry_run_wallet(self.config)
+        profits = np.fromiter(
+            (trade.close_profit_abs for trade in LocalTrade.bt_trades), dtype=float
+        )
+        balance = starting_balance + np.concatenate(([0.0], np.cumsum(profits)))
+        high = np.maximum.accumulate(balance)
+        return {
+            "current_time": current_time,
+            "total_trades": len(profits),
+            "profit_total": LocalTrade.bt_total_profit / starting_balance,
+            "profit_total_abs": LocalTrade.bt_total_profit,
+            "max_drawdown_account": float(np.max((high - balance) / high)),
+        }
+
+    def _backtest_main_loop(self, pair_generator) -> None:
+        """
+        Loop timerange and get candle for each pair at that point in time
+        :param pair_generator: generator of (current_time, pair, row, is_last_row, trade_dir)
+        """
+        for current_time, pair, row, is_last_row, trade_dir in pair_generator:
+            if not self._can_short or trade_dir is None:
+                # No need to reverse position if shorting is disabled or there's no new signal
+                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+            else:
+                # Conditionally call backtest_loop a 2nd time if shorting is enabled,
+                # a position closed and a new signal in the other direction is available.
+
+                for _ in (0, 1):
+                    a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                    if not a or a == trade_dir:
+                        # the trade didn't close or position change is in the same direction
+                        break
+
+    def advise_all_indicators(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Populate indicators of the current strategy for all pairs.
+        Uses the indicator cache if enabled.
+        """
+        if self.indicator_cache:
+            return self.indicator_cache.advise_all_indicators(self.strategy, data)
+        return self.strategy.advise_all_indicators(data)
+
     def backtest_one_strategy(
         self, strat: IStrategy, data: dict[str, DataFrame], timerange: TimeRange
     ):
@@ -1746,9 +2259,11 @@ class Backtesting:
         logger.info(f"Running backtesting for Strategy {strategy_name}")
         backtest_start_time = dt_now()
         self._set_strategy(strat)
+        # Rejected signals are reported per strategy.
+        self.rejected_dict = {}
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -1795,6 +2310,83 @@ class Backtesting:
 
         return min_date, max_date
 
+    def _use_parallel_strategies(self) -> bool:
+        """
+        Check if --strategy-list should be backtested in parallel worker processes.
+        """
+        if self.config.get("backtest_jobs", 1) == 1 or self.profiler:
+            return False
+        if self.config.get("AIML", {}).get("enabled", False) or self.dynamic_pairlist:
+            logger.warning(
+                "Parallel backtesting is not supported with AIML or dynamic pairlists. "
+                "Backtesting strategies sequentially."
+            )
+            return False
+        return True
+
+    def _backtest_strategies_parallel(
+        self, strategies: list[IStrategy], data: dict[str, DataFrame], timerange: TimeRange
+    ) -> tuple[datetime, datetime]:
+        """
+        Backtest multiple strategies in worker processes.
+        Candle data is published once to a memory-mapped store shared by all workers.
+        Results are merged into all_bt_content and analysis_results.
+        :return: min_date, max_date of the last strategy
+        """
+        jobs = min(effective_n_jobs(self.config["backtest_jobs"]), len(strategies))
+        logger.info(f"Backtesting {len(strategies)} strategies using {jobs} worker processes.")
+        self.progress.init_step(BacktestState.BACKTEST, len(strategies))
+
+        with TemporaryDirectory(prefix="bt_", ignore_cleanup_errors=True) as tmpdir:
+            data_file = Path(tmpdir) / "backtest_data.pkl"
+            store_shared({"data": data, "detail_data": self.detail_data}, data_file)
+            payload = self._get_worker_payload(strategies)
+            results = Parallel(n_jobs=jobs, return_as="generator")(
+                delayed(_backtest_strategy_worker)(
+                    payload, data_file, strat.get_strategy_name(), timerange
+                )
+                for strat in strategies
+            )
+            for res in results:
+                strategy_name = res["strategy_name"]
+                self.all_bt_content[strategy_name] = res["bt_content"]
+                for key, value in res["analysis_results"].items():
+                    self.analysis_results[key][strategy_name] = value
+                self.progress.increment()
+        return res["min_date"], res["max_date"]
+
+    def _get_worker_payload(self, strategies: list[IStrategy]) -> bytes:
+        """
+        Pickle this backtesting instance for worker processes.
+        Exchange connections can't be pickled and aren't needed while backtesting -
+        they're detached while pickling. Candle data is shared separately.
+        """
+        for strat in strategies:
+            self._register_pickle_by_value(strat.__class__.__bases__)
+        detached = ("_api", "_api_async", "_ws_async", "loop", "_loop_lock", "_cache_lock")
+        exchange_state = {attr: getattr(self.exchange, attr, None) for attr in detached}
+        detail_data = self.detail_data
+        try:
+            for attr in detached:
+                setattr(self.exchange, attr, None)
+            self.detail_data = {}
+            return cloudpickle.dumps(self)
+        finally:
+            for attr, value in exchange_state.items():
+                setattr(self.exchange, attr, value)
+            self.detail_data = detail_data
+
+    def _register_pickle_by_value(self, bases: tuple[type, ...]) -> None:
+        """
+        Allow strategy inheritance across files in worker processes by pickling
+        the modules of imported base classes as value.
+        """
+        for base in bases:
+            if base.__name__ != "IStrategy":
+                if mod := sys.modules.get(base.__module__):
+                    cloudpickle.register_pickle_by_value(mod)
+                self._register_pickle_by_value(base.__bases__)
+
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
         backtest_cache_age = self.config.get("backtest_cache", constants.BACKTEST_CACHE_DEFAULT)
@@ -1833,12 +2425,19 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        if len(strategies) > 1 and self._use_parallel_strategies():
+            min_date, max_date = self._backtest_strategies_parallel(strategies, data, timerange)
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_bt_content) > 0:
@@ -1883,3 +2482,38 @@ class Backtesting:
         if len(self.strategylist) > 0:
             # Show backtest results
             show_backtest_results(self.config, self.results)
+
+        if self.profiler:
+            self.profiler.show()
+            self.profiler.store(
+                self.config["exportdirectory"], datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            )
+
+
+def _backtest_strategy_worker(
+    payload: bytes, data_file: Path, strategy_name: str, timerange: TimeRange
+) -> dict[str, Any]:
+    """
+    Backtest one strategy of a --strategy-list in a worker process.
+    :param payload: Pickled Backtesting instance - see Backtesting._get_worker_payload()
+    :param data_file: Shared candle data - see Backtesting._backtest_strategies_parallel()
+    :param strategy_name: Strategy to backtest
+    :param timerange: Timerange to backtest
+    :return: Backtest results and analysis results of the strategy, and the backtested dates
+    """
+    backtesting: Backtesting = cloudpickle.loads(payload)
+    shared = attach_shared(data_file)
+    backtesting.detail_data = shared["detail_data"]
+    strat = next(s for s in backtesting.strategylist if s.get_strategy_name() == strategy_name)
+    min_date, max_date = backtesting.backtest_one_strategy(strat, dict(shared["data"]), timerange)
+    return {
+        "strategy_name": strategy_name,
+        "bt_content": backtesting.all_bt_content[strategy_name],
+        "analysis_results": {
+            key: value[strategy_name]
+            for key, value in backtesting.analysis_results.items()
+            if strategy_name in value
+        },
+        "min_date": min_date,
+        "max_date": max_date,
+    }
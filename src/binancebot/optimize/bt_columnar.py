@@ -0,0 +1,515 @@
+"""
+Columnar (struct-of-arrays) candle storage used by backtesting.
+"""
+
+import hashlib
+import logging
+from math import inf
+
+import numpy as np
+from ccxt import DECIMAL_PLACES, TICK_SIZE
+from pandas import DataFrame, Timestamp, isna
+
+from binancebot.data.converter import trim_dataframe
+from binancebot.persistence import LocalTrade
+
+
+logger = logging.getLogger(__name__)
+
+# Numeric columns, in the order they appear in backtest rows (after the date column).
+PRICE_SIGNAL_COLUMNS = [
+    "open",
+    "high",
+    "low",
+    "close",
+    "enter_long",
+    "exit_long",
+    "enter_short",
+    "exit_short",
+]
+SIGNAL_COLUMNS = PRICE_SIGNAL_COLUMNS[4:]
+TAG_COLUMNS = ["enter_tag", "exit_tag"]
+
+
+class PairColumns:
+    """
+    Backtest candles of one pair, stored as contiguous NumPy columns.
+
+    Rows are only materialized (as tuples matching `HEADERS` in backtesting) for candles
+    the engine actually processes - so the memory footprint stays at a few bytes per value
+    instead of one python object per value.
+    """
+
+    __slots__ = ("_consumed", "_hint", "dates", "enter_tag", "exit_tag", "tz", "values")
+
+    def __init__(self, df: DataFrame) -> None:
+        self.tz = df["date"].dt.tz
+        self.dates: np.ndarray = df["date"].values.astype("datetime64[ns]").view("int64")
+        # Shape (8, n) - every column is a contiguous block of memory.
+        # Missing signal columns are treated as "no signal".
+        self.values: np.ndarray = np.zeros((len(PRICE_SIGNAL_COLUMNS), len(df)), dtype="float64")
+        for i, col in enumerate(PRICE_SIGNAL_COLUMNS):
+            if col in df.columns:
+                self.values[i] = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        self.enter_tag: np.ndarray = (
+            df["enter_tag"].to_numpy(dtype=object)
+            if "enter_tag" in df.columns
+            else np.full(len(df), None, dtype=object)
+        )
+        self.exit_tag: np.ndarray = (
+            df["exit_tag"].to_numpy(dtype=object)
+            if "exit_tag" in df.columns
+            else np.full(len(df), None, dtype=object)
+        )
+        self._consumed: np.ndarray = self.dates
+        self._hint = 0
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, idx: int) -> tuple:
+        """
+        Materialize one row - equivalent to the row of the list-based engine.
+        """
+        return (
+            Timestamp(self.dates[idx], tz=self.tz),
+            *self.values[:, idx].tolist(),
+            self.enter_tag[idx],
+            self.exit_tag[idx],
+        )
+
+    def entry_candidates(self, can_short: bool) -> np.ndarray:
+        """
+        Vectorized equivalent of `Backtesting.check_for_trade_entry()`.
+        :return: Boolean mask of candles which yield an entry direction.
+        """
+        enter_long = self.values[4] == 1
+        exit_long = self.values[5] == 1
+        enter_short = (self.values[6] == 1) & can_short
+        exit_short = (self.values[7] == 1) & can_short
+        long = enter_long & ~(exit_long | enter_short)
+        short = enter_short & ~(exit_short | enter_long)
+        return long | short
+
+    def schedule(self, first_ns: int, timeframe_ns: int) -> np.ndarray:
+        """
+        Calculate the loop time at which each row will be processed.
+        Mirrors the row pointer of the list-based engine: a row is processed on the first
+        loop step at or after its date, and never earlier than one step after the prior row.
+        :param first_ns: First loop timestamp (ns)
+        :param timeframe_ns: Loop step (ns)
+        """
+        steps = np.maximum(-(-(self.dates - first_ns) // timeframe_ns), 0)
+        offsets = np.arange(len(self.dates), dtype="int64")
+        self._consumed = (np.maximum.accumulate(steps - offsets) + offsets) * timeframe_ns
+        self._consumed += first_ns
+        self._hint = 0
+        return self._consumed
+
+    def index_at(self, current_ns: int) -> int | None:
+        """
+        Row processed at the given loop time - or None if there is no such row.
+        """
+        consumed = self._consumed
+        hint = self._hint
+        if hint >= len(consumed) or consumed[hint] != current_ns:
+            hint = int(np.searchsorted(consumed, current_ns))
+            if hint >= len(consumed) or consumed[hint] != current_ns:
+                return None
+        self._hint = hint + 1
+        return hint
+
+    def processed_until(self, current_ns: int) -> int:
+        """
+        Number of rows processed up to (and including) the given loop time.
+        """
+        return int(np.searchsorted(self._consumed, current_ns, side="right"))
+
+
+def fill_signals(df: DataFrame, start: int, end: int, out: np.ndarray) -> list[np.ndarray]:
+    """
+    Extract the signals of rows [start, end) of an analyzed dataframe.
+    Missing values are replaced the same way backtesting does (0 for signals, None for tags).
+    :param out: Array of shape (4, end - start) receiving the signal columns
+    :return: Enter and exit tag arrays
+    """
+    out.fill(0)
+    for i, col in enumerate(SIGNAL_COLUMNS):
+        if col in df.columns:
+            values = df[col].iloc[start:end].to_numpy(dtype="float64", na_value=np.nan)
+            np.copyto(out[i], values, where=~np.isnan(values))
+    tags = []
+    for col in TAG_COLUMNS:
+        tag = np.full(end - start, None, dtype=object)
+        if col in df.columns:
+            values = df[col].iloc[start:end].to_numpy(dtype=object)
+            np.copyto(tag, values, where=~isna(values))
+        tags.append(tag)
+    return tags
+
+
+class PairSignalCache:
+    """
+    Signal independent part of one pair's backtest data (dates and OHLC after trimming
+    and shifting).
+    Reused while only the signals change between runs (hyperopt epochs) - so only the
+    signal columns are recalculated and spliced into the cached data.
+    Keyed on a fingerprint of the candles - so it's only reused for identical candles.
+    """
+
+    __slots__ = ("_ohlcv_lists", "columns", "end", "fingerprint", "length", "start")
+
+    def __init__(self, df: DataFrame, start: int, end: int) -> None:
+        """
+        :param df: Analyzed dataframe
+        :param start: First row kept after trimming the startup period
+        :param end: End (exclusive) of the rows kept after trimming
+        """
+        self.length = len(df)
+        self.fingerprint = PairSignalCache.get_fingerprint(df)
+        self.start = start
+        self.end = end
+        # Signals are shifted by one candle - so the first trimmed row is dropped.
+        self.columns = PairColumns(
+            df.iloc[start + 1 : end][["date", "open", "high", "low", "close"]]
+        )
+        self._ohlcv_lists: list[list] | None = None
+
+    @staticmethod
+    def create(df: DataFrame, timerange, startup_candles: int) -> "PairSignalCache | None":
+        """
+        Create the cache for one pair - returns None if the pair can't be cached.
+        """
+        positions = trim_dataframe(
+            df[["date"]].reset_index(drop=True), timerange, startup_candles=startup_candles
+        ).index
+        if len(positions) < 2 or positions[-1] - positions[0] + 1 != len(positions):
+            return None
+        return PairSignalCache(df, int(positions[0]), int(positions[-1]) + 1)
+
+    @staticmethod
+    def get_fingerprint(df: DataFrame) -> tuple[int, int, int, str]:
+        """
+        Fingerprint of the candles of a dataframe - length, first and last date and a hash
+        of the date and OHLC columns.
+        """
+        dates = df["date"].values.astype("datetime64[ns]").view("int64")
+        digest = hashlib.sha1(np.ascontiguousarray(dates), usedforsecurity=False)
+        for col in PRICE_SIGNAL_COLUMNS[:4]:
+            digest.update(np.ascontiguousarray(df[col].to_numpy(dtype="float64", na_value=np.nan)))
+        if len(dates) == 0:
+            return 0, 0, 0, digest.hexdigest()
+        return len(dates), int(dates[0]), int(dates[-1]), digest.hexdigest()
+
+    def matches(self, df: DataFrame) -> bool:
+        """
+        Check if the dataframe has the candles this cache was created from.
+        """
+        return len(df) == self.length and PairSignalCache.get_fingerprint(df) == self.fingerprint
+
+    def update(self, df: DataFrame) -> DataFrame:
+        """
+        Splice the signals of the analyzed dataframe into the cached data.
+        :param df: Analyzed dataframe - must have the same candles the cache was created from.
+        :return: Trimmed analyzed dataframe
+        """
+        columns = self.columns
+        columns.enter_tag, columns.exit_tag = fill_signals(
+            df, self.start, self.end - 1, columns.values[4:]
+        )
+        return df.iloc[self.start : self.end]
+
+    def rows(self) -> list[tuple]:
+        """
+        Backtest rows (matching `HEADERS` in backtesting) including the current signals.
+        """
+        if self._ohlcv_lists is None:
+            columns = self.columns
+            self._ohlcv_lists = [
+                [Timestamp(d, tz=columns.tz) for d in columns.dates],
+                *columns.values[:4].tolist(),
+            ]
+        return list(
+            zip(
+                *self._ohlcv_lists,
+                *self.columns.values[4:].tolist(),
+                self.columns.enter_tag.tolist(),
+                self.columns.exit_tag.tolist(),
+                strict=True,
+            )
+        )
+
+
+class DetailColumns:
+    """
+    Detail timeframe candles of one pair, split once at load time.
+
+    Dates are kept sorted, so the detail candles of one main candle are located with two
+    binary searches and handed out as views into the underlying arrays.
+    """
+
+    __slots__ = ("dates", "ohlc", "tz")
+
+    def __init__(self, df: DataFrame) -> None:
+        self.tz = df["date"].dt.tz
+        self.dates: np.ndarray = df["date"].values.astype("datetime64[ns]").view("int64")
+        # Shape (n, 4) - the OHLC values of one candle are contiguous.
+        self.ohlc: np.ndarray = np.ascontiguousarray(
+            df[["open", "high", "low", "close"]].to_numpy(dtype="float64", na_value=np.nan)
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def window(self, start_ns: int, end_ns: int, signals: tuple) -> "DetailWindow | None":
+        """
+        Detail candles within [start_ns, end_ns) - or None if there are none.
+        :param signals: Signal and tag values of the main candle, appended to every row.
+        """
+        start, end = np.searchsorted(self.dates, (start_ns, end_ns))
+        if start == end:
+            return None
+        return DetailWindow(self.dates[start:end], self.ohlc[start:end], self.tz, signals)
+
+
+class DetailWindow:
+    """
+    Zero-copy view on the detail candles of one main candle.
+    Rows (matching `HEADERS` in backtesting) are materialized on access only.
+    """
+
+    __slots__ = ("dates", "ohlc", "signals", "tz")
+
+    def __init__(self, dates: np.ndarray, ohlc: np.ndarray, tz, signals: tuple) -> None:
+        self.dates = dates
+        self.ohlc = ohlc
+        self.tz = tz
+        self.signals = signals
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, idx: int) -> tuple:
+        return (Timestamp(self.dates[idx], tz=self.tz), *self.ohlc[idx].tolist(), *self.signals)
+
+
+class ExitScanner:
+    """
+    Vectorized look-ahead for open trades of strategies without exit related callbacks.
+
+    After a trade was processed on a candle, the following candles of the pair are scanned
+    in one pass for the first candle on which the trade could change - exit signal,
+    stoploss, ROI or a trailing stoploss adjustment. The engine skips the candles
+    in between, as processing them would not change anything but the trade's min / max rate.
+
+    Conditions are evaluated conservatively (with a safety margin), the candle found is
+    processed by the regular backtesting logic, which takes the actual decision.
+    """
+
+    # Safety margin for profit ratios (backtesting rounds them to 8 decimals).
+    PROFIT_MARGIN = 1e-6
+    # Maximum number of candles scanned at once.
+    WINDOW = 256
+
+    def __init__(
+        self,
+        minimal_roi: dict,
+        stoploss: float,
+        use_exit_signal: bool,
+        trailing_stop: bool,
+        trailing_stop_positive: float | None,
+        trailing_stop_positive_offset: float,
+        trailing_only_offset_is_reached: bool,
+    ) -> None:
+        roi = sorted((float(k), float(v)) for k, v in minimal_roi.items())
+        self._roi_durations = np.array([k for k, _ in roi], dtype="float64")
+        self._roi_values = np.array([v for _, v in roi], dtype="float64")
+        self._stoploss = abs(stoploss)
+        self._use_exit_signal = use_exit_signal
+        self._trailing_stop = trailing_stop
+        self._trailing_positive = trailing_stop_positive
+        self._trailing_offset = trailing_stop_positive_offset
+        self._trailing_only_offset = trailing_only_offset_is_reached
+        # pair -> (loop time the pair is processed again, last processed row)
+        self._resume: dict[str, tuple[int, int]] = {}
+
+    def is_skipped(self, pair: str, current_ns: int) -> bool:
+        """
+        Pair doesn't need to be processed at the given loop time.
+        """
+        resume = self._resume.get(pair)
+        return resume is not None and resume[0] > current_ns
+
+    def resume_at(self, pair: str) -> int | None:
+        """
+        Loop time at which the pair needs to be processed again - or None if it isn't skipped.
+        """
+        resume = self._resume.get(pair)
+        return resume[0] if resume is not None else None
+
+    def resume(
+        self, pair: str, trades: list[LocalTrade], columns: PairColumns, row_index: int
+    ) -> None:
+        """
+        Catch up on the skipped candles before the pair is processed again.
+        :param trades: Open trades of the pair
+        """
+        resume = self._resume.pop(pair, None)
+        if resume is not None and row_index > resume[1] + 1:
+            for trade in trades:
+                trade.adjust_min_max_rates(
+                    float(columns.values[1, resume[1] + 1 : row_index].max()),
+                    float(columns.values[2, resume[1] + 1 : row_index].min()),
+                )
+
+    def schedule(
+        self,
+        pair: str,
+        trades: list[LocalTrade],
+        columns: PairColumns,
+        row_index: int,
+        last_row: int,
+    ) -> None:
+        """
+        Scan ahead after the pair was processed on row_index.
+        Only a single (long) trade with an open position and without open orders can be
+        scanned - otherwise the pair is processed on the next candle as usual.
+        :param trades: Open trades of the pair
+        :param last_row: Last row of the pair within the backtest timerange
+        """
+        if len(trades) != 1:
+            return
+        trade = trades[0]
+        if (
+            not trade.has_open_position
+            or trade.has_open_orders
+            or trade.is_short
+            or not trade.open_trade_value
+        ):
+            return
+        start = row_index + 1
+        stop = min(start + self.WINDOW, last_row + 1)
+        if stop - start < 2:
+            return
+        found = np.flatnonzero(self._may_change(trade, columns, start, stop))
+        next_row = min(start + int(found[0]) if len(found) else stop, last_row)
+        if next_row > start:
+            self._resume[pair] = (int(columns._consumed[next_row]), row_index)
+
+    def _may_change(
+        self, trade: LocalTrade, columns: PairColumns, start: int, stop: int
+    ) -> np.ndarray:
+        """
+        Boolean mask of candles which may change the (long) trade.
+        """
+        high = columns.values[1, start:stop]
+        low = columns.values[2, start:stop]
+        stop_loss = trade.stop_loss
+        result = low <= stop_loss
+        if self._use_exit_signal:
+            result |= columns.values[5, start:stop] == 1
+
+        # Profit ratio at the candle high - as used for ROI and trailing stoploss.
+        profit = high * (trade.amount * (1 - (trade.fee_close or 0.0)) / trade.open_trade_value) - 1
+        if len(self._roi_durations):
+            open_ns = Timestamp(trade.open_date_utc).value
+            duration = (columns.dates[start:stop] - open_ns) // 60_000_000_000
+            roi_idx = np.searchsorted(self._roi_durations, duration, side="right") - 1
+            roi = np.where(roi_idx >= 0, self._roi_values[np.maximum(roi_idx, 0)], np.inf)
+            result |= profit > roi - self.PROFIT_MARGIN
+
+        if self._trailing_stop:
+            offset_reached = profit > self._trailing_offset - self.PROFIT_MARGIN
+            stoploss = np.full(len(high), self._stoploss)
+            if self._trailing_positive is not None:
+                stoploss[offset_reached] = min(self._stoploss, self._trailing_positive)
+            new_stop = high * (1 - stoploss)
+            # The new stoploss is rounded up to the price precision.
+            new_stop += _rounding_margin(
+                new_stop, trade.price_precision, trade.precision_mode_price
+            )
+            moves = new_stop >= stop_loss
+            if self._trailing_only_offset:
+                moves &= offset_reached
+            result |= moves
+        return result
+
+
+def _rounding_margin(
+    prices: np.ndarray, precision: float | None, precision_mode: int | None
+) -> np.ndarray | float:
+    """
+    Upper bound for the amount rounding up to the price precision can add.
+    """
+    margin = prices * 1e-9
+    if precision is None or precision_mode is None:
+        return margin
+    if precision_mode == TICK_SIZE:
+        return margin + precision
+    if precision_mode == DECIMAL_PLACES:
+        return margin + 10.0**-precision
+    # Significant digits
+    return margin + prices * 10.0 ** (1 - precision)
+
+
+class ColumnarSliceIndex:
+    """
+    Lazily resolves the analyzed dataframe slice index (see DataProvider) for every pair.
+
+    The list-based engine updates the slice index for every pair on every candle.
+    The columnar engine skips idle pairs, so the index is instead derived from the loop
+    position whenever a strategy asks for a dataframe.
+    """
+
+    def __init__(
+        self,
+        data: dict[str, PairColumns],
+        pairs: list[str],
+        startup: int,
+        timeframe_ns: int,
+    ) -> None:
+        """
+        :param data: Columnar backtest data
+        :param pairs: Pairs in processing order (pairs with open trades are processed first)
+        :param startup: Startup candle count
+        :param timeframe_ns: Main timeframe (ns)
+        """
+        self._data = data
+        self._pair_positions = {pair: i for i, pair in enumerate(pairs)}
+        self._startup = startup
+        self._timeframe_ns = timeframe_ns
+        self._current_ns = 0
+        self._open_positions: dict[str, int] = {}
+        self._current_pos: float = inf
+
+    def _position(self, pair: str) -> float:
+        if pair in self._open_positions:
+            return self._open_positions[pair]
+        return len(self._open_positions) + self._pair_positions.get(pair, inf)
+
+    def start_candle(self, current_ns: int, open_pairs: list[str]) -> None:
+        """
+        Begin a new main candle. No pair has been processed for this candle yet.
+        :param open_pairs: Pairs with open trades - processed before all other pairs.
+        """
+        self._current_ns = current_ns
+        self._open_positions = {pair: i for i, pair in enumerate(open_pairs)}
+        self._current_pos = -1
+
+    def set_pair(self, pair: str) -> None:
+        """Pair (and all pairs before it) has been processed for the current candle."""
+        self._current_pos = self._position(pair)
+
+    def finish_candle(self) -> None:
+        """All pairs have been processed for the current main candle."""
+        self._current_pos = inf
+
+    def __call__(self, pair: str) -> int | None:
+        columns = self._data.get(pair)
+        if columns is None:
+            return None
+        limit = self._current_ns
+        if self._position(pair) > self._current_pos:
+            limit -= self._timeframe_ns
+        processed = columns.processed_until(limit)
+        return self._startup + processed if processed else None
@@ -0,0 +1,187 @@
+"""
+Backtest profiler - measures time and call counts of backtest phases, engine steps
+and strategy callbacks.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from binancebot.misc import file_dump_json
+from binancebot.util import print_rich_table
+
+
+logger = logging.getLogger(__name__)
+
+# Backtesting methods to profile - backtest phases and engine steps.
+ENGINE_STEPS = (
+    "load_bt_data",
+    "backtest_one_strategy",
+    "advise_all_indicators",
+    "backtest",
+    "_get_ohlcv_as_lists",
+    "_get_ohlcv_as_columns",
+    "_backtest_main_loop",
+    "backtest_loop",
+    "check_for_trade_entry",
+    "manage_open_orders",
+    "_check_trade_exit",
+    "_check_adjust_trade_for_candle",
+    "_get_exit_for_signal",
+    "_exit_trade",
+    "_enter_trade",
+    "_run_funding_fees",
+    "get_detail_data",
+    "run_protections",
+    "handle_left_open",
+)
+
+# Strategy methods to profile - callbacks called by backtesting and the populate methods.
+STRATEGY_CALLBACKS = (
+    "populate_indicators",
+    "populate_entry_trend",
+    "populate_exit_trend",
+    "bot_loop_start",
+    "custom_entry_price",
+    "custom_exit_price",
+    "custom_stake_amount",
+    "leverage",
+    "confirm_trade_entry",
+    "confirm_trade_exit",
+    "custom_stoploss",
+    "custom_roi",
+    "custom_exit",
+    "adjust_trade_position",
+    "adjust_order_price",
+    "order_filled",
+    "check_entry_timeout",
+    "check_exit_timeout",
+)
+
+
+class BacktestProfiler:
+    """
+    Collects the time and call count of profiled functions per call stack.
+    Only calls from the thread which created the profiler are recorded.
+    """
+
+    def __init__(self) -> None:
+        self._thread = threading.get_ident()
+        self._stack: list[str] = []
+        # call stack -> [calls, total time, time spent in profiled children]
+        self._stats: dict[tuple[str, ...], list] = {}
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """
+        Wrap a function to record its time and call count under the given name.
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if threading.get_ident() != self._thread:
+                return func(*args, **kwargs)
+            self._stack.append(name)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(perf_counter() - start)
+
+        return wrapper
+
+    def _record(self, duration: float) -> None:
+        stats = self._stats.setdefault(tuple(self._stack), [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += duration
+        self._stack.pop()
+        if self._stack:
+            self._stats.setdefault(tuple(self._stack), [0, 0.0, 0.0])[2] += duration
+
+    def instrument(self, obj: Any, methods: tuple[str, ...], prefix: str = "") -> None:
+        """
+        Profile methods of an object by shadowing them with wrapped instance attributes.
+        Methods the object doesn't have are ignored.
+        :param obj: Object to instrument
+        :param methods: Names of the methods to profile
+        :param prefix: Prefix for the recorded names
+        """
+        for method in methods:
+            func = getattr(obj, method, None)
+            if callable(func):
+                setattr(obj, method, self.wrap(f"{prefix}{method}", func))
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Profile results - per function (aggregated over all call stacks) and per call stack.
+        Times are in seconds. Self time excludes time spent in profiled children.
+        """
+        functions: dict[str, dict[str, Any]] = {}
+        stacks = []
+        for stack, (calls, total, children) in self._stats.items():
+            name = stack[-1]
+            function = functions.setdefault(
+                name, {"name": name, "calls": 0, "total_time": 0.0, "self_time": 0.0}
+            )
+            function["calls"] += calls
+            function["self_time"] += total - children
+            if name not in stack[:-1]:
+                # Don't count time of recursive calls twice
+                function["total_time"] += total
+            stacks.append(
+                {
+                    "stack": ";".join(stack),
+                    "calls": calls,
+                    "total_time": total,
+                    "self_time": total - children,
+                }
+            )
+        return {
+            "functions": sorted(functions.values(), key=lambda f: f["self_time"], reverse=True),
+            "stacks": stacks,
+        }
+
+    def get_folded_stacks(self) -> str:
+        """
+        Profile results in the folded stack format used by flamegraph tools
+        (one "frame;frame;frame <self time in microseconds>" line per call stack).
+        """
+        return "".join(
+            f"{';'.join(stack)} {round((total - children) * 1_000_000)}\n"
+            for stack, (_, total, children) in self._stats.items()
+        )
+
+    def store(self, directory: Path, dtappendix: str) -> None:
+        """
+        Store profile results as json and as folded stacks.
+        :param directory: Directory to store the files in
+        :param dtappendix: Datetime to use for the filenames
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        base_filename = directory / f"backtest-profile-{dtappendix}"
+        file_dump_json(base_filename.with_suffix(".json"), self.get_stats())
+        folded_filename = base_filename.with_suffix(".folded")
+        folded_filename.write_text(self.get_folded_stacks())
+        logger.info(f"Stored flamegraph stacks in {folded_filename}.")
+
+    def show(self) -> None:
+        """
+        Print the functions which took most time.
+        """
+        print_rich_table(
+            [
+                (
+                    f["name"],
+                    str(f["calls"]),
+                    f"{f['total_time']:.3f}",
+                    f"{f['self_time']:.3f}",
+                    f"{f['self_time'] / max(f['calls'], 1) * 1_000_000:.1f}",
+                )
+                for f in self.get_stats()["functions"]
+            ],
+            ["Function", "Calls", "Total (s)", "Self (s)", "Self per call (µs)"],
+            summary="BACKTEST PROFILE",
+        )
@@ -0,0 +1,74 @@
+"""
+Data store shared by optimize worker processes (hyperopt and parallel backtesting).
+
+Data is published once to disk by the main process.
+Worker processes memory-map the stored arrays read-only - so all workers share the same
+physical pages - and keep the mapping for the lifetime of the process, instead of
+deserializing the data again for every task.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from joblib import dump, load
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+# Data attached by the current process - keyed by file and file version.
+# Must live on module level, as task objects are pickled for every task.
+_attached: dict[tuple[str, int, int], Any] = {}
+# Data derived from the attached data - reset whenever the attached data changes.
+_derived: dict[str, Any] = {}
+
+
+def store_shared(data: Any, data_file: Path) -> None:
+    """
+    Publish data for worker processes.
+    :param data: Data to publish. Numpy arrays (also within DataFrames) are memory-mapped
+        when attaching.
+    :param data_file: File to store the data in
+    """
+    dump(data, data_file)
+
+
+def attach_shared(data_file: Path) -> Any:
+    """
+    Attach to the data published by store_shared.
+    Numpy arrays are memory-mapped read-only and the data is reused across calls.
+    The returned data must not be modified.
+    :param data_file: File the data was stored in
+    """
+    stat = data_file.stat()
+    key = (str(data_file), stat.st_mtime_ns, stat.st_size)
+    data = _attached.get(key)
+    if data is None:
+        # Drop data from prior runs - only one version is relevant per process.
+        _attached.clear()
+        _derived.clear()
+        with data_file.open("rb") as f:
+            data = load(f, mmap_mode="r")
+        _attached[key] = data
+        logger.debug(f"Attached to shared data in {data_file}.")
+    return data
+
+
+def load_processed(data_file: Path) -> dict[str, DataFrame]:
+    """
+    Attach to processed data (format {pair: dataframe}) published by store_shared.
+    Returns shallow copies, so columns added while generating signals in one epoch
+    don't leak into the next epoch.
+    :param data_file: File the data was stored in
+    :return: Dictionary with format {pair: dataframe}
+    """
+    return {pair: df.copy(deep=False) for pair, df in attach_shared(data_file).items()}
+
+
+def attached_cache() -> dict[str, Any]:
+    """
+    Per-process cache for data derived from the currently attached data.
+    Stays valid for as long as attach_shared() returns the same data.
+    """
+    return _derived
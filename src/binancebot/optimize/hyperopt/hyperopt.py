@@ -7,25 +7,38 @@ This module contains the hyperopt logic
 import gc
 import logging
 import random
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime
 from math import ceil
 from pathlib import Path
+from time import monotonic, sleep
 from typing import Any
 
 import rapidjson
-from joblib import Parallel, cpu_count
+from joblib import Parallel, cpu_count, effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
 from optuna.trial import FrozenTrial, Trial, TrialState
 
-from binancebot.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
+from binancebot.constants import FTHYPT_FILEVERSION, Config
 from binancebot.enums import HyperoptState
-from binancebot.misc import file_dump_json, plural
+from binancebot.misc import plural
 from binancebot.optimize.hyperopt.hyperopt_optimizer import INITIAL_POINTS, HyperOptimizer
 from binancebot.optimize.hyperopt.hyperopt_output import HyperoptOutput
-from binancebot.optimize.hyperopt_tools import (
-    HyperoptStateContainer,
-    HyperoptTools,
-    hyperopt_serializer,
+from binancebot.optimize.hyperopt.hyperopt_results_writer import HyperoptResultsWriter
+from binancebot.optimize.hyperopt.hyperopt_worker import (
+    STUDY_EPOCHS_ATTR,
+    STUDY_POLL_INTERVAL,
+    STUDY_STOP_ATTR,
+    TRIAL_HEARTBEAT_ATTR,
+    TRIAL_HEARTBEAT_GRACE_PERIOD,
+    TRIAL_RESULT_ATTR,
+    fail_lost_trial,
+    get_params_key,
+    is_lost_trial,
+    report_checkpoint_losses,
 )
+from binancebot.optimize.hyperopt_results_index import get_index_filename
+from binancebot.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from binancebot.util import get_progress_tracker
 
 
@@ -78,6 +91,9 @@ class Hyperopt:
 
         self.hyperopter = HyperOptimizer(self.config, self.data_pickle_file)
         self.count_skipped_epochs = 0
+        self.count_pruned_epochs = 0
+        # Params of all completed trials, to skip duplicate trials
+        self.evaluated_params: set[frozenset] = set()
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -87,7 +103,11 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [
+            self.data_pickle_file,
+            self.results_file,
+            get_index_filename(self.results_file),
+        ]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -98,26 +118,17 @@ class Hyperopt:
         Save hyperopt results to file
         Store one line per epoch.
         While not a valid json object - this allows appending easily.
+        Epochs are written in batches by a background writer.
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open("a") as f:
-            rapidjson.dump(
-                epoch,
-                f,
-                default=hyperopt_serializer,
-                number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
-            )
-            f.write("\n")
+        self._results_writer.write(epoch)
 
         self.num_epochs_saved += 1
         logger.debug(
             f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
-            f"saved to '{self.results_file}'."
+            f"queued for saving to '{self.results_file}'."
         )
-        # Store hyperopt filename
-        latest_filename = Path.joinpath(self.results_file.parent, LAST_BT_RESULT_FN)
-        file_dump_json(latest_filename, {"latest_hyperopt": str(self.results_file.name)}, log=False)
 
     def print_results(self, results: dict[str, Any]) -> None:
         """
@@ -134,10 +145,12 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
+    def run_optimizer_parallel(
+        self, parallel: Parallel, asked: list[list], prune_bounds: list[float] | None = None
+    ) -> list[dict[str, Any]]:
         """Start optimizer in a parallel way"""
 
-        return parallel(self.hyperopter.generate_optimizer_wrapped(v) for v in asked)
+        return parallel(self.hyperopter.generate_optimizer_wrapped(v, prune_bounds) for v in asked)
 
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
@@ -148,41 +161,55 @@ class Hyperopt:
             asked.append(self.opt.ask(dimensions))
         return asked
 
-    def duplicate_optuna_asked_points(self, trial: Trial, asked_trials: list[FrozenTrial]) -> bool:
-        asked_trials_no_dups: list[FrozenTrial] = []
-        trials_to_consider = trial.study.get_trials(deepcopy=False, states=[TrialState.COMPLETE])
-        # Check whether we already evaluated the sampled `params`.
-        for t in reversed(trials_to_consider):
-            if trial.params == t.params:
-                return True
-        # Check whether same`params` in one batch (asked_trials). Autosampler is doing this.
-        for t in asked_trials:
-            if t.params not in asked_trials_no_dups:
-                asked_trials_no_dups.append(t)
-        if len(asked_trials_no_dups) != len(asked_trials):
+    def tell(self, trial: Trial, val: dict[str, Any]) -> bool:
+        """
+        Tell the optimizer the result of a trial, and remember its params if it completed
+        or was pruned.
+        :return: False if the epoch was pruned
+        """
+        report_checkpoint_losses(trial, val)
+        if val.get("is_pruned"):
+            frozen_trial = self.opt.tell(trial, state=TrialState.PRUNED)
+            self.count_pruned_epochs += 1
+        else:
+            frozen_trial = self.opt.tell(trial, val["loss"])
+        if frozen_trial.state in (TrialState.COMPLETE, TrialState.PRUNED):
+            self.evaluated_params.add(get_params_key(frozen_trial.params))
+        return frozen_trial.state != TrialState.PRUNED
+
+    def duplicate_optuna_asked_points(self, trial: Trial, asked_params: set[frozenset]) -> bool:
+        """
+        Check whether the params of a trial were already evaluated, or are already asked for.
+        Params of new trials are added to asked_params.
+        """
+        params = get_params_key(trial.params)
+        if params in self.evaluated_params or params in asked_params:
             return True
+        asked_params.add(params)
         return False
 
-    def get_asked_points(self, n_points: int, dimensions: dict) -> tuple[list[Any], list[bool]]:
+    def get_asked_points(
+        self, n_points: int, dimensions: dict, running: list[Trial] | None = None
+    ) -> tuple[list[Any], list[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
 
         Steps:
         1. Try to get points using `self.opt.ask` first
-        2. Discard the points that have already been evaluated
+        2. Discard the points that have already been evaluated, or are being evaluated
         3. Retry using `self.opt.ask` up to `n_points` times
+        :param running: Trials which are being evaluated
         """
-        asked_non_tried: list[FrozenTrial] = []
-        optuna_asked_trials = self.get_optuna_asked_points(n_points=n_points, dimensions=dimensions)
-        asked_non_tried += [
+        asked_params = {get_params_key(t.params) for t in running or []}
+        asked_non_tried: list[Trial] = [
             x
-            for x in optuna_asked_trials
-            if not self.duplicate_optuna_asked_points(x, optuna_asked_trials)
+            for x in self.get_optuna_asked_points(n_points=n_points, dimensions=dimensions)
+            if not self.duplicate_optuna_asked_points(x, asked_params)
         ]
         i = 0
         while i < 2 * n_points and len(asked_non_tried) < n_points:
             asked_new = self.get_optuna_asked_points(n_points=1, dimensions=dimensions)[0]
-            if not self.duplicate_optuna_asked_points(asked_new, asked_non_tried):
+            if not self.duplicate_optuna_asked_points(asked_new, asked_params):
                 asked_non_tried.append(asked_new)
             i += 1
         if len(asked_non_tried) < n_points:
@@ -216,85 +243,261 @@ class Hyperopt:
 
         self._save_result(val)
 
-    def start(self) -> None:
-        self.random_state = self._set_random_state(self.config.get("hyperopt_random_state"))
-        logger.info(f"Using optimizer random state: {self.random_state}")
-        self.hyperopt_table_header = -1
-        self.hyperopter.prepare_hyperopt()
-
-        cpus = cpu_count()
-        logger.info(f"Found {cpus} CPU cores. Let's make them scream!")
-        config_jobs = self.config.get("hyperopt_jobs", -1)
-        logger.info(f"Number of parallel jobs set as: {config_jobs}")
-
-        self.opt = self.hyperopter.get_optimizer(self.random_state)
-        try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-
-                # Define progressbar
-                with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
+    def _evaluate_first_epoch(self, pbar, task) -> int:
+        """
+        First analysis not in parallel mode when using --analyze-per-epoch.
+        This allows dataprovider to load it's informative cache.
+        :return: Number of epochs evaluated
+        """
+        if not self.analyze_per_epoch:
+            return 0
+        asked, is_random = self.get_asked_points(
+            n_points=1, dimensions=self.hyperopter.o_dimensions
+        )
+        f_val0 = self.hyperopter.generate_optimizer(
+            asked[0].params, self.hyperopter.get_prune_bounds(self.opt)
+        )
+        if self.tell(asked[0], f_val0):
+            self.evaluate_result(f_val0, 1, is_random[0])
+        pbar.update(task, advance=1)
+        return 1
 
-                    start = 0
+    def _run_epochs(self, config_jobs: int) -> None:
+        """
+        Evaluate epochs in batches of one epoch per worker.
+        """
+        with Parallel(n_jobs=config_jobs) as parallel:
+            jobs = parallel._effective_n_jobs()
+            logger.info(f"Effective number of parallel workers used: {jobs}")
+
+            # Define progressbar
+            with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = self._evaluate_first_epoch(pbar, task)
+
+                evals = ceil((self.total_epochs - start) / jobs)
+                for i in range(evals):
+                    # Correct the number of epochs to be processed for the last
+                    # iteration (should not exceed self.total_epochs in total)
+                    n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                    current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                    asked, is_random = self.get_asked_points(
+                        n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
+                    )
+
+                    f_val = self.run_optimizer_parallel(
+                        parallel,
+                        [asked1.params for asked1 in asked],
+                        self.hyperopter.get_prune_bounds(self.opt),
+                    )
+
+                    for j, (o_ask, val) in enumerate(zip(asked, f_val, strict=False)):
+                        if self.tell(o_ask, val):
+                            # Use human-friendly indexes here (starting from 1)
+                            current = i * jobs + j + 1 + start
 
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(
-                            n_points=1, dimensions=self.hyperopter.o_dimensions
-                        )
-                        f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
-                        self.opt.tell(asked[0], [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
+                            self.evaluate_result(val, current, is_random[j])
                         pbar.update(task, advance=1)
-                        start += 1
+                    self.hyperopter.handle_mp_logging()
+                    gc.collect()
 
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
+                    if (
+                        self.hyperopter.es_epochs > 0
+                        and self.hyperopter.es_terminator.should_terminate(self.opt)
+                    ):
+                        logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
+                        break
 
+    def _run_epochs_async(self, jobs: int) -> None:
+        """
+        Evaluate epochs without batches - a new trial is asked for and submitted as soon as
+        any worker finishes, so slow epochs don't leave the other workers waiting.
+        Trials are told in the order they finish, and epochs are numbered in that order.
+        """
+        logger.info(f"Effective number of parallel workers used: {jobs}")
+        executor = get_reusable_executor(max_workers=jobs)
+        running: dict[Future, tuple[Trial, bool]] = {}
+
+        with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
+            task = pbar.add_task("Epochs", total=self.total_epochs)
+
+            current = asked_epochs = self._evaluate_first_epoch(pbar, task)
+            try:
+                while True:
+                    n_points = min(jobs - len(running), self.total_epochs - asked_epochs)
+                    if n_points > 0:
+                        prune_bounds = self.hyperopter.get_prune_bounds(self.opt)
                         asked, is_random = self.get_asked_points(
-                            n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
+                            n_points=n_points,
+                            dimensions=self.hyperopter.o_dimensions,
+                            running=[trial for trial, _ in running.values()],
                         )
-
-                        f_val = self.run_optimizer_parallel(
-                            parallel,
-                            [asked1.params for asked1 in asked],
+                        for trial, trial_is_random in zip(asked, is_random, strict=True):
+                            func, args, kwargs = self.hyperopter.generate_optimizer_wrapped(
+                                trial.params, prune_bounds
+                            )
+                            future = executor.submit(func, *args, **kwargs)
+                            running[future] = (trial, trial_is_random)
+                        asked_epochs += n_points
+                    if not running:
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    # Keep submission order for epochs finishing at the same time
+                    for future in [f for f in running if f in done]:
+                        trial, trial_is_random = running.pop(future)
+                        val = future.result()
+                        pbar.update(task, advance=1)
+                        if not self.tell(trial, val):
+                            continue
+                        current += 1
+                        self.evaluate_result(val, current, trial_is_random)
+                        if current % jobs == 0:
+                            gc.collect()
+                    self.hyperopter.handle_mp_logging()
+
+                    if (
+                        self.hyperopter.es_epochs > 0
+                        and self.hyperopter.es_terminator.should_terminate(self.opt)
+                    ):
+                        logger.info(f"Early stopping after {current} epochs")
+                        break
+            finally:
+                for future in running:
+                    future.cancel()
+
+    def _fail_lost_trials(
+        self, running: list[FrozenTrial], heartbeats: dict[int, tuple[Any, float]]
+    ) -> dict[int, tuple[Any, float]]:
+        """
+        Fail running trials without heartbeats for TRIAL_HEARTBEAT_GRACE_PERIOD seconds - e.g.
+        of killed workers or lost machines. Their epochs are evaluated again by the remaining
+        workers.
+        Heartbeats are timed with the clock of this process, as clocks of the workers' machines
+        may differ.
+        :param heartbeats: Last heartbeat of each running trial, with the time it was seen
+        :return: Updated heartbeats
+        """
+        now = monotonic()
+        updated = {}
+        for trial in running:
+            heartbeat = trial.user_attrs.get(TRIAL_HEARTBEAT_ATTR)
+            last = heartbeats.get(trial.number)
+            if last is None or last[0] != heartbeat:
+                updated[trial.number] = (heartbeat, now)
+            elif now - last[1] <= TRIAL_HEARTBEAT_GRACE_PERIOD:
+                updated[trial.number] = last
+            else:
+                logger.warning(
+                    f"No heartbeat of trial {trial.number} for {TRIAL_HEARTBEAT_GRACE_PERIOD} "
+                    "seconds, its worker was lost. The epoch will be evaluated again."
+                )
+                fail_lost_trial(self.opt, trial)
+        return updated
+
+    def _run_epochs_distributed(self) -> None:
+        """
+        Collect the results of a distributed hyperopt run.
+        Trials are evaluated by `hyperopt-worker` processes sharing the study storage.
+        Epochs are numbered in the order they finish.
+        """
+        logger.info(
+            f"Created study '{self.opt.study_name}'. Start hyperopt workers with "
+            f"`hyperopt-worker --hyperopt-storage {self.config['hyperopt_storage']} "
+            f"--study-name {self.opt.study_name}` and the same configuration."
+        )
+        self.opt.set_user_attr(STUDY_EPOCHS_ATTR, self.total_epochs)
+        collected: set[int] = set()
+        heartbeats: dict[int, tuple[Any, float]] = {}
+        current = 0
+
+        with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
+            task = pbar.add_task("Epochs", total=self.total_epochs)
+            try:
+                while (
+                    current + self.count_skipped_epochs + self.count_pruned_epochs
+                    < self.total_epochs
+                ):
+                    trials = self.opt.get_trials(deepcopy=False)
+                    heartbeats = self._fail_lost_trials(
+                        [t for t in trials if t.state == TrialState.RUNNING], heartbeats
+                    )
+                    finished = [
+                        trial
+                        for trial in trials
+                        if trial.state.is_finished() and trial.number not in collected
+                    ]
+                    for trial in sorted(finished, key=lambda t: (t.datetime_complete, t.number)):
+                        collected.add(trial.number)
+                        if is_lost_trial(trial):
+                            # Evaluated again by another worker
+                            continue
+                        if trial.state == TrialState.PRUNED:
+                            self.count_pruned_epochs += 1
+                            pbar.update(task, advance=1)
+                            continue
+                        if TRIAL_RESULT_ATTR not in trial.user_attrs:
+                            # Duplicate params
+                            self.count_skipped_epochs += 1
+                            continue
+                        current += 1
+                        self.evaluate_result(
+                            rapidjson.loads(trial.user_attrs[TRIAL_RESULT_ATTR]), current, False
                         )
+                        pbar.update(task, advance=1)
 
-                        f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
+                    if (
+                        self.hyperopter.es_epochs > 0
+                        and self.hyperopter.es_terminator.should_terminate(self.opt)
+                    ):
+                        logger.info(f"Early stopping after {current} epochs")
+                        break
+                    if not finished:
+                        sleep(STUDY_POLL_INTERVAL)
+            finally:
+                self.opt.set_user_attr(STUDY_STOP_ATTR, True)
 
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        self.hyperopter.handle_mp_logging()
-                        gc.collect()
+    def start(self) -> None:
+        self.random_state = self._set_random_state(self.config.get("hyperopt_random_state"))
+        logger.info(f"Using optimizer random state: {self.random_state}")
+        self.hyperopt_table_header = -1
+        if self.config.get("hyperopt_storage"):
+            # Data is loaded by the hyperopt workers
+            self.hyperopter.init_spaces()
+        else:
+            self.hyperopter.prepare_hyperopt()
 
-                        if (
-                            self.hyperopter.es_epochs > 0
-                            and self.hyperopter.es_terminator.should_terminate(self.opt)
-                        ):
-                            logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
-                            break
+        cpus = cpu_count()
+        logger.info(f"Found {cpus} CPU cores. Let's make them scream!")
+        config_jobs = self.config.get("hyperopt_jobs", -1)
+        logger.info(f"Number of parallel jobs set as: {config_jobs}")
 
+        self.opt = self.hyperopter.get_optimizer(self.random_state)
+        self._results_writer = HyperoptResultsWriter(self.results_file)
+        try:
+            if self.config.get("hyperopt_storage"):
+                self._run_epochs_distributed()
+            elif self.config.get("hyperopt_async", False) and effective_n_jobs(config_jobs) > 1:
+                self._run_epochs_async(effective_n_jobs(config_jobs))
+            else:
+                self._run_epochs(config_jobs)
         except KeyboardInterrupt:
             print("User interrupted..")
+        finally:
+            self._results_writer.close()
 
         if self.count_skipped_epochs > 0:
             logger.info(
                 f"{self.count_skipped_epochs} {plural(self.count_skipped_epochs, 'epoch')} "
                 f"skipped due to duplicate parameters."
             )
+        if self.count_pruned_epochs > 0:
+            logger.info(
+                f"{self.count_pruned_epochs} {plural(self.count_pruned_epochs, 'epoch')} "
+                f"pruned at a checkpoint."
+            )
 
         logger.info(
             f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
@@ -11,11 +11,15 @@ from multiprocessing import Manager
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import optuna
-from joblib import delayed, dump, load, wrap_non_picklable_objects
+from joblib import delayed, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
-from optuna.exceptions import ExperimentalWarning
+from optuna.exceptions import DuplicatedStudyError, ExperimentalWarning
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
 from optuna.terminator import BestValueStagnationEvaluator, Terminator
+from optuna.trial import TrialState
 from pandas import DataFrame
 
 from binancebot.constants import DATETIME_PRINT_FORMAT, Config
@@ -23,10 +27,11 @@ from binancebot.data.converter import trim_dataframes
 from binancebot.data.history import get_timerange
 from binancebot.data.metrics import calculate_market_change
 from binancebot.enums import HyperoptState
-from binancebot.exceptions import OperationalException
+from binancebot.exceptions import BacktestPruned, OperationalException
 from binancebot.ft_types import BacktestContentType
 from binancebot.misc import deep_merge_dicts, round_dict
 from binancebot.optimize.backtesting import Backtesting
+from binancebot.optimize.datastore import attached_cache, load_processed, store_shared
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from binancebot.optimize.hyperopt.hyperopt_auto import HyperOptAuto
@@ -51,6 +56,9 @@ INITIAL_POINTS = 30
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Completed epochs required at a checkpoint before epochs are pruned at that checkpoint
+PRUNE_STARTUP_EPOCHS = 5
+
 optuna_samplers_dict = {
     "TPESampler": optuna.samplers.TPESampler,
     "GPSampler": optuna.samplers.GPSampler,
@@ -63,6 +71,16 @@ optuna_samplers_dict = {
 log_queue: Any
 
 
+def get_study_storage(storage: str) -> str | JournalStorage:
+    """
+    Storage of a study shared by the processes of a distributed hyperopt run.
+    :param storage: Database URL (e.g. sqlite:///hyperopt.sqlite) or path of a journal file
+    """
+    if "://" in storage:
+        return storage
+    return JournalStorage(JournalFileBackend(storage))
+
+
 class HyperOptimizer:
     """
     HyperoptOptimizer class
@@ -98,6 +116,8 @@ class HyperOptimizer:
 
         self.market_change = 0.0
 
+        self.prune_checkpoints = config.get("hyperopt_prune_checkpoints", 0)
+
         self.es_epochs = config.get("early_stop", 0)
         if self.es_epochs > 0 and self.es_epochs < 0.2 * config.get("epochs", 0):
             logger.warning(f"Early stop epochs {self.es_epochs} lower than 20% of total epochs")
@@ -256,17 +276,76 @@ class HyperOptimizer:
             )
         self.o_dimensions = self.convert_dimensions_to_optuna_space(self.dimensions)
 
+    def get_prune_bounds(self, study: optuna.Study) -> list[float] | None:
+        """
+        Bounds for pruning the next epochs - per checkpoint, the median of the checkpoint
+        losses of all completed epochs.
+        :return: None if pruning is disabled
+        """
+        if not self.prune_checkpoints:
+            return None
+        trials = study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,))
+        bounds = []
+        for step in range(self.prune_checkpoints):
+            losses = [t.intermediate_values[step] for t in trials if step in t.intermediate_values]
+            if len(losses) < PRUNE_STARTUP_EPOCHS:
+                bounds.append(float("inf"))
+            else:
+                bounds.append(float(np.median(losses)))
+        return bounds
+
+    def _backtest_with_checkpoints(
+        self, processed: dict[str, DataFrame], prune_bounds: list[float] | None
+    ) -> tuple[BacktestContentType | None, list[float]]:
+        """
+        Run the backtest, calculating the checkpoint loss at each checkpoint.
+        :param prune_bounds: Checkpoint losses above which the backtest is aborted
+        :return: Tuple of backtest results (None if the backtest was aborted)
+            and checkpoint losses
+        """
+        checkpoint_losses: list[float] = []
+        starting_balance = get_dry_run_wallet(self.config)
+
+        def on_checkpoint(step: int, metrics: dict[str, Any]) -> bool:
+            loss = self.custom_hyperoptloss.hyperopt_checkpoint_loss(
+                checkpoint=step, config=self.config, starting_balance=starting_balance, **metrics
+            )
+            checkpoint_losses.append(loss)
+            return prune_bounds is not None and loss > prune_bounds[step]
+
+        duration = self.max_date - self.min_date
+        try:
+            bt_results = self.backtesting.backtest(
+                processed=processed,
+                start_date=self.min_date,
+                end_date=self.max_date,
+                checkpoints=[
+                    self.min_date + duration * (i + 1) / (self.prune_checkpoints + 1)
+                    for i in range(self.prune_checkpoints)
+                ],
+                on_checkpoint=on_checkpoint,
+            )
+        except BacktestPruned:
+            return None, checkpoint_losses
+        return bt_results, checkpoint_losses
+
     @delayed
     @wrap_non_picklable_objects
-    def generate_optimizer_wrapped(self, params_dict: dict[str, Any]) -> dict[str, Any]:
+    def generate_optimizer_wrapped(
+        self, params_dict: dict[str, Any], prune_bounds: list[float] | None = None
+    ) -> dict[str, Any]:
         logging_mp_setup(log_queue, logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG)
-        return self.generate_optimizer(params_dict)
+        return self.generate_optimizer(params_dict, prune_bounds)
 
-    def generate_optimizer(self, params_dict: dict[str, Any]) -> dict[str, Any]:
+    def generate_optimizer(
+        self, params_dict: dict[str, Any], prune_bounds: list[float] | None = None
+    ) -> dict[str, Any]:
         """
         Used Optimize function.
         Called once per epoch to optimize whatever is configured.
         Keep this function as optimized as possible!
+        :param prune_bounds: Checkpoint losses above which the epoch is pruned
+            (see get_prune_bounds())
         """
         HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
         backtest_start_time = datetime.now(UTC)
@@ -311,15 +390,29 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        processed = load_processed(self.data_pickle_file)
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
+            # Indicators may change the candles - so the signal cache is not used.
             processed = self.advise_and_trim(processed)
-
-        bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
-        )
+        else:
+            # Candles don't change between epochs - only entry / exit signals need recalculation.
+            self.backtesting.signal_cache = attached_cache().setdefault("signals", {})
+
+        checkpoint_losses: list[float] = []
+        if self.prune_checkpoints:
+            bt_results, checkpoint_losses = self._backtest_with_checkpoints(processed, prune_bounds)
+            if bt_results is None:
+                return {
+                    "loss": MAX_LOSS,
+                    "params_dict": params_dict,
+                    "is_pruned": True,
+                    "checkpoint_losses": checkpoint_losses,
+                }
+        else:
+            bt_results = self.backtesting.backtest(
+                processed=processed, start_date=self.min_date, end_date=self.max_date
+            )
         backtest_end_time = datetime.now(UTC)
         bt_results.update(
             {
@@ -330,6 +423,8 @@ class HyperOptimizer:
         result = self._get_results_dict(
             bt_results, self.min_date, self.max_date, params_dict, processed=processed
         )
+        if self.prune_checkpoints:
+            result["checkpoint_losses"] = checkpoint_losses
         return result
 
     def _get_results_dict(
@@ -405,7 +500,15 @@ class HyperOptimizer:
     def get_optimizer(
         self,
         random_state: int,
+        load_study: bool = False,
     ):
+        """
+        Create the optuna study.
+        With `hyperopt_storage` configured, the study is kept in the shared storage of a
+        distributed hyperopt run.
+        :param random_state: Random state for the sampler
+        :param load_study: Load the existing study from the shared storage instead
+        """
         o_sampler = self.custom_hyperopt.generate_estimator(
             dimensions=self.dimensions, random_state=random_state
         )
@@ -434,10 +537,29 @@ class HyperOptimizer:
                 self.es_terminator = Terminator(BestValueStagnationEvaluator(self.es_epochs))
 
         logger.info(f"Using optuna sampler {o_sampler}.")
-        return optuna.create_study(sampler=sampler, direction="minimize")
+        if not (storage := self.config.get("hyperopt_storage")):
+            return optuna.create_study(sampler=sampler, direction="minimize")
+
+        study_name = self.config.get("hyperopt_study_name") or self.get_strategy_name()
+        if load_study:
+            return optuna.load_study(
+                study_name=study_name, storage=get_study_storage(storage), sampler=sampler
+            )
+        try:
+            return optuna.create_study(
+                study_name=study_name,
+                storage=get_study_storage(storage),
+                sampler=sampler,
+                direction="minimize",
+            )
+        except DuplicatedStudyError as e:
+            raise OperationalException(
+                f"Hyperopt study '{study_name}' already exists in '{storage}'. "
+                "Please use a different study name (--study-name) or storage."
+            ) from e
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        preprocessed = self.backtesting.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -467,6 +589,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            store_shared(preprocessed, self.data_pickle_file)
         else:
-            dump(data, self.data_pickle_file)
+            store_shared(data, self.data_pickle_file)
@@ -0,0 +1,119 @@
+import logging
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Thread
+from time import monotonic
+from typing import Any
+
+import rapidjson
+
+from binancebot.constants import LAST_BT_RESULT_FN
+from binancebot.misc import file_dump_json
+from binancebot.optimize.hyperopt_results_index import HyperoptResultsIndex, summarize_epoch
+from binancebot.optimize.hyperopt_tools import hyperopt_serializer
+
+
+logger = logging.getLogger(__name__)
+
+# Write queued epochs once this many epochs are queued ...
+RESULTS_FLUSH_EPOCHS = 100
+# ... or once the oldest queued epoch waited this many seconds.
+RESULTS_FLUSH_INTERVAL = 5.0
+
+
+class HyperoptResultsWriter:
+    """
+    Append epochs to the hyperopt results file from a background thread.
+    Epochs are written in batches, so the main process can keep feeding the workers
+    in the meantime.
+    Every epoch is a complete line of the results file - an epoch which was only partially
+    written (e.g. when hyperopt is killed) is ignored when reading the results.
+    """
+
+    def __init__(
+        self,
+        results_file: Path,
+        flush_epochs: int = RESULTS_FLUSH_EPOCHS,
+        flush_interval: float = RESULTS_FLUSH_INTERVAL,
+    ) -> None:
+        self.results_file = results_file
+        self._flush_epochs = flush_epochs
+        self._flush_interval = flush_interval
+        self._queue: Queue[tuple[bytes, dict[str, Any]] | None] = Queue()
+        self._error: Exception | None = None
+        self._thread = Thread(target=self._run, name="hyperopt-results-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, epoch: dict[str, Any]) -> None:
+        """
+        Queue an epoch for writing.
+        The epoch is serialized right away - epochs evaluated in this process can share
+        objects with the strategy, which change with the next epoch.
+        """
+        self._raise_error()
+        line = (
+            rapidjson.dumps(
+                epoch,
+                default=hyperopt_serializer,
+                number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
+            )
+            + "\n"
+        ).encode("utf-8")
+        self._queue.put((line, summarize_epoch(epoch)))
+
+    def close(self) -> None:
+        """
+        Write all queued epochs and stop the writer.
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        batch: list[tuple[bytes, dict[str, Any]]] = []
+        deadline = 0.0
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - monotonic(), 0) if batch else None)
+            except Empty:
+                pass
+            else:
+                if item is None:
+                    break
+                if not batch:
+                    deadline = monotonic() + self._flush_interval
+                batch.append(item)
+                if len(batch) < self._flush_epochs:
+                    continue
+            self._write_batch(batch)
+            batch = []
+        self._write_batch(batch)
+
+    def _write_batch(self, batch: list[tuple[bytes, dict[str, Any]]]) -> None:
+        if not batch or self._error is not None:
+            return
+        try:
+            with self.results_file.open("ab") as f:
+                offset = f.tell()
+                f.write(b"".join(line for line, _ in batch))
+
+            entries = []
+            for line, summary in batch:
+                entries.append((offset, len(line), summary))
+                offset += len(line)
+            HyperoptResultsIndex.append(self.results_file, entries)
+
+            # Store hyperopt filename
+            latest_filename = Path.joinpath(self.results_file.parent, LAST_BT_RESULT_FN)
+            file_dump_json(
+                latest_filename, {"latest_hyperopt": str(self.results_file.name)}, log=False
+            )
+        except Exception as e:
+            logger.exception(f"Failed to save hyperopt results to '{self.results_file}'.")
+            self._error = e
@@ -0,0 +1,266 @@
+"""
+Worker of a distributed hyperopt run.
+
+A distributed run consists of one `hyperopt` process, which creates the study in the shared
+storage and collects the results, and any number of `hyperopt-worker` processes on any number
+of machines, which evaluate trials of that study.
+
+Workers send heartbeats for the trials they evaluate. The hyperopt process fails trials without
+heartbeats for TRIAL_HEARTBEAT_GRACE_PERIOD seconds - e.g. of a killed worker, or of a lost
+machine - as lost, and their epochs are evaluated again by the remaining workers.
+"""
+
+import logging
+import os
+import random
+from threading import Event, Thread
+from time import sleep, time
+from typing import Any
+
+import rapidjson
+from joblib import Parallel
+from optuna import Study
+from optuna.distributions import (
+    BaseDistribution,
+    CategoricalDistribution,
+    FloatDistribution,
+    IntDistribution,
+)
+from optuna.exceptions import UpdateFinishedTrialError
+from optuna.trial import FrozenTrial, Trial, TrialState
+
+from binancebot.constants import Config
+from binancebot.exceptions import OperationalException
+from binancebot.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+from binancebot.optimize.hyperopt_tools import HYPER_PARAMS_FILE_FORMAT, hyperopt_serializer
+
+
+logger = logging.getLogger(__name__)
+
+# Study user attribute holding the number of epochs to evaluate.
+STUDY_EPOCHS_ATTR = "ft_epochs"
+# Study user attribute telling the workers to stop.
+STUDY_STOP_ATTR = "ft_stop"
+# Trial user attribute holding the serialized result of the epoch.
+TRIAL_RESULT_ATTR = "ft_result"
+# Trial user attribute holding the time of the last heartbeat of the worker.
+TRIAL_HEARTBEAT_ATTR = "ft_heartbeat"
+# Trial user attribute marking a trial failed because its worker was lost.
+TRIAL_LOST_ATTR = "ft_lost"
+# Seconds to wait between polls of the shared storage.
+STUDY_POLL_INTERVAL = 2
+# Seconds between heartbeats of running trials.
+TRIAL_HEARTBEAT_INTERVAL = 30
+# Seconds without heartbeat after which a running trial is failed as lost.
+TRIAL_HEARTBEAT_GRACE_PERIOD = 300
+
+
+def get_params_key(params: dict[str, Any]) -> frozenset:
+    return frozenset(params.items())
+
+
+def is_lost_trial(trial: FrozenTrial) -> bool:
+    """
+    Check if the trial was failed because its worker was lost - its epoch is evaluated again.
+    """
+    return trial.state == TrialState.FAIL and TRIAL_LOST_ATTR in trial.user_attrs
+
+
+def fail_lost_trial(study: Study, trial: Trial | FrozenTrial) -> None:
+    """
+    Fail a running trial as lost, so its epoch is evaluated again.
+    """
+    try:
+        # Frozen trials can't set user attributes - go through the storage.
+        study._storage.set_trial_user_attr(trial._trial_id, TRIAL_LOST_ATTR, True)
+        study.tell(trial.number, state=TrialState.FAIL, skip_if_finished=True)
+    except UpdateFinishedTrialError:
+        # The trial finished in the meantime
+        pass
+
+
+def report_checkpoint_losses(trial: Trial, val: dict[str, Any]) -> None:
+    """
+    Report the checkpoint losses of an epoch to its trial, removing them from the result.
+    """
+    for step, loss in enumerate(val.pop("checkpoint_losses", [])):
+        trial.report(loss, step)
+
+
+def get_storable_distributions(
+    dimensions: dict[str, BaseDistribution],
+) -> dict[str, BaseDistribution]:
+    """
+    Convert distributions to optuna's own distribution classes, which are the only ones
+    storages can serialize.
+    """
+    storable: dict[str, BaseDistribution] = {}
+    for name, dist in dimensions.items():
+        if isinstance(dist, CategoricalDistribution):
+            storable[name] = CategoricalDistribution(dist.choices)
+        elif isinstance(dist, IntDistribution):
+            storable[name] = IntDistribution(dist.low, dist.high, log=dist.log, step=dist.step)
+        elif isinstance(dist, FloatDistribution):
+            storable[name] = FloatDistribution(dist.low, dist.high, log=dist.log, step=dist.step)
+        else:
+            storable[name] = dist
+    return storable
+
+
+class HyperoptWorker:
+    """
+    Evaluates trials of a distributed hyperopt study.
+    Trials are asked from the shared study in batches of one trial per worker process, and
+    their results are stored in the study, where the coordinating hyperopt process picks
+    them up.
+    """
+
+    def __init__(self, config: Config) -> None:
+        if not config.get("hyperopt_storage"):
+            raise OperationalException("hyperopt-worker requires --hyperopt-storage.")
+        self.config = config
+        # Workers on the same machine must not share the data file.
+        self.data_pickle_file = (
+            self.config["user_data_dir"]
+            / "hyperopt_results"
+            / f"hyperopt_tickerdata_worker_{os.getpid()}.pkl"
+        )
+        self.hyperopter = HyperOptimizer(self.config, self.data_pickle_file)
+        self.dimensions: dict[str, BaseDistribution] = {}
+        self.num_epochs_evaluated = 0
+        # Trials being evaluated by this worker
+        self._running_trials: list[Trial] = []
+
+    def _load_study(self) -> Study:
+        """
+        Load the study, waiting until the hyperopt process created it.
+        """
+        # Workers sample independently - a shared random state would ask the same params.
+        random_state = random.randint(1, 2**16 - 1)  # noqa: S311
+        logger.info(f"Using optimizer random state: {random_state}")
+        while True:
+            try:
+                study = self.hyperopter.get_optimizer(random_state, load_study=True)
+                if STUDY_EPOCHS_ATTR in study.user_attrs:
+                    return study
+            except KeyError:
+                pass
+            logger.info("Waiting for the hyperopt process to create the study ...")
+            sleep(STUDY_POLL_INTERVAL)
+
+    @staticmethod
+    def _get_epochs_left(study: Study) -> int:
+        """
+        Number of epochs left to evaluate.
+        While all remaining epochs are being evaluated by other workers, wait until they
+        finish - their trials are failed as lost and evaluated again if a worker is lost.
+        """
+        while not study.user_attrs.get(STUDY_STOP_ATTR):
+            # Epochs of lost trials are evaluated again
+            trials = study.get_trials(deepcopy=False)
+            epochs_left = study.user_attrs[STUDY_EPOCHS_ATTR] - sum(
+                not is_lost_trial(t) for t in trials
+            )
+            if epochs_left > 0 or not any(t.state == TrialState.RUNNING for t in trials):
+                return epochs_left
+            sleep(STUDY_POLL_INTERVAL)
+        return 0
+
+    def _ask(self, study: Study, n_points: int) -> list[Trial]:
+        """
+        Ask for trials. Trials with params which were already evaluated, or are being
+        evaluated by another worker, are failed right away.
+        """
+        known_params = {
+            get_params_key(t.params)
+            for t in study.get_trials(
+                deepcopy=False,
+                states=(TrialState.COMPLETE, TrialState.PRUNED, TrialState.RUNNING),
+            )
+        }
+        asked = []
+        for _ in range(n_points):
+            trial = study.ask(self.dimensions)
+            params = get_params_key(trial.params)
+            if params in known_params:
+                study.tell(trial, state=TrialState.FAIL)
+            else:
+                known_params.add(params)
+                asked.append(trial)
+        return asked
+
+    def _send_heartbeats(self, stop: Event) -> None:
+        """
+        Send heartbeats for the running trials until stop is set.
+        """
+        while not stop.wait(TRIAL_HEARTBEAT_INTERVAL):
+            for trial in list(self._running_trials):
+                try:
+                    trial.set_user_attr(TRIAL_HEARTBEAT_ATTR, time())
+                except UpdateFinishedTrialError:
+                    # Failed as lost by the hyperopt process
+                    pass
+
+    @staticmethod
+    def _tell(study: Study, trial: Trial, val: dict[str, Any]) -> None:
+        """
+        Store the result of an epoch in its trial.
+        """
+        report_checkpoint_losses(trial, val)
+        if val.get("is_pruned"):
+            study.tell(trial, state=TrialState.PRUNED, skip_if_finished=True)
+            return
+        trial.set_user_attr(
+            TRIAL_RESULT_ATTR,
+            rapidjson.dumps(
+                val,
+                default=hyperopt_serializer,
+                number_mode=HYPER_PARAMS_FILE_FORMAT,
+            ),
+        )
+        # Skip trials failed as lost in the meantime
+        study.tell(trial, val["loss"], skip_if_finished=True)
+
+    def start(self) -> None:
+        self.hyperopter.prepare_hyperopt()
+        self.dimensions = get_storable_distributions(self.hyperopter.o_dimensions)
+        study = self._load_study()
+        logger.info(f"Evaluating trials of study '{study.study_name}'.")
+
+        config_jobs = self.config.get("hyperopt_jobs", -1)
+        stop_heartbeats = Event()
+        heartbeats = Thread(target=self._send_heartbeats, args=(stop_heartbeats,), daemon=True)
+        heartbeats.start()
+        try:
+            with Parallel(n_jobs=config_jobs) as parallel:
+                jobs = parallel._effective_n_jobs()
+                logger.info(f"Effective number of parallel workers used: {jobs}")
+
+                while (n_points := min(jobs, self._get_epochs_left(study))) > 0:
+                    self._running_trials = self._ask(study, n_points)
+                    prune_bounds = self.hyperopter.get_prune_bounds(study)
+                    f_val = parallel(
+                        self.hyperopter.generate_optimizer_wrapped(trial.params, prune_bounds)
+                        for trial in self._running_trials
+                    )
+                    for val in f_val:
+                        trial = self._running_trials.pop(0)
+                        try:
+                            self._tell(study, trial, val)
+                        except UpdateFinishedTrialError:
+                            logger.warning(
+                                f"Trial {trial.number} was failed as lost, discarding its result."
+                            )
+                    self.num_epochs_evaluated += len(f_val)
+                    self.hyperopter.handle_mp_logging()
+        except KeyboardInterrupt:
+            print("User interrupted..")
+        finally:
+            stop_heartbeats.set()
+            heartbeats.join()
+            # Don't leave trials of this worker running - their epochs are evaluated again.
+            for trial in self._running_trials:
+                fail_lost_trial(study, trial)
+            self.data_pickle_file.unlink(missing_ok=True)
+
+        logger.info(f"Evaluated {self.num_epochs_evaluated} epochs.")
@@ -37,3 +37,25 @@ class IHyperOptLoss(ABC):
         """
         Objective function, returns smaller number for better results
         """
+
+    @staticmethod
+    def hyperopt_checkpoint_loss(
+        *,
+        checkpoint: int,
+        current_time: datetime,
+        total_trades: int,
+        profit_total: float,
+        profit_total_abs: float,
+        max_drawdown_account: float,
+        config: Config,
+        starting_balance: float,
+        **kwargs,
+    ) -> float:
+        """
+        Intermediate loss at a checkpoint of the backtest, used by hyperopt pruning.
+        Epochs with an intermediate loss above the median of all completed epochs at the same
+        checkpoint are aborted.
+        Only closed trades are taken into account.
+        Defaults to the negative total profit - returns smaller number for better results.
+        """
+        return -profit_total
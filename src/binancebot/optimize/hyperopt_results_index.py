@@ -0,0 +1,172 @@
+"""
+Offset index of hyperopt results files.
+
+Results files store one epoch per line. The index stores the position of every epoch in the
+results file, together with a small summary of the epoch - which is all that is needed to list
+and filter epochs. Full epochs are only read from the results file when they are displayed.
+"""
+
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import rapidjson
+
+from binancebot.optimize.hyperopt_tools import HYPER_PARAMS_FILE_FORMAT, hyperopt_serializer
+
+
+logger = logging.getLogger(__name__)
+
+# Epoch keys stored in the summary.
+SUMMARY_KEYS = ("loss", "is_best", "is_initial_point", "is_random", "current_epoch")
+# Metrics stored in the summary - everything needed by the epoch filters and the epoch table.
+SUMMARY_METRICS = (
+    "total_trades",
+    "wins",
+    "draws",
+    "losses",
+    "profit_mean",
+    "profit_total",
+    "profit_total_abs",
+    "holding_avg",
+    "holding_avg_s",
+    "max_drawdown_abs",
+    "max_drawdown_account",
+)
+# Key of the summary holding the position of the epoch in the results file.
+OFFSET_KEY = "results_file_offset"
+
+
+def get_index_filename(results_file: Path) -> Path:
+    return results_file.parent / f"{results_file.name}.idx"
+
+
+def summarize_epoch(epoch: dict[str, Any]) -> dict[str, Any]:
+    """
+    Summary of one epoch, structured like the epoch itself.
+    Keys missing in the epoch are missing in the summary as well.
+    """
+    summary = {key: epoch[key] for key in SUMMARY_KEYS if key in epoch}
+    metrics = epoch.get("results_metrics", {})
+    summary["results_metrics"] = {key: metrics[key] for key in SUMMARY_METRICS if key in metrics}
+    return summary
+
+
+def _dump_entry(offset: int, length: int, summary: dict[str, Any]) -> str:
+    summary = {key: value for key, value in summary.items() if key != OFFSET_KEY}
+    return (
+        rapidjson.dumps(
+            [offset, length, summary],
+            default=hyperopt_serializer,
+            number_mode=HYPER_PARAMS_FILE_FORMAT,
+        )
+        + "\n"
+    )
+
+
+class HyperoptResultsIndex:
+    """
+    Offsets and summaries of all epochs in a hyperopt results file.
+    The index file is kept next to the results file. Index files which are missing or
+    don't cover the whole results file (e.g. results written by an older version)
+    are completed by reading the remaining epochs once.
+    """
+
+    def __init__(self, results_file: Path) -> None:
+        self.results_file = results_file
+        self.index_file = get_index_filename(results_file)
+        self.summaries: list[dict[str, Any]] = []
+        self._lengths: list[int] = []
+        self._end = 0
+
+    @staticmethod
+    def append(results_file: Path, entries: Iterable[tuple[int, int, dict[str, Any]]]) -> None:
+        """
+        Add epochs written to the results file to the index.
+        Must be called after the epochs were written, so the index only references
+        complete epochs.
+        :param results_file: Results file the epochs were written to
+        :param entries: Tuples of (position in the results file, length in bytes, summary)
+        """
+        with get_index_filename(results_file).open("a") as f:
+            f.write("".join(_dump_entry(*entry) for entry in entries))
+
+    def load(self) -> None:
+        """
+        Load the index, completing it from the results file where necessary.
+        """
+        file_size = self.results_file.stat().st_size
+        index_valid = self._read_index(file_size)
+        indexed = len(self.summaries)
+        if self._end < file_size:
+            logger.info(f"Indexing epochs in '{self.results_file}'.")
+            self._scan()
+        if not index_valid:
+            self._store(0, "w")
+        elif len(self.summaries) > indexed:
+            self._store(indexed, "a")
+
+    def _add(self, offset: int, length: int, summary: dict[str, Any]) -> None:
+        summary[OFFSET_KEY] = offset
+        self.summaries.append(summary)
+        self._lengths.append(length)
+        self._end = offset + length
+
+    def _read_index(self, file_size: int) -> bool:
+        """
+        Read the index file, up to the first entry which doesn't match the results file.
+        :return: False if the index file contains entries which don't match the results file
+        """
+        if not self.index_file.is_file():
+            return True
+        with self.index_file.open("rb") as f:
+            for line in f:
+                try:
+                    offset, length, summary = rapidjson.loads(line)
+                except (ValueError, TypeError):
+                    return False
+                if offset != self._end or offset + length > file_size:
+                    return False
+                self._add(offset, length, summary)
+        return True
+
+    def _scan(self) -> None:
+        """
+        Read the epochs which are not indexed yet from the results file.
+        """
+        with self.results_file.open("rb") as f:
+            f.seek(self._end)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Epoch which was not completely written, e.g. when hyperopt was killed.
+                    logger.warning(f"Ignoring incomplete last epoch in '{self.results_file}'.")
+                    break
+                self._add(self._end, len(line), summarize_epoch(rapidjson.loads(line)))
+
+    def _store(self, start: int, mode: str) -> None:
+        """
+        Write index entries, starting with entry `start`, to the index file.
+        Failing to write the index only costs time on the next load.
+        """
+        try:
+            with self.index_file.open(mode) as f:
+                for summary, length in zip(
+                    self.summaries[start:], self._lengths[start:], strict=True
+                ):
+                    f.write(_dump_entry(summary[OFFSET_KEY], length, summary))
+        except OSError as e:
+            logger.warning(f"Could not write hyperopt results index '{self.index_file}': {e}")
+
+    def read_epochs(self, summaries: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Read full epochs from the results file.
+        :param summaries: Summaries of the epochs to read
+        :return: List of epochs, in the order of the summaries
+        """
+        epochs = []
+        with self.results_file.open("rb") as f:
+            for summary in summaries:
+                f.seek(summary[OFFSET_KEY])
+                epochs.append(rapidjson.loads(f.readline()))
+        return epochs
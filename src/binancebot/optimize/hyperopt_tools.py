@@ -1,9 +1,7 @@
 import logging
-from collections.abc import Iterator
 from copy import deepcopy
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
 
 import numpy as np
 import rapidjson
@@ -113,23 +111,6 @@ class HyperoptTools:
         else:
             return any(s in config["spaces"] for s in [space, "all", "default"])
 
-    @staticmethod
-    def _read_results(results_file: Path, batch_size: int = 10) -> Iterator[list[Any]]:
-        """
-        Stream hyperopt results from file
-        """
-        import rapidjson
-
-        logger.info(f"Reading epochs from '{results_file}'")
-        with results_file.open("r") as f:
-            data = []
-            for line in f:
-                data += [rapidjson.loads(line)]
-                if len(data) >= batch_size:
-                    yield data
-                    data = []
-        yield data
-
     @staticmethod
     def _test_hyperopt_results_exist(results_file) -> bool:
         if results_file.is_file() and results_file.stat().st_size > 0:
@@ -144,7 +125,15 @@ class HyperoptTools:
             return False
 
     @staticmethod
-    def load_filtered_results(results_file: Path, config: Config) -> tuple[list, int]:
+    def load_filtered_summaries(results_file: Path, config: Config) -> tuple[list, int]:
+        """
+        Load summaries of the epochs matching the configured filters.
+        Summaries are structured like epochs, but only contain the keys needed to list and
+        filter epochs. Use `load_epochs()` to load the full epochs.
+        :return: Tuple of (summaries of filtered epochs, total number of epochs)
+        """
+        from binancebot.optimize.hyperopt_results_index import HyperoptResultsIndex
+
         filteroptions = {
             "only_best": config.get("hyperopt_list_best", False),
             "only_profitable": config.get("hyperopt_list_profitable", False),
@@ -164,23 +153,36 @@ class HyperoptTools:
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
-        epochs = []
-        total_epochs = 0
-        for epochs_tmp in HyperoptTools._read_results(results_file):
-            if total_epochs == 0 and epochs_tmp[0].get("is_best") is None:
-                raise OperationalException(
-                    "The file with HyperoptTools results is incompatible with this version "
-                    "of Freqtrade and cannot be loaded."
-                )
-            total_epochs += len(epochs_tmp)
-            epochs += hyperopt_filter_epochs(epochs_tmp, filteroptions, log=False)
-
+        logger.info(f"Reading epochs from '{results_file}'")
+        index = HyperoptResultsIndex(results_file)
+        index.load()
+        summaries = index.summaries
+        if summaries and summaries[0].get("is_best") is None:
+            raise OperationalException(
+                "The file with HyperoptTools results is incompatible with this version "
+                "of Freqtrade and cannot be loaded."
+            )
+        total_epochs = len(summaries)
         logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
 
-        # Final filter run ...
-        epochs = hyperopt_filter_epochs(epochs, filteroptions, log=True)
+        return hyperopt_filter_epochs(summaries, filteroptions, log=True), total_epochs
 
-        return epochs, total_epochs
+    @staticmethod
+    def load_epochs(results_file: Path, summaries: list) -> list:
+        """
+        Load the full epochs for epoch summaries.
+        :param results_file: Results file the summaries were loaded from
+        :param summaries: Summaries as returned by `load_filtered_summaries()`
+        :return: List of epochs, in the order of the summaries
+        """
+        from binancebot.optimize.hyperopt_results_index import HyperoptResultsIndex
+
+        return HyperoptResultsIndex(results_file).read_epochs(summaries)
+
+    @staticmethod
+    def load_filtered_results(results_file: Path, config: Config) -> tuple[list, int]:
+        summaries, total_epochs = HyperoptTools.load_filtered_summaries(results_file, config)
+        return HyperoptTools.load_epochs(results_file, summaries), total_epochs
 
     @staticmethod
     def show_epoch_details(
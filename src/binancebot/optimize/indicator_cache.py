@@ -0,0 +1,200 @@
+"""
+Persistent on-disk cache for populated indicators.
+
+Populating indicators is the most expensive fixed step of backtesting and hyperopt - but it
+only depends on the indicator code, the strategy parameters and the candles of a pair.
+Analyzed dataframes are stored as uncompressed feather files, so they can be memory-mapped
+when loading.
+"""
+
+import hashlib
+import inspect
+import logging
+from datetime import timedelta
+from pathlib import Path
+
+import rapidjson
+from pandas import DataFrame, RangeIndex
+from pandas.util import hash_pandas_object
+from pyarrow import ArrowException, feather
+
+from binancebot import __version__, constants
+from binancebot.constants import Config
+from binancebot.data.history import get_datahandler
+from binancebot.strategy.interface import IStrategy
+from binancebot.util import dt_now
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_MAX_AGE = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(weeks=4),
+}
+
+
+def get_informative_data_fingerprints(strategy: IStrategy) -> list[list[str | None]]:
+    """
+    Fingerprints of the stored candles of all informative pairs.
+    Informative candles are loaded by populate_indicators, so they are not part of the
+    candle data fingerprint of the analyzed pair.
+    :param strategy: strategy object - with the dataprovider assigned.
+    :return: List of [pair, timeframe, candle type, fingerprint]
+    """
+    informative_pairs = sorted(strategy.gather_informative_pairs())
+    if not informative_pairs:
+        return []
+    config = strategy.config
+    datahandler = get_datahandler(config["datadir"], config.get("dataformat_ohlcv"))
+    base_timeframe = config.get("ohlcv_base_timeframe")
+    fingerprints: list[list[str | None]] = []
+    for pair, timeframe, candle_type in informative_pairs:
+        # Candles may be resampled from the base timeframe.
+        for tf in dict.fromkeys(tf for tf in (timeframe, base_timeframe) if tf):
+            fingerprints.append(
+                [pair, tf, candle_type, datahandler.ohlcv_data_fingerprint(pair, tf, candle_type)]
+            )
+    return fingerprints
+
+
+def get_indicator_code_hash(strategy: IStrategy) -> str:
+    """
+    Generate a hash of everything populate_indicators depends on - the strategy file,
+    the strategy parameters and the stored candles of informative pairs.
+    :param strategy: strategy object.
+    :return: hex string hash.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    digest.update(f"{__version__}-{strategy.get_strategy_name()}".encode())
+    config = {
+        key: strategy.config.get(key)
+        for key in ("timeframe", "stake_currency", "trading_mode", "margin_mode")
+    }
+    config["params"] = {name: param.value for name, param in strategy.enumerate_parameters()}
+    config["informative_data"] = get_informative_data_fingerprints(strategy)
+    digest.update(rapidjson.dumps(config, default=str).encode("utf-8"))
+
+    with Path(strategy.__file__).open("rb") as fp:
+        digest.update(fp.read())
+    # populate_indicators may be inherited from a class in another file.
+    functions = [type(strategy).populate_indicators, type(strategy).informative_pairs]
+    functions.extend(populate_fn for _, populate_fn in strategy._ft_informative)
+    for fn in functions:
+        try:
+            digest.update(inspect.getsource(fn).encode("utf-8"))
+        except (OSError, TypeError):
+            # Source not available - covered by the strategy file.
+            pass
+    return digest.hexdigest().lower()
+
+
+def get_dataframe_fingerprint(dataframe: DataFrame) -> str:
+    """
+    Generate a hash of the candle data of one pair.
+    :param dataframe: Dataframe containing candle (OHLCV) data
+    :return: hex string hash.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    digest.update(",".join(map(str, dataframe.columns)).encode("utf-8"))
+    digest.update(hash_pandas_object(dataframe, index=False).to_numpy().tobytes())
+    return digest.hexdigest().lower()
+
+
+class IndicatorCache:
+    """
+    Cache of analyzed dataframes on disk, keyed by indicator code hash,
+    pair, timeframe and candle data fingerprint.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._cache_dir: Path = config["user_data_dir"] / "indicator_cache"
+        self._max_age = CACHE_MAX_AGE[config["indicator_cache"]]
+        self._max_size = (
+            config.get("indicator_cache_size", constants.INDICATOR_CACHE_SIZE_DEFAULT) * 1024 * 1024
+        )
+        self._timeframe: str = config["timeframe"]
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self.evict()
+
+    def _get_filename(self, code_hash: str, pair: str, dataframe: DataFrame) -> Path:
+        key = hashlib.sha1(  # noqa: S324
+            f"{code_hash}-{pair}-{self._timeframe}-{get_dataframe_fingerprint(dataframe)}".encode()
+        ).hexdigest()
+        return self._cache_dir / f"{key}.feather"
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs, reusing cached results where possible.
+        Results for pairs not in the cache are computed by the strategy and stored.
+        :param strategy: Strategy to populate indicators with
+        :param data: Dictionary with format {pair: dataframe} containing candle data
+        :return: Dictionary with format {pair: dataframe} containing analyzed data
+        """
+        code_hash = get_indicator_code_hash(strategy)
+        files = {pair: self._get_filename(code_hash, pair, df) for pair, df in data.items()}
+        res: dict[str, DataFrame] = {}
+        for pair, filename in files.items():
+            if (cached := self._load(filename)) is not None:
+                res[pair] = cached
+
+        missing = {pair: df for pair, df in data.items() if pair not in res}
+        logger.info(
+            f"Loaded indicators for {len(res)} of {len(data)} pairs from the indicator cache."
+        )
+        if missing:
+            populated = strategy.advise_all_indicators(missing)
+            for pair, dataframe in populated.items():
+                self._store(files[pair], dataframe)
+            res.update(populated)
+            self.evict()
+        # Keep pair order of the input data
+        return {pair: res[pair] for pair in data}
+
+    @staticmethod
+    def _load(filename: Path) -> DataFrame | None:
+        if not filename.is_file():
+            return None
+        try:
+            dataframe = feather.read_table(filename, memory_map=True).to_pandas()
+        except (OSError, ArrowException) as e:
+            logger.warning(f"Could not load cached indicators from {filename}: {e}")
+            filename.unlink(missing_ok=True)
+            return None
+        # Mark as recently used for eviction.
+        filename.touch()
+        return dataframe
+
+    @staticmethod
+    def _store(filename: Path, dataframe: DataFrame) -> None:
+        if not isinstance(dataframe.index, RangeIndex) or dataframe.index.start != 0:
+            # Feather only supports the default index.
+            return
+        tmp_file = filename.with_suffix(".tmp")
+        try:
+            dataframe.to_feather(tmp_file, compression="uncompressed")
+            tmp_file.replace(filename)
+        except (OSError, ValueError, ArrowException) as e:
+            logger.warning(f"Could not store indicators in the indicator cache: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """
+        Remove cache entries older than the configured age, as well as the least recently used
+        entries exceeding the configured cache size.
+        """
+        entries = sorted(
+            ((f, f.stat()) for f in self._cache_dir.glob("*.feather")),
+            key=lambda entry: entry[1].st_mtime,
+            reverse=True,
+        )
+        min_mtime = (dt_now() - self._max_age).timestamp()
+        total_size = 0
+        for filename, stat in entries:
+            if stat.st_mtime < min_mtime or total_size + stat.st_size > self._max_size:
+                logger.debug(f"Evicting {filename} from the indicator cache.")
+                filename.unlink(missing_ok=True)
+            else:
+                total_size += stat.st_size
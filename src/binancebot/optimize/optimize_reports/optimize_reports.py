@@ -28,6 +28,9 @@ from binancebot.util import decimals_per_coin, fmt_coin, format_duration, get_dr
 
 logger = logging.getLogger(__name__)
 
+# Columns used by _generate_result_line() - per group metrics only copy these columns.
+RESULT_LINE_COLUMNS = ["profit_abs", "profit_ratio", "trade_duration", "close_date"]
+
 
 def generate_trade_signal_candles(
     preprocessed_df: dict[str, DataFrame], bt_results: BacktestContentType, date_col: str
@@ -83,14 +86,18 @@ def _generate_result_line(
     """
     Generate one result dict, with "first_column" as key.
     """
+    profit_abs = result["profit_abs"]
+    profit_total_abs = profit_abs.sum()
+    winning_profit = profit_abs[profit_abs > 0]
+    losing_profit = profit_abs[profit_abs < 0]
+    profit_mean = result["profit_ratio"].mean() if len(result) > 0 else 0.0
     # (end-capital - starting capital) / starting capital
-    profit_total = result["profit_abs"].sum() / starting_balance
+    profit_total = profit_total_abs / starting_balance
     backtest_days = (max_date - min_date).days or 1
-    final_balance = starting_balance + result["profit_abs"].sum()
+    final_balance = starting_balance + profit_total_abs
     expectancy, expectancy_ratio = calculate_expectancy(result)
-    winning_profit = result.loc[result["profit_abs"] > 0, "profit_abs"].sum()
-    losing_profit = result.loc[result["profit_abs"] < 0, "profit_abs"].sum()
-    profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
+    losing_profit_sum = losing_profit.sum()
+    profit_factor = winning_profit.sum() / abs(losing_profit_sum) if losing_profit_sum else 0.0
 
     try:
         drawdown = calculate_max_drawdown(
@@ -103,11 +110,9 @@ def _generate_result_line(
     return {
         "key": first_column,
         "trades": len(result),
-        "profit_mean": result["profit_ratio"].mean() if len(result) > 0 else 0.0,
-        "profit_mean_pct": (
-            round(result["profit_ratio"].mean() * 100.0, 2) if len(result) > 0 else 0.0
-        ),
-        "profit_total_abs": result["profit_abs"].sum(),
+        "profit_mean": profit_mean,
+        "profit_mean_pct": round(profit_mean * 100.0, 2) if len(result) > 0 else 0.0,
+        "profit_total_abs": profit_total_abs,
         "profit_total": profit_total,
         "profit_total_pct": round(profit_total * 100.0, 2),
         "duration_avg": (
@@ -121,16 +126,16 @@ def _generate_result_line(
         # 'duration_min': str(timedelta(
         #                     minutes=round(result['trade_duration'].min()))
         #                     ) if not result.empty else '0:00',
-        "wins": len(result[result["profit_abs"] > 0]),
-        "draws": len(result[result["profit_abs"] == 0]),
-        "losses": len(result[result["profit_abs"] < 0]),
-        "winrate": len(result[result["profit_abs"] > 0]) / len(result) if len(result) else 0.0,
+        "wins": len(winning_profit),
+        "draws": int((profit_abs == 0).sum()),
+        "losses": len(losing_profit),
+        "winrate": len(winning_profit) / len(result) if len(result) else 0.0,
         "cagr": calculate_cagr(backtest_days, starting_balance, final_balance),
         "expectancy": expectancy,
         "expectancy_ratio": expectancy_ratio,
         "sortino": calculate_sortino(result, min_date, max_date, starting_balance),
         "sharpe": calculate_sharpe(result, min_date, max_date, starting_balance),
-        "calmar": calculate_calmar(result, min_date, max_date, starting_balance),
+        "calmar": calculate_calmar(result, min_date, max_date, starting_balance, drawdown=drawdown),
         "sqn": calculate_sqn(result, starting_balance),
         "profit_factor": profit_factor,
         "max_drawdown_account": drawdown.relative_account_drawdown if drawdown else 0.0,
@@ -165,9 +170,13 @@ def generate_pair_metrics(  #
     """
 
     tabular_data = []
+    trades = results[RESULT_LINE_COLUMNS]
+    # Group once instead of filtering all trades for every pair
+    pair_indices = results.groupby("pair").indices
+    no_trades = np.array([], dtype=np.intp)
 
     for pair in pairlist:
-        result = results[results["pair"] == pair]
+        result = trades.take(pair_indices.get(pair, no_trades))
         if skip_nan and result["profit_abs"].isnull().all():
             continue
 
@@ -180,7 +189,7 @@ def generate_pair_metrics(  #
 
     # Append Total
     tabular_data.append(
-        _generate_result_line(results, min_date, max_date, starting_balance, "TOTAL")
+        _generate_result_line(trades, min_date, max_date, starting_balance, "TOTAL")
     )
 
     return tabular_data
@@ -203,11 +212,11 @@ def generate_tag_metrics(
     """
 
     tabular_data = []
+    tags_list = tag_type if isinstance(tag_type, list) else [tag_type]
 
-    if all(
-        tag in results.columns for tag in (tag_type if isinstance(tag_type, list) else [tag_type])
-    ):
-        for tags, group in results.groupby(tag_type):
+    if all(tag in results.columns for tag in tags_list):
+        trades = results[RESULT_LINE_COLUMNS + tags_list]
+        for tags, group in trades.groupby(tag_type):
             if skip_nan and group["profit_abs"].isnull().all():
                 continue
 
@@ -220,7 +229,7 @@ def generate_tag_metrics(
 
         # Append Total
         tabular_data.append(
-            _generate_result_line(results, min_date, max_date, starting_balance, "TOTAL")
+            _generate_result_line(trades, min_date, max_date, starting_balance, "TOTAL")
         )
         return tabular_data
     else:
@@ -262,18 +271,19 @@ def _get_resample_from_period(period: str) -> str:
     raise ValueError(f"Period {period} is not supported.")
 
 
-def _calculate_stats_for_period(data: DataFrame) -> dict[str, Any]:
-    profit_abs = data["profit_abs"].sum().round(10)
-    wins = sum(data["profit_abs"] > 0)
-    draws = sum(data["profit_abs"] == 0)
-    losses = sum(data["profit_abs"] < 0)
+def _calculate_stats_for_period(profit_abs: Series) -> dict[str, Any]:
+    profit = profit_abs.sum().round(10)
+    values = profit_abs.to_numpy()
+    wins = int(np.count_nonzero(values > 0))
+    draws = int(np.count_nonzero(values == 0))
+    losses = int(np.count_nonzero(values < 0))
     trades = wins + draws + losses
-    winning_profit = data.loc[data["profit_abs"] > 0, "profit_abs"].sum()
-    losing_profit = data.loc[data["profit_abs"] < 0, "profit_abs"].sum()
+    winning_profit = profit_abs[profit_abs > 0].sum()
+    losing_profit = profit_abs[profit_abs < 0].sum()
     profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
 
     return {
-        "profit_abs": profit_abs,
+        "profit_abs": profit,
         "wins": wins,
         "draws": draws,
         "losses": losses,
@@ -297,13 +307,13 @@ def generate_periodic_breakdown_stats(
 
         stats = []
         for day_num in range(7):
-            day_data = results[results["weekday"] == day_num]
+            day_data = results.loc[results["weekday"] == day_num, "profit_abs"]
             if len(day_data) > 0:
                 period_stats = _calculate_stats_for_period(day_data)
                 stats.append({"date": day_names[day_num], "date_ts": day_num, **period_stats})
     else:
         resample_period = _get_resample_from_period(period)
-        resampled = results.resample(resample_period, on="close_date")
+        resampled = results.resample(resample_period, on="close_date")["profit_abs"]
 
         stats = []
         for name, period_data in resampled:
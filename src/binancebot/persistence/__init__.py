@@ -4,7 +4,7 @@ from binancebot.persistence.custom_data import CustomDataWrapper
 from binancebot.persistence.key_value_store import KeyStoreKeys, KeyValueStore
 from binancebot.persistence.models import init_db
 from binancebot.persistence.pairlock_middleware import PairLocks
-from binancebot.persistence.trade_model import LocalTrade, Order, Trade
+from binancebot.persistence.trade_model import LocalOrder, LocalTrade, Order, Trade
 from binancebot.persistence.usedb_context import (
     FtNoDBContext,
     disable_database_use,
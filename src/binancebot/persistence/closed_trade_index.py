@@ -0,0 +1,96 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from binancebot.persistence.trade_model import LocalTrade
+
+
+class _TradeWindow:
+    """
+    Closed trades sorted by close date, with the order in which they were closed.
+    """
+
+    def __init__(self) -> None:
+        self.close_dates: list[datetime] = []
+        self.seqs: list[int] = []
+        self.trades: list[LocalTrade] = []
+        # True once a trade was closed before an already indexed trade
+        self.reordered = False
+
+    def add(self, seq: int, trade: "LocalTrade") -> None:
+        close_date = trade.close_date
+        if not self.close_dates or close_date >= self.close_dates[-1]:
+            self.close_dates.append(close_date)
+            self.seqs.append(seq)
+            self.trades.append(trade)
+            return
+        idx = bisect_right(self.close_dates, close_date)
+        self.close_dates.insert(idx, close_date)
+        self.seqs.insert(idx, seq)
+        self.trades.insert(idx, trade)
+        self.reordered = True
+
+    def closed_after(self, close_date: datetime) -> tuple[list[int], list["LocalTrade"]]:
+        idx = bisect_right(self.close_dates, close_date)
+        return self.seqs[idx:], self.trades[idx:]
+
+
+class ClosedTradeIndex:
+    """
+    Index of closed backtest trades.
+    Trades are kept sorted by close date - in total, per pair, per exit reason and per pair and
+    exit reason - so lookback windows are found by bisection instead of filtering all trades.
+    Trades are added as they are closed, so adding is an append in nearly all cases.
+    """
+
+    def __init__(self) -> None:
+        self._seq = 0
+        self._windows: dict[tuple[str | None, str | None], _TradeWindow] = {}
+
+    def add(self, trade: "LocalTrade") -> None:
+        """
+        Add a closed trade. Trades without close date are not indexed.
+        """
+        if not trade.close_date:
+            return
+        self._seq += 1
+        exit_reason = str(trade.exit_reason)
+        for key in (
+            (None, None),
+            (trade.pair, None),
+            (None, exit_reason),
+            (trade.pair, exit_reason),
+        ):
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = _TradeWindow()
+            window.add(self._seq, trade)
+
+    def closed_after(
+        self,
+        close_date: datetime,
+        *,
+        pair: str | None = None,
+        exit_reasons: Sequence[str] | None = None,
+    ) -> list["LocalTrade"]:
+        """
+        Trades closed after close_date (trade.close_date > close_date).
+        :param close_date: Start of the lookback window
+        :param pair: Filter by pair
+        :param exit_reasons: Filter by exit reason
+        :return: List of trades, in the order in which they were closed
+        """
+        windows = [
+            window
+            for reason in (exit_reasons if exit_reasons is not None else (None,))
+            if (window := self._windows.get((pair or None, reason))) is not None
+        ]
+        if len(windows) == 1 and not windows[0].reordered:
+            return windows[0].closed_after(close_date)[1]
+        matches = []
+        for window in windows:
+            matches.extend(zip(*window.closed_after(close_date), strict=True))
+        return [trade for _, trade in sorted(matches, key=lambda match: match[0])]
@@ -1,4 +1,6 @@
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from collections.abc import Sequence
 from datetime import UTC, datetime
 
@@ -11,6 +13,32 @@ from binancebot.persistence.models import PairLock
 logger = logging.getLogger(__name__)
 
 
+class _LockWindow:
+    """
+    Locks of one pair and side, sorted by lock end time - in-memory mode only.
+    Expired locks are skipped by bisection, so lookups only touch locks ending after "now".
+    """
+
+    def __init__(self) -> None:
+        self.end_times: list[datetime] = []
+        self.locks: list[tuple[int, PairLock]] = []
+
+    def add(self, seq: int, lock: PairLock) -> None:
+        idx = bisect_right(self.end_times, lock.lock_end_time)
+        self.end_times.insert(idx, lock.lock_end_time)
+        self.locks.insert(idx, (seq, lock))
+
+    def get_locks(self, now: datetime) -> list[tuple[int, PairLock]]:
+        """
+        Active locks ending at or after now (lock_end_time >= now)
+        """
+        if not self.end_times or self.end_times[-1] < now:
+            # Longest lock already expired
+            return []
+        idx = bisect_left(self.end_times, now)
+        return [entry for entry in self.locks[idx:] if entry[1].active is True]
+
+
 class PairLocks:
     """
     Pairlocks middleware class
@@ -20,6 +48,8 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    # In-memory mode - locks by pair and side
+    _lock_windows: dict[str, dict[str, _LockWindow]] = defaultdict(dict)
 
     timeframe: str = ""
 
@@ -30,6 +60,7 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._lock_windows = defaultdict(dict)
 
     @staticmethod
     def lock_pair(
@@ -62,6 +93,10 @@ class PairLocks:
             PairLock.session.add(lock)
             PairLock.session.commit()
         else:
+            window = PairLocks._lock_windows[pair].get(side)
+            if window is None:
+                window = PairLocks._lock_windows[pair][side] = _LockWindow()
+            window.add(len(PairLocks.locks), lock)
             PairLocks.locks.append(lock)
         return lock
 
@@ -81,18 +116,22 @@ class PairLocks:
 
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
-        else:
-            locks = [
+        elif pair is None:
+            return [
                 lock
                 for lock in PairLocks.locks
                 if (
                     lock.lock_end_time >= now
                     and lock.active is True
-                    and (pair is None or lock.pair == pair)
                     and (side is None or lock.side == "*" or lock.side == side)
                 )
             ]
-            return locks
+        else:
+            windows = PairLocks._lock_windows.get(pair, {})
+            sides = windows.keys() if side is None else {"*", side}
+            matches = [entry for s in sides if s in windows for entry in windows[s].get_locks(now)]
+            # Keep lock creation order
+            return [lock for _, lock in sorted(matches, key=lambda entry: entry[0])]
 
     @staticmethod
     def get_pair_longest_lock(
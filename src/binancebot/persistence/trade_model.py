@@ -44,9 +44,11 @@ from binancebot.exchange import (
     price_to_precision,
 )
 from binancebot.exchange.exchange_types import CcxtOrder
+
 # from binancebot.leverage import interest  # Module not available
 from binancebot.misc import safe_value_fallback
 from binancebot.persistence.base import ModelBase, SessionType
+from binancebot.persistence.closed_trade_index import ClosedTradeIndex
 from binancebot.persistence.custom_data import CustomDataWrapper, _CustomData
 from binancebot.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
@@ -62,60 +64,81 @@ class ProfitStruct:
     total_profit_ratio: float
 
 
-class Order(ModelBase):
+class LocalOrder:
     """
-    Order database model
-    Keeps a record of all orders placed on the exchange
-
-    One to many relationship with Trades:
-      - One trade can have many orders
-      - One Order can only be associated with one Trade
-
-    Mirrors CCXT Order structure
+    Order model without database binding.
+    Used in backtesting - must be aligned to Order model!
+    Backtesting creates and discards many orders - so attributes are stored in slots.
     """
 
-    __tablename__ = "orders"
-    __allow_unmapped__ = True
-    session: ClassVar[SessionType]
-
-    # Uniqueness should be ensured over pair, order_id
-    # its likely that order_id is unique per Pair on some exchanges.
-    __table_args__ = (UniqueConstraint("ft_pair", "order_id", name="_order_pair_order_id"),)
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    ft_trade_id: Mapped[int] = mapped_column(Integer, ForeignKey("trades.id"), index=True)
+    __slots__ = (
+        "_trade_bt",
+        "amount",
+        "average",
+        "cost",
+        "filled",
+        "ft_amount",
+        "ft_cancel_reason",
+        "ft_fee_base",
+        "ft_is_open",
+        "ft_order_side",
+        "ft_order_tag",
+        "ft_pair",
+        "ft_price",
+        "ft_trade_id",
+        "funding_fee",
+        "id",
+        "order_date",
+        "order_filled_date",
+        "order_id",
+        "order_type",
+        "order_update_date",
+        "price",
+        "remaining",
+        "side",
+        "status",
+        "stop_price",
+        "symbol",
+    )
 
-    _trade_live: Mapped["Trade"] = relationship("Trade", back_populates="orders", lazy="immediate")
-    _trade_bt: "LocalTrade" = None  # type: ignore
+    id: int
+    ft_trade_id: int
+    _trade_bt: "LocalTrade"
 
     # order_side can only be 'buy', 'sell' or 'stoploss'
-    ft_order_side: Mapped[str] = mapped_column(String(25), nullable=False)
-    ft_pair: Mapped[str] = mapped_column(String(25), nullable=False)
-    ft_is_open: Mapped[bool] = mapped_column(nullable=False, default=True, index=True)
-    ft_amount: Mapped[float] = mapped_column(Float(), nullable=False)
-    ft_price: Mapped[float] = mapped_column(Float(), nullable=False)
-    ft_cancel_reason: Mapped[str] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
-
-    order_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    status: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    symbol: Mapped[str | None] = mapped_column(String(25), nullable=True)
-    order_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    side: Mapped[str] = mapped_column(String(25), nullable=True)
-    price: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    average: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    amount: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    filled: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    remaining: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    cost: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    stop_price: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    order_date: Mapped[datetime] = mapped_column(nullable=True, default=dt_now)
-    order_filled_date: Mapped[datetime | None] = mapped_column(nullable=True)
-    order_update_date: Mapped[datetime | None] = mapped_column(nullable=True)
-    funding_fee: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    ft_order_side: str
+    ft_pair: str
+    ft_is_open: bool
+    ft_amount: float
+    ft_price: float
+    ft_cancel_reason: str | None
+
+    order_id: str
+    status: str | None
+    symbol: str | None
+    order_type: str | None
+    side: str
+    price: float | None
+    average: float | None
+    amount: float | None
+    filled: float | None
+    remaining: float | None
+    cost: float | None
+    stop_price: float | None
+    order_date: datetime
+    order_filled_date: datetime | None
+    order_update_date: datetime | None
+    funding_fee: float | None
 
     # Fee if paid in base currency
-    ft_fee_base: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    ft_order_tag: Mapped[str | None] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
+    ft_fee_base: float | None
+    ft_order_tag: str | None
+
+    def __init__(self, **kwargs):
+        for key in LocalOrder.__slots__:
+            setattr(self, key, None)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     @property
     def order_date_utc(self) -> datetime:
@@ -166,7 +189,7 @@ class Order(ModelBase):
 
     @property
     def trade(self) -> "LocalTrade":
-        return self._trade_bt or self._trade_live
+        return self._trade_bt
 
     @property
     def stake_amount(self) -> float:
@@ -311,6 +334,7 @@ class Order(ModelBase):
         # Assumes backtesting will use date_last_filled_utc to calculate future funding fees.
         self.funding_fee = trade.funding_fee_running
         trade.funding_fee_running = 0.0
+        LocalTrade.mark_bt_trade_changed(trade)
 
         if self.ft_order_side == trade.entry_side and self.price:
             trade.open_rate = self.price
@@ -320,6 +344,66 @@ class Order(ModelBase):
                 trade.is_stop_loss_trailing = False
             trade.adjust_stop_loss(trade.open_rate, trade.stop_loss_pct)
 
+
+class Order(ModelBase, LocalOrder):
+    """
+    Order database model
+    Keeps a record of all orders placed on the exchange
+
+    One to many relationship with Trades:
+      - One trade can have many orders
+      - One Order can only be associated with one Trade
+
+    Mirrors CCXT Order structure
+    """
+
+    __tablename__ = "orders"
+    __allow_unmapped__ = True
+    session: ClassVar[SessionType]
+
+    # Uniqueness should be ensured over pair, order_id
+    # its likely that order_id is unique per Pair on some exchanges.
+    __table_args__ = (UniqueConstraint("ft_pair", "order_id", name="_order_pair_order_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ft_trade_id: Mapped[int] = mapped_column(Integer, ForeignKey("trades.id"), index=True)
+
+    _trade_live: Mapped["Trade"] = relationship("Trade", back_populates="orders", lazy="immediate")
+    _trade_bt: "LocalTrade" = None  # type: ignore
+
+    # order_side can only be 'buy', 'sell' or 'stoploss'
+    ft_order_side: Mapped[str] = mapped_column(String(25), nullable=False)
+    ft_pair: Mapped[str] = mapped_column(String(25), nullable=False)
+    ft_is_open: Mapped[bool] = mapped_column(nullable=False, default=True, index=True)
+    ft_amount: Mapped[float] = mapped_column(Float(), nullable=False)
+    ft_price: Mapped[float] = mapped_column(Float(), nullable=False)
+    ft_cancel_reason: Mapped[str] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
+
+    order_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    status: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    symbol: Mapped[str | None] = mapped_column(String(25), nullable=True)
+    order_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    side: Mapped[str] = mapped_column(String(25), nullable=True)
+    price: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    average: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    amount: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    filled: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    remaining: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    cost: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    stop_price: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    order_date: Mapped[datetime] = mapped_column(nullable=True, default=dt_now)
+    order_filled_date: Mapped[datetime | None] = mapped_column(nullable=True)
+    order_update_date: Mapped[datetime | None] = mapped_column(nullable=True)
+    funding_fee: Mapped[float | None] = mapped_column(Float(), nullable=True)
+
+    # Fee if paid in base currency
+    ft_fee_base: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    ft_order_tag: Mapped[str | None] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
+
+    @property
+    def trade(self) -> "LocalTrade":
+        return self._trade_bt or self._trade_live
+
     @staticmethod
     def update_orders(orders: list["Order"], order: CcxtOrder):
         """
@@ -390,8 +474,12 @@ class LocalTrade:
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
+    # Closed trades - indexed by close date for lookback queries (protections)
+    bt_trades_closed_index: ClosedTradeIndex = ClosedTradeIndex()
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
+    # Trades changed since the wallets were last updated - used as an ordered set
+    bt_trades_changed: dict["LocalTrade", None] = {}
     realized_profit: float = 0
 
     id: int = 0
@@ -764,9 +852,13 @@ class LocalTrade:
         """
         Resets all trades. Only active for backtesting mode.
         """
+        # Wallets drop the balances of discarded open trades on their next update
+        for trade in LocalTrade.bt_trades_open:
+            LocalTrade.mark_bt_trade_changed(trade)
         LocalTrade.bt_trades = []
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
+        LocalTrade.bt_trades_closed_index = ClosedTradeIndex()
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
 
@@ -1441,6 +1533,7 @@ class LocalTrade:
         is_open: bool | None = None,
         open_date: datetime | None = None,
         close_date: datetime | None = None,
+        exit_reasons: Sequence[str] | None = None,
     ) -> list["LocalTrade"]:
         """
         Helper function to query Trades.
@@ -1453,10 +1546,20 @@ class LocalTrade:
         :param open_date: Filter by open_date (filters via trade.open_date > input)
         :param close_date: Filter by close_date (filters via trade.close_date > input)
                            Will implicitly only return closed trades.
+        :param exit_reasons: Filter by exit reason
         :return: unsorted List[Trade]
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            # Lookback window on closed trades - use the index instead of filtering all trades
+            sel_trades = LocalTrade.bt_trades_closed_index.closed_after(
+                close_date, pair=pair, exit_reasons=exit_reasons
+            )
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
@@ -1475,6 +1578,8 @@ class LocalTrade:
             sel_trades = [
                 trade for trade in sel_trades if trade.close_date and trade.close_date > close_date
             ]
+        if exit_reasons is not None:
+            sel_trades = [trade for trade in sel_trades if trade.exit_reason in exit_reasons]
 
         return sel_trades
 
@@ -1484,7 +1589,9 @@ class LocalTrade:
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
         LocalTrade.bt_trades.append(trade)
+        LocalTrade.bt_trades_closed_index.add(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
+        LocalTrade.mark_bt_trade_changed(trade)
 
     @staticmethod
     def add_bt_trade(trade):
@@ -1492,14 +1599,25 @@ class LocalTrade:
             LocalTrade.bt_trades_open.append(trade)
             LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
             LocalTrade.bt_open_open_trade_count += 1
+            LocalTrade.mark_bt_trade_changed(trade)
         else:
             LocalTrade.bt_trades.append(trade)
+            LocalTrade.bt_trades_closed_index.add(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
+        LocalTrade.mark_bt_trade_changed(trade)
+
+    @staticmethod
+    def mark_bt_trade_changed(trade):
+        """
+        Record a change of the balance of an open backtest trade - caused by adding, filling or
+        cancelling orders - so wallets update incrementally.
+        """
+        LocalTrade.bt_trades_changed[trade] = None
 
     @staticmethod
     def get_open_trades() -> list[Any]:
@@ -1776,6 +1894,7 @@ class Trade(ModelBase, LocalTrade):
         is_open: bool | None = None,
         open_date: datetime | None = None,
         close_date: datetime | None = None,
+        exit_reasons: Sequence[str] | None = None,
     ) -> list["LocalTrade"]:
         """
         Helper function to query Trades.
@@ -1787,6 +1906,7 @@ class Trade(ModelBase, LocalTrade):
         :param open_date: Filter by open_date (filters via trade.open_date > input)
         :param close_date: Filter by close_date (filters via trade.close_date > input)
                            and will implicitly only return closed trades.
+        :param exit_reasons: Filter by exit reason
         :return: unsorted List[Trade]
         """
         if Trade.use_db:
@@ -1799,10 +1919,16 @@ class Trade(ModelBase, LocalTrade):
                 trade_filter.append(Trade.close_date > close_date)
             if is_open is not None:
                 trade_filter.append(Trade.is_open.is_(is_open))
+            if exit_reasons is not None:
+                trade_filter.append(Trade.exit_reason.in_(exit_reasons))
             return cast(list[LocalTrade], Trade.get_trades(trade_filter).all())
         else:
             return LocalTrade.get_trades_proxy(
-                pair=pair, is_open=is_open, open_date=open_date, close_date=close_date
+                pair=pair,
+                is_open=is_open,
+                open_date=open_date,
+                close_date=close_date,
+                exit_reasons=exit_reasons,
             )
 
     @staticmethod
@@ -10,6 +10,13 @@ from binancebot.plugins.protections import IProtection, ProtectionReturn
 
 logger = logging.getLogger(__name__)
 
+STOPLOSS_EXIT_REASONS = (
+    ExitType.TRAILING_STOP_LOSS.value,
+    ExitType.STOP_LOSS.value,
+    ExitType.STOPLOSS_ON_EXCHANGE.value,
+    ExitType.LIQUIDATION.value,
+)
+
 
 class StoplossGuard(IProtection):
     has_global_stop: bool = True
@@ -49,21 +56,16 @@ class StoplossGuard(IProtection):
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
 
-        trades1 = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
+        trades1 = Trade.get_trades_proxy(
+            pair=pair,
+            is_open=False,
+            close_date=look_back_until,
+            exit_reasons=STOPLOSS_EXIT_REASONS,
+        )
         trades = [
             trade
             for trade in trades1
-            if (
-                str(trade.exit_reason)
-                in (
-                    ExitType.TRAILING_STOP_LOSS.value,
-                    ExitType.STOP_LOSS.value,
-                    ExitType.STOPLOSS_ON_EXCHANGE.value,
-                    ExitType.LIQUIDATION.value,
-                )
-                and trade.close_profit
-                and trade.close_profit < self._profit_limit
-            )
+            if trade.close_profit and trade.close_profit < self._profit_limit
         ]
 
         if self._only_per_side:
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
 
+from joblib import Parallel, delayed
 from pandas import DataFrame
 from pydantic import ValidationError
 
@@ -1740,14 +1741,26 @@ class IStrategy(ABC, HyperStrategyMixin):
         Also copy on output to avoid PerformanceWarnings pandas 1.3.0 started to show.
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
+        Pairs are populated concurrently in a thread pool if `indicator_jobs` is configured.
         """
-        res = {}
-        for pair, pair_data in data.items():
-            validator = StrategyResultValidator(
-                pair_data, warn_only=not self.disable_dataframe_checks
+        jobs = self.config.get("indicator_jobs", 1)
+        if jobs != 1 and len(data) > 1:
+            populated = Parallel(n_jobs=jobs, prefer="threads")(
+                delayed(self._advise_pair_indicators)(pair, pair_data)
+                for pair, pair_data in data.items()
             )
-            res[pair] = self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
-            validator.assert_df(res[pair])
+            return dict(zip(data.keys(), populated, strict=True))
+        return {
+            pair: self._advise_pair_indicators(pair, pair_data) for pair, pair_data in data.items()
+        }
+
+    def _advise_pair_indicators(self, pair: str, pair_data: DataFrame) -> DataFrame:
+        """
+        Populates indicators for one pair - see advise_all_indicators.
+        """
+        validator = StrategyResultValidator(pair_data, warn_only=not self.disable_dataframe_checks)
+        res = self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
+        validator.assert_df(res)
         return res
 
     def ft_advise_signals(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -3,7 +3,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Literal, NamedTuple
+from typing import Any, Literal, NamedTuple
 
 from binancebot.constants import UNLIMITED_STAKE_AMOUNT, Config, IntOrInf
 from binancebot.enums import RunMode, TradingMode
@@ -33,6 +33,19 @@ class PositionWallet(NamedTuple):
     side: str = "long"
 
 
+class TradeBalance(NamedTuple):
+    """Contribution of one open trade to the wallets"""
+
+    realized_profit: float
+    stake_amount: float
+    # Stake of open entry orders (spot only)
+    used_stake: float
+    # Wallet of the base currency (spot only)
+    wallet: Wallet | None = None
+    # Position (futures only)
+    position: PositionWallet | None = None
+
+
 class Wallets:
     def __init__(self, config: Config, exchange: Exchange, is_backtest: bool = False) -> None:
         self._config = config
@@ -41,6 +54,14 @@ class Wallets:
         self._wallets: dict[str, Wallet] = {}
         self._positions: dict[str, PositionWallet] = {}
         self._start_cap: dict[str, float] = {}
+        # Backtesting - ledger of the balances of open trades, updated from the trades changed
+        # since the last update (see LocalTrade.bt_trades_changed)
+        self._bt_balances: dict[LocalTrade, TradeBalance] = {}
+        self._bt_trade_wallets: dict[str, dict[LocalTrade, Wallet]] = {}
+        self._bt_trade_positions: dict[str, dict[LocalTrade, PositionWallet]] = {}
+        self._bt_realized_profit = 0.0
+        self._bt_stake_amount = 0.0
+        self._bt_used_stake = 0.0
 
         self._stake_currency = self._exchange.get_proxy_coin()
 
@@ -96,57 +117,150 @@ class Wallets:
             return pos.position
         return 0
 
+    def _get_trade_balance(self, trade: LocalTrade) -> TradeBalance:
+        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+            curr = self._exchange.get_pair_base_currency(trade.pair)
+            open_orders = trade.open_orders
+            pending = sum(
+                o.amount for o in open_orders if o.amount and o.ft_order_side == trade.exit_side
+            )
+            curr_wallet_bal = self._start_cap.get(curr, 0)
+            return TradeBalance(
+                trade.realized_profit,
+                trade.stake_amount,
+                sum(o.stake_amount for o in open_orders if o.ft_order_side == trade.entry_side),
+                Wallet(
+                    curr,
+                    curr_wallet_bal + trade.amount - pending,
+                    pending,
+                    trade.amount + curr_wallet_bal,
+                ),
+            )
+        return TradeBalance(
+            trade.realized_profit,
+            trade.stake_amount,
+            0.0,
+            position=PositionWallet(
+                trade.pair,
+                position=trade.amount,
+                leverage=trade.leverage,
+                collateral=trade.stake_amount,
+                side=trade.trade_direction,
+            ),
+        )
+
+    @staticmethod
+    def _set_bt_trade_entry(
+        entries: dict[str, dict[LocalTrade, Any]],
+        target: dict[str, Any],
+        key: str,
+        trade: LocalTrade,
+        value: Wallet | PositionWallet | None,
+    ) -> None:
+        """
+        Set (or remove, if value is None) the wallet / position of a trade, and update target.
+        Of multiple open trades in the same currency / pair, the latest opened one is used.
+        """
+        trade_entries = entries.setdefault(key, {})
+        if value is None:
+            trade_entries.pop(trade, None)
+        else:
+            trade_entries[trade] = value
+        if trade_entries:
+            target[key] = next(reversed(trade_entries.values()))
+        else:
+            del entries[key]
+            target.pop(key, None)
+
+    def _apply_bt_trade_changes(self) -> None:
+        """
+        Apply the changes of backtest trades since the last update to the ledger.
+        Only the changed trades are evaluated - work per update doesn't grow with the
+        number of open trades.
+        """
+        changed = LocalTrade.bt_trades_changed
+        if not changed:
+            return
+        LocalTrade.bt_trades_changed = {}
+        for trade in changed:
+            balance = None
+            if trade.is_open and trade in LocalTrade.bt_trades_open_pp.get(trade.pair, ()):
+                balance = self._get_trade_balance(trade)
+            prior = self._bt_balances.pop(trade, None)
+            if prior is None and balance is None:
+                continue
+            if prior is not None:
+                self._bt_realized_profit -= prior.realized_profit
+                self._bt_stake_amount -= prior.stake_amount
+                self._bt_used_stake -= prior.used_stake
+            if balance is not None:
+                self._bt_balances[trade] = balance
+                self._bt_realized_profit += balance.realized_profit
+                self._bt_stake_amount += balance.stake_amount
+                self._bt_used_stake += balance.used_stake
+
+            entry = balance if balance is not None else prior
+            if entry.wallet:
+                self._set_bt_trade_entry(
+                    self._bt_trade_wallets,
+                    self._wallets,
+                    entry.wallet.currency,
+                    trade,
+                    balance.wallet if balance is not None else None,
+                )
+            if entry.position:
+                self._set_bt_trade_entry(
+                    self._bt_trade_positions,
+                    self._positions,
+                    entry.position.symbol,
+                    trade,
+                    balance.position if balance is not None else None,
+                )
+
+        if not self._bt_balances:
+            # No open trades - don't carry rounding errors over to the next trades
+            self._bt_realized_profit = 0.0
+            self._bt_stake_amount = 0.0
+            self._bt_used_stake = 0.0
+
     def _update_dry(self) -> None:
         """
         Update from database in dry-run mode
         - Apply profits of closed trades on top of stake amount
         - Subtract currently tied up stake_amount in open trades
         - update balances for currencies currently in trades
+        In backtesting, the ledger is updated with the trades changed since the last update.
         """
-        # Recreate _wallets to reset closed trade balances
-        _wallets = {}
-        _positions = {}
-        open_trades = Trade.get_trades_proxy(is_open=True)
         if not self._is_backtest:
             # Live / Dry-run mode
+            # Recreate _wallets to reset closed trade balances
+            _wallets = {}
+            _positions = {}
+            balances = [
+                self._get_trade_balance(trade) for trade in Trade.get_trades_proxy(is_open=True)
+            ]
             tot_profit = Trade.get_total_closed_profit()
-        else:
-            # Backtest mode
-            tot_profit = LocalTrade.bt_total_profit
-        tot_profit += sum(trade.realized_profit for trade in open_trades)
-        tot_in_trades = sum(trade.stake_amount for trade in open_trades)
-        used_stake = 0.0
-
-        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
-            for trade in open_trades:
-                curr = self._exchange.get_pair_base_currency(trade.pair)
-                used_stake += sum(
-                    o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
-                )
-                pending = sum(
-                    o.amount
-                    for o in trade.open_orders
-                    if o.amount and o.ft_order_side == trade.exit_side
-                )
-                curr_wallet_bal = self._start_cap.get(curr, 0)
+            tot_profit += sum(balance.realized_profit for balance in balances)
+            tot_in_trades = sum(balance.stake_amount for balance in balances)
+            used_stake = 0.0
 
-                _wallets[curr] = Wallet(
-                    curr,
-                    curr_wallet_bal + trade.amount - pending,
-                    pending,
-                    trade.amount + curr_wallet_bal,
-                )
+            if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+                used_stake += sum(balance.used_stake for balance in balances)
+                _wallets.update((b.wallet.currency, b.wallet) for b in balances if b.wallet)
+            else:
+                _positions.update((b.position.symbol, b.position) for b in balances if b.position)
+                used_stake = tot_in_trades
         else:
-            for position in open_trades:
-                _positions[position.pair] = PositionWallet(
-                    position.pair,
-                    position=position.amount,
-                    leverage=position.leverage,
-                    collateral=position.stake_amount,
-                    side=position.trade_direction,
-                )
-
-            used_stake = tot_in_trades
+            # Backtest mode
+            self._apply_bt_trade_changes()
+            _wallets = self._wallets
+            _positions = self._positions
+            tot_profit = LocalTrade.bt_total_profit + self._bt_realized_profit
+            tot_in_trades = self._bt_stake_amount
+            if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+                used_stake = self._bt_used_stake
+            else:
+                used_stake = tot_in_trades
 
         cross_margin = 0.0
         if self._config.get("margin_mode") == "cross":
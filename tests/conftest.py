@@ -0,0 +1,148 @@
+# pragma pylint: disable=missing-docstring
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from binancebot.data.history import get_datahandler
+from binancebot.enums import CandleType, RunMode
+from binancebot.exchange import Exchange
+from binancebot.optimize.backtesting import Backtesting
+from binancebot.persistence import LocalTrade
+
+
+logging.getLogger("").setLevel(logging.INFO)
+
+STRATEGY_PATH = Path(__file__).parent / "strategy" / "strats"
+
+
+def get_markets() -> dict:
+    markets = {}
+    for base in ("BTC", "ETH", "XRP", "ADA"):
+        for quote, market_type in (("USDT", "spot"), ("USDT:USDT", "swap")):
+            symbol = f"{base}/{quote}"
+            markets[symbol] = {
+                "id": symbol,
+                "symbol": symbol,
+                "base": base,
+                "quote": "USDT",
+                "settle": "USDT" if market_type == "swap" else None,
+                "active": True,
+                "spot": market_type == "spot",
+                "swap": market_type == "swap",
+                "future": False,
+                "option": False,
+                "margin": False,
+                "linear": market_type == "swap",
+                "type": market_type,
+                "contractSize": 1 if market_type == "swap" else None,
+                "precision": {"price": 0.0001, "amount": 0.0001},
+                "limits": {
+                    "amount": {"min": 0.0001, "max": None},
+                    "cost": {"min": 1, "max": None},
+                    "leverage": {"min": 1, "max": 10},
+                    "price": {},
+                },
+            }
+    return markets
+
+
+@pytest.fixture
+def patch_exchange(monkeypatch):
+    """
+    Exchange with static markets - doesn't access the network.
+    """
+
+    def reload_markets(self, force=False, *, load_leverage_tiers=True):
+        self._markets = get_markets()
+        self._api.markets = self._markets
+        self._api_async.markets = self._markets
+
+    monkeypatch.setattr(Exchange, "reload_markets", reload_markets)
+    monkeypatch.setattr(Exchange, "validate_config", lambda *args, **kwargs: None)
+    monkeypatch.setattr(Exchange, "ft_additional_exchange_init", lambda *args, **kwargs: None)
+    monkeypatch.setattr(Exchange, "fill_leverage_tiers", lambda *args, **kwargs: None)
+    monkeypatch.setattr(Exchange, "get_max_leverage", lambda *args, **kwargs: 10.0)
+
+
+@pytest.fixture
+def default_conf(tmp_path):
+    return {
+        "max_open_trades": 3,
+        "stake_currency": "USDT",
+        "stake_amount": 100,
+        "dry_run": True,
+        "dry_run_wallet": 1000,
+        "timeframe": "5m",
+        "fee": 0.001,
+        "strategy": "StrategyTestBacktest",
+        "strategy_path": str(STRATEGY_PATH),
+        "user_data_dir": tmp_path,
+        "datadir": tmp_path / "data",
+        "exchange": {
+            "name": "binance",
+            "key": "",
+            "secret": "",
+            "pair_whitelist": ["BTC/USDT", "ETH/USDT", "XRP/USDT"],
+            "pair_blacklist": [],
+        },
+        "pairlists": [{"method": "StaticPairList"}],
+        "dataformat_ohlcv": "feather",
+        "dataformat_trades": "feather",
+        "runmode": RunMode.BACKTEST,
+        "export": "none",
+        "entry_pricing": {"price_side": "same", "use_order_book": False},
+        "exit_pricing": {"price_side": "same", "use_order_book": False},
+        "unfilledtimeout": {"entry": 10, "exit": 10, "unit": "minutes"},
+        "internals": {},
+        "original_config": {},
+        "candle_type_def": CandleType.SPOT,
+        "trading_mode": "spot",
+        "margin_mode": "",
+        "bot_name": "binancebot",
+        "backtest_cache": "none",
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_backtest_state():
+    yield
+    LocalTrade.reset_trades()
+    Backtesting.cleanup()
+
+
+def generate_test_data(
+    timeframe: str, size: int, start: str = "2020-07-05", random_seed: int = 42
+) -> pd.DataFrame:
+    """
+    Random walk candles of the given timeframe.
+    """
+    np.random.seed(random_seed)
+    base = 20 * np.exp(np.cumsum(np.random.normal(0, 0.005, size=size)))
+    date = pd.date_range(start, periods=size, freq=timeframe.replace("m", "min"), tz="UTC")
+    df = pd.DataFrame(
+        {
+            "date": date,
+            "open": base,
+            "high": base * (1 + np.abs(np.random.normal(0.004, 0.002, size=size))),
+            "low": base * (1 - np.abs(np.random.normal(0.004, 0.002, size=size))),
+            "close": base * (1 + np.random.normal(0, 0.002, size=size)),
+            "volume": np.random.normal(200, size=size),
+        }
+    )
+    df = df.dropna()
+    return df
+
+
+def store_test_data(
+    datadir: Path,
+    data: dict[str, pd.DataFrame],
+    timeframe: str,
+    candle_type: CandleType = CandleType.SPOT,
+    data_format: str = "feather",
+) -> None:
+    datahandler = get_datahandler(datadir, data_format)
+    for pair, df in data.items():
+        datahandler.ohlcv_store(pair, timeframe, df, candle_type)
@@ -0,0 +1,98 @@
+# pragma pylint: disable=missing-docstring
+import numpy as np
+import pandas as pd
+import pytest
+
+from binancebot.data.converter import clean_ohlcv_dataframe, ohlcv_fill_up_missing_data
+from tests.conftest import generate_test_data
+
+
+def _clean_reference(data: pd.DataFrame, timeframe: str, fill_missing: bool) -> pd.DataFrame:
+    # clean_ohlcv_dataframe without the fast path for clean candles
+    data = data.groupby(by="date", as_index=False, sort=True).agg(
+        {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "max"}
+    )
+    if not fill_missing:
+        return data
+    df = data.resample(pd.Timedelta(timeframe), on="date").agg(
+        {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    )
+    df["close"] = df["close"].ffill()
+    df.loc[:, ["open", "high", "low"]] = df[["open", "high", "low"]].fillna(
+        value={"open": df["close"], "high": df["close"], "low": df["close"]}
+    )
+    return df.reset_index()
+
+
+def _assert_clean_matches(data: pd.DataFrame, fill_missing: bool) -> pd.DataFrame:
+    cleaned = clean_ohlcv_dataframe(
+        data.copy(), "5m", "BTC/USDT", fill_missing=fill_missing, drop_incomplete=False
+    )
+    pd.testing.assert_frame_equal(cleaned, _clean_reference(data, "5min", fill_missing))
+    return cleaned
+
+
+@pytest.mark.parametrize("fill_missing", [True, False])
+def test_clean_ohlcv_dataframe_clean(fill_missing, monkeypatch):
+    data = generate_test_data("5m", 300)
+    data["extra"] = 1
+    expected = _clean_reference(data, "5min", fill_missing)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Clean candles are aggregated.")
+
+    # Clean candles are neither grouped nor resampled.
+    monkeypatch.setattr(pd.DataFrame, "groupby", fail)
+    monkeypatch.setattr(pd.DataFrame, "resample", fail)
+    cleaned = clean_ohlcv_dataframe(
+        data.copy(), "5m", "BTC/USDT", fill_missing=fill_missing, drop_incomplete=False
+    )
+    pd.testing.assert_frame_equal(cleaned, expected)
+    assert list(cleaned.columns) == ["date", "open", "high", "low", "close", "volume"]
+    assert len(cleaned) == 300
+
+
+@pytest.mark.parametrize("fill_missing", [True, False])
+def test_clean_ohlcv_dataframe_gaps(fill_missing):
+    data = generate_test_data("5m", 300)
+    data = data.drop(index=[0, 1, 50, 120, 121, 122, 299]).reset_index(drop=True)
+
+    cleaned = _assert_clean_matches(data, fill_missing)
+    assert len(cleaned) == (297 if fill_missing else 293)
+
+
+@pytest.mark.parametrize("fill_missing", [True, False])
+def test_clean_ohlcv_dataframe_duplicates(fill_missing):
+    data = generate_test_data("5m", 300)
+    duplicates = data.iloc[[10, 10, 200]].copy()
+    duplicates[["open", "high", "low", "close"]] *= 1.01
+    data = pd.concat([data, duplicates], ignore_index=True).sort_values("date", kind="stable")
+
+    cleaned = _assert_clean_matches(data, fill_missing)
+    assert len(cleaned) == 300
+
+
+@pytest.mark.parametrize("fill_missing", [True, False])
+def test_clean_ohlcv_dataframe_unsorted(fill_missing):
+    data = generate_test_data("5m", 300)
+    data = data.sample(frac=1, random_state=42).drop(index=[20, 21])
+
+    cleaned = _assert_clean_matches(data, fill_missing)
+    assert cleaned["date"].is_monotonic_increasing
+
+
+def test_clean_ohlcv_dataframe_nan_values():
+    data = generate_test_data("5m", 300)
+    data.loc[[30, 31], ["open", "high", "low", "close"]] = np.nan
+
+    _assert_clean_matches(data, True)
+
+
+def test_ohlcv_fill_up_missing_data_off_grid():
+    # Candles not starting at the start of the 5m bins are resampled.
+    data = generate_test_data("5m", 100)
+    data["date"] += pd.Timedelta(minutes=2)
+
+    filled = ohlcv_fill_up_missing_data(data, "5m", "BTC/USDT")
+    assert filled["date"].iloc[0] == data["date"].iloc[0].floor("5min")
+    pd.testing.assert_frame_equal(filled, _clean_reference(data, "5min", True))
@@ -0,0 +1,157 @@
+# pragma pylint: disable=missing-docstring
+import random
+from datetime import UTC, datetime, timedelta
+
+import pandas as pd
+import pytest
+from pyarrow import feather
+
+from binancebot.configuration import TimeRange
+from binancebot.data.history import get_datahandler
+from binancebot.data.history.datahandlers import parquetdatahandler
+from binancebot.data.history.datahandlers.featherdatahandler import FeatherDataHandler
+from binancebot.data.history.datahandlers.idatahandler import IDataHandler
+from binancebot.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
+from binancebot.enums import CandleType
+from tests.conftest import generate_test_data
+
+
+CHUNK_START = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+def _chunk_dates(i: int) -> tuple[datetime, datetime]:
+    # Chunks of 10 hourly candles
+    start = CHUNK_START + timedelta(hours=10 * i)
+    return start, start + timedelta(hours=9)
+
+
+def _expected_chunk_range(timerange: TimeRange, chunk_count: int) -> range:
+    first = 0
+    if timerange.starttype == "date":
+        starting = [i for i in range(chunk_count) if _chunk_dates(i)[0] <= timerange.startdt]
+        first = starting[-1] if starting else 0
+    last = chunk_count - 1
+    if timerange.stoptype == "date":
+        ending = [i for i in range(first, chunk_count) if _chunk_dates(i)[1] > timerange.stopdt]
+        last = ending[0] if ending else chunk_count - 1
+    return range(first, last + 1)
+
+
+@pytest.mark.parametrize(
+    "start,stop",
+    [
+        (None, None),
+        (0, None),
+        (None, 0),
+        (-100, -50),
+        (0, 9),
+        (10, 19),
+        (15, 15),
+        (9, 10),
+        (123, 456),
+        (995, 999),
+        (999, 2000),
+        (1500, 2000),
+    ],
+)
+def test_get_chunk_range(start, stop):
+    chunk_count = 100
+    timerange = TimeRange(
+        "date" if start is not None else None,
+        "date" if stop is not None else None,
+        int((CHUNK_START + timedelta(hours=start or 0)).timestamp()),
+        int((CHUNK_START + timedelta(hours=stop or 0)).timestamp()),
+    )
+    calls = []
+
+    def get_chunk_dates(i: int) -> tuple[datetime, datetime]:
+        calls.append(i)
+        return _chunk_dates(i)
+
+    chunks = IDataHandler._get_chunk_range(timerange, chunk_count, get_chunk_dates)
+    assert chunks == _expected_chunk_range(timerange, chunk_count)
+    # Bisection - not a scan over all chunks.
+    assert len(calls) <= 16
+
+
+def test_get_chunk_range_no_timerange():
+    assert IDataHandler._get_chunk_range(None, 5, _chunk_dates) == range(5)
+    assert IDataHandler._get_chunk_range(TimeRange(), 0, _chunk_dates) == range(0)
+
+
+def _store_chunked(datahandler: IDataHandler, data: pd.DataFrame) -> None:
+    if isinstance(datahandler, FeatherDataHandler):
+        # Feather files written by pandas use batches of 64k rows
+        filename = datahandler._pair_data_filename(
+            datahandler._datadir, "BTC/USDT", "1h", CandleType.SPOT
+        )
+        datahandler.create_dir_if_needed(filename)
+        feather.write_feather(data, filename, compression="lz4", chunksize=100)
+    else:
+        datahandler.ohlcv_store("BTC/USDT", "1h", data, CandleType.SPOT)
+
+
+@pytest.mark.parametrize("data_format", ["feather", "parquet"])
+def test_ohlcv_load_partial(data_format, tmp_path, monkeypatch):
+    monkeypatch.setattr(parquetdatahandler, "OHLCV_ROW_GROUP_SIZE", 100)
+    data = generate_test_data("1h", 10000, start="2020-01-01")
+    # Gap in the data, spanning a month
+    data = data.drop(data.index[5500:6500]).reset_index(drop=True)
+    datahandler = get_datahandler(tmp_path, data_format)
+    _store_chunked(datahandler, data)
+
+    def load(timerange, startup_candles, drop_incomplete):
+        return datahandler.ohlcv_load(
+            "BTC/USDT",
+            "1h",
+            CandleType.SPOT,
+            timerange=timerange,
+            startup_candles=startup_candles,
+            drop_incomplete=drop_incomplete,
+            warn_no_data=False,
+        )
+
+    rng = random.Random(42)
+    first_ts = int(data["date"].iloc[0].timestamp())
+    timeranges = [TimeRange("date", "date", first_ts - 3600, first_ts + 100 * 3600)]
+    for _ in range(40):
+        start = first_ts + rng.randint(-24, 10000) * 3600
+        stop = start + rng.randint(1, 4000) * 3600
+        starttype, stoptype = rng.choice([("date", "date"), ("date", None), (None, "date")])
+        timeranges.append(TimeRange(starttype, stoptype, start, stop))
+    cases = [
+        (timerange, rng.choice([0, 30, 1000]), rng.choice([True, False]))
+        for timerange in timeranges
+    ]
+    partial = [load(*case) for case in cases]
+    # Only the chunks covering the timerange are read.
+    assert len(datahandler._ohlcv_load("BTC/USDT", "1h", timeranges[0], CandleType.SPOT)) < 400
+
+    # Read all stored data, regardless of the timerange
+    read_table = ParquetDataHandler._read_table
+    monkeypatch.setattr(
+        FeatherDataHandler,
+        "_read_ohlcv_batches",
+        lambda self, filename, timerange: pd.read_feather(filename),
+    )
+    monkeypatch.setattr(
+        ParquetDataHandler,
+        "_read_table",
+        lambda self, path, date_col, timerange: read_table(self, path, date_col, None),
+    )
+    for case, partial_df in zip(cases, partial, strict=True):
+        pd.testing.assert_frame_equal(partial_df, load(*case))
+
+
+def test_ohlcv_load_parquet_single_row_group(tmp_path):
+    data = generate_test_data("1m", 5000, start="2020-01-01")
+    datahandler = get_datahandler(tmp_path, "parquet")
+    filename = datahandler._pair_data_filename(tmp_path, "BTC/USDT", "1m", CandleType.SPOT)
+    datahandler.create_dir_if_needed(filename)
+    # Parquet files written by older versions use a single row group.
+    data.to_parquet(filename)
+
+    timerange = TimeRange.parse_timerange("20200102-20200103")
+    loaded = datahandler.ohlcv_load("BTC/USDT", "1m", CandleType.SPOT, timerange=timerange)
+    assert loaded["date"].iloc[0] == pd.Timestamp("2020-01-02", tz="UTC")
+    assert loaded["date"].iloc[-1] == pd.Timestamp("2020-01-03", tz="UTC")
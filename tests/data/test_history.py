@@ -0,0 +1,60 @@
+# pragma pylint: disable=missing-docstring
+import logging
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from binancebot.data.history import load_data
+from binancebot.data.history import ohlcv_resampler as resampler_module
+from binancebot.data.history.ohlcv_resampler import OhlcvResampler
+from tests.conftest import generate_test_data, store_test_data
+
+
+PAIRS = ["BTC/USDT", "ETH/USDT", "XRP/USDT"]
+
+
+class _HandlingThreadRecorder(logging.Handler):
+    """
+    Records messages, with whether they were handled in the main thread.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[tuple[str, bool]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(
+            (record.getMessage(), threading.current_thread() is threading.main_thread())
+        )
+
+
+@pytest.fixture
+def resampler_logs(monkeypatch):
+    monkeypatch.setattr(resampler_module, "_memory_cache", OrderedDict())
+    resampler_logger = logging.getLogger(resampler_module.__name__)
+    recorder = _HandlingThreadRecorder()
+    level = resampler_logger.level
+    resampler_logger.setLevel(logging.DEBUG)
+    resampler_logger.addHandler(recorder)
+    yield recorder
+    resampler_logger.removeHandler(recorder)
+    resampler_logger.setLevel(level)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_load_data_resampled_logs_in_pair_order(jobs, tmp_path, resampler_logs):
+    store_test_data(
+        tmp_path,
+        {pair: generate_test_data("5m", 480, random_seed=42 + i) for i, pair in enumerate(PAIRS)},
+        "5m",
+    )
+
+    data = load_data(tmp_path, "1h", PAIRS, jobs=jobs, resampler=OhlcvResampler("5m"))
+
+    assert list(data) == PAIRS
+    assert all(len(df) == 40 for df in data.values())
+    # Records of the loading threads are held back, and logged in the order of pairs.
+    assert resampler_logs.messages == [
+        (f"Resampling {pair}, 1h from 5m candles.", True) for pair in PAIRS
+    ]
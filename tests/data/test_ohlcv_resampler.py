@@ -0,0 +1,108 @@
+# pragma pylint: disable=missing-docstring
+from collections import OrderedDict
+
+import pandas as pd
+import pytest
+
+from binancebot.data.converter import resample_ohlcv_dataframe
+from binancebot.data.history import get_datahandler
+from binancebot.data.history import ohlcv_resampler as resampler_module
+from binancebot.data.history.datahandlers import idatahandler
+from binancebot.data.history.ohlcv_resampler import OhlcvResampler
+from binancebot.enums import CandleType
+from binancebot.exchange import timeframe_to_resample_freq
+from tests.conftest import generate_test_data, store_test_data
+
+
+@pytest.fixture(autouse=True)
+def memory_cache(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr(resampler_module, "_memory_cache", cache)
+    return cache
+
+
+def _resample_reference(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    df = data.resample(
+        timeframe_to_resample_freq(timeframe), on="date", closed="left", label="left"
+    ).agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+    # Candles without base candles are omitted.
+    return df.dropna(subset=["open"]).reset_index()
+
+
+@pytest.mark.parametrize(
+    "base_timeframe,timeframe,start,size",
+    [
+        ("5m", "15m", "2020-07-05", 999),
+        ("5m", "1h", "2020-07-05", 1200),
+        ("5m", "4h", "2020-07-05", 2016),
+        ("1h", "1d", "2020-07-05", 24 * 20),
+        ("1h", "1w", "2020-07-06", 24 * 7 * 4),
+        ("1h", "1M", "2020-07-01", 24 * 92),
+    ],
+)
+def test_resample_ohlcv_dataframe(base_timeframe, timeframe, start, size):
+    data = generate_test_data(base_timeframe, size, start=start)
+    # Gaps, including a completely missing candle of the 15m timeframe.
+    data = data.drop(index=[*range(30, 50), 101, 300]).reset_index(drop=True)
+
+    resampled = resample_ohlcv_dataframe(data, timeframe, base_timeframe)
+    pd.testing.assert_frame_equal(resampled, _resample_reference(data, timeframe))
+
+
+def test_resample_ohlcv_dataframe_partial_candles():
+    # 00:10 - 10:00 - only the first hourly candle is covered partially.
+    data = generate_test_data("5m", 118, start="2020-07-05 00:10")
+
+    resampled = resample_ohlcv_dataframe(data, "1h", "5m")
+    expected = _resample_reference(data, "1h").iloc[1:].reset_index(drop=True)
+    pd.testing.assert_frame_equal(resampled, expected)
+    assert resampled["date"].iloc[0] == pd.Timestamp("2020-07-05 01:00", tz="UTC")
+    assert len(resampled) == 9
+
+    # 00:10 - 09:55 - the last candle is incomplete.
+    resampled = resample_ohlcv_dataframe(data.iloc[:-1], "1h", "5m")
+    pd.testing.assert_frame_equal(resampled, expected.iloc[:-1])
+
+
+def test_resampler_cache_candle_types(tmp_path, memory_cache, monkeypatch):
+    datadir = tmp_path / "data"
+    cache_dir = tmp_path / "ohlcv_cache"
+    pair = "BTC/USDT:USDT"
+
+    def store(candle_type, size, random_seed):
+        store_test_data(
+            datadir,
+            {pair: generate_test_data("5m", size, random_seed=random_seed)},
+            "5m",
+            candle_type=candle_type,
+        )
+
+    store(CandleType.SPOT, 480, 42)
+    store(CandleType.FUTURES, 480, 43)
+    datahandler = get_datahandler(datadir, "feather")
+    resampler = OhlcvResampler("5m", cache_dir)
+
+    def load(candle_type):
+        return datahandler.ohlcv_load(pair, "1h", candle_type, resampler=resampler)
+
+    spot = load(CandleType.SPOT)
+    futures = load(CandleType.FUTURES)
+    assert len(spot) == len(futures) == 40
+    assert not spot.equals(futures)
+    assert len(list(cache_dir.glob("*.feather"))) == 2
+
+    # Both candle types are loaded from the disk cache.
+    memory_cache.clear()
+    with monkeypatch.context() as m:
+        m.setattr(idatahandler, "resample_ohlcv_dataframe", None)
+        pd.testing.assert_frame_equal(load(CandleType.SPOT), spot)
+        pd.testing.assert_frame_equal(load(CandleType.FUTURES), futures)
+
+    # Updated spot candles replace the outdated spot entry only.
+    store(CandleType.SPOT, 492, 44)
+    assert len(load(CandleType.SPOT)) == 41
+    assert len(list(cache_dir.glob("*.feather"))) == 2
+    memory_cache.clear()
+    with monkeypatch.context() as m:
+        m.setattr(idatahandler, "resample_ohlcv_dataframe", None)
+        pd.testing.assert_frame_equal(load(CandleType.FUTURES), futures)
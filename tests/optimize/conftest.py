@@ -0,0 +1,25 @@
+# pragma pylint: disable=missing-docstring
+import pytest
+
+from binancebot.enums import RunMode
+
+
+@pytest.fixture
+def hyperopt_conf(default_conf, tmp_path):
+    (tmp_path / "hyperopt_results").mkdir()
+    default_conf.update(
+        {
+            "runmode": RunMode.HYPEROPT,
+            "epochs": 4,
+            "spaces": ["buy", "sell"],
+            "hyperopt_jobs": 1,
+            "hyperopt_random_state": 42,
+            "hyperopt_loss": "SharpeHyperOptLoss",
+            "hyperopt_min_trades": 1,
+            "disableparamexport": True,
+            "print_all": False,
+            "print_json": False,
+            "verbosity": 0,
+        }
+    )
+    return default_conf
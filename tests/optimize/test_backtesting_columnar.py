@@ -0,0 +1,70 @@
+# pragma pylint: disable=missing-docstring
+from copy import deepcopy
+
+import pandas as pd
+import pytest
+
+from binancebot.data.converter import trim_dataframes
+from binancebot.data.history import get_timerange
+from binancebot.optimize.backtesting import Backtesting
+from binancebot.persistence import LocalTrade
+from tests.conftest import generate_test_data, store_test_data
+
+
+PAIRS = ["BTC/USDT", "ETH/USDT", "XRP/USDT"]
+
+
+def _store_data(conf, entry_rows: dict[str, list[int]] | None = None, size: int = 600):
+    data = {}
+    for idx, pair in enumerate(PAIRS):
+        df = generate_test_data("5m", size, random_seed=42 + idx)
+        for row in (entry_rows or {}).get(pair, []):
+            df.loc[row, "volume"] = 1e7
+        data[pair] = df
+    store_test_data(conf["datadir"], data, "5m")
+
+
+def _run_backtest(conf, engine: str) -> pd.DataFrame:
+    conf = deepcopy(conf)
+    conf["backtest_engine"] = engine
+    backtesting = Backtesting(conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data, timerange = backtesting.load_bt_data()
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(
+        trim_dataframes(processed, timerange, backtesting.required_startup)
+    )
+    result = backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)
+    LocalTrade.reset_trades()
+    Backtesting.cleanup()
+    return result["results"]
+
+
+def _assert_same_results(default: pd.DataFrame, columnar: pd.DataFrame) -> None:
+    assert len(default) > 0
+    pd.testing.assert_frame_equal(
+        default.reset_index(drop=True), columnar.reset_index(drop=True), check_dtype=False
+    )
+
+
+@pytest.mark.usefixtures("patch_exchange")
+def test_backtest_columnar_matches_default(default_conf):
+    _store_data(default_conf)
+
+    default = _run_backtest(default_conf, "default")
+    columnar = _run_backtest(default_conf, "columnar")
+
+    _assert_same_results(default, columnar)
+
+
+@pytest.mark.usefixtures("patch_exchange")
+def test_backtest_columnar_force_exit_order(default_conf):
+    # Pairs enter in reverse order and are all still open at the end of the backtest.
+    default_conf["strategy"] = "StrategyTestBacktestHold"
+    _store_data(default_conf, {"XRP/USDT": [100], "ETH/USDT": [200], "BTC/USDT": [300]})
+
+    default = _run_backtest(default_conf, "default")
+    columnar = _run_backtest(default_conf, "columnar")
+
+    assert default["exit_reason"].tolist() == ["force_exit"] * 3
+    _assert_same_results(default, columnar)
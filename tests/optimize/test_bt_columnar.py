@@ -0,0 +1,79 @@
+# pragma pylint: disable=missing-docstring
+from copy import deepcopy
+
+import pandas as pd
+import pytest
+
+from binancebot.configuration import TimeRange
+from binancebot.data.converter import trim_dataframes
+from binancebot.data.history import get_timerange
+from binancebot.optimize.backtesting import Backtesting
+from binancebot.optimize.bt_columnar import PairSignalCache
+from binancebot.persistence import LocalTrade
+from tests.conftest import generate_test_data, store_test_data
+
+
+def test_pair_signal_cache_matches():
+    df = generate_test_data("5m", 100)
+    pair_cache = PairSignalCache.create(df, TimeRange(), 20)
+
+    assert pair_cache.start == 20
+    assert pair_cache.end == 100
+    assert pair_cache.matches(df)
+    assert pair_cache.matches(df.copy())
+
+    changed = df.copy()
+    changed.loc[50, "close"] += 1
+    assert not pair_cache.matches(changed)
+
+    shifted = df.copy()
+    shifted["date"] += pd.Timedelta(minutes=5)
+    assert not pair_cache.matches(shifted)
+
+    # Same length, but a different candle range.
+    assert not pair_cache.matches(generate_test_data("5m", 100, start="2020-07-06"))
+    assert not pair_cache.matches(df.iloc[:-1])
+
+
+@pytest.mark.usefixtures("patch_exchange")
+def test_backtest_signal_cache_invalidation(default_conf):
+    pairs = default_conf["exchange"]["pair_whitelist"]
+    store_test_data(
+        default_conf["datadir"],
+        {pair: generate_test_data("5m", 600, random_seed=42 + i) for i, pair in enumerate(pairs)},
+        "5m",
+    )
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data, timerange = backtesting.load_bt_data()
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(
+        trim_dataframes(processed, timerange, backtesting.required_startup)
+    )
+
+    def run_backtest(processed, signal_cache):
+        backtesting.signal_cache = signal_cache
+        result = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        LocalTrade.reset_trades()
+        return result["results"]
+
+    signal_cache = {}
+    results = run_backtest(processed, signal_cache)
+    assert len(results) > 0
+    pair_cache = signal_cache["BTC/USDT"]
+    assert pair_cache is not None
+
+    pd.testing.assert_frame_equal(run_backtest(processed, signal_cache), results)
+    assert signal_cache["BTC/USDT"] is pair_cache
+
+    # Same number of candles, different prices - the cache must not be reused.
+    changed = deepcopy(processed)
+    for col in ("open", "high", "low", "close"):
+        changed["BTC/USDT"][col] *= 1.5
+    changed_results = run_backtest(changed, signal_cache)
+    assert signal_cache["BTC/USDT"] is not pair_cache
+    assert signal_cache["ETH/USDT"] is not None
+    pd.testing.assert_frame_equal(changed_results, run_backtest(changed, None))
+    assert not changed_results.equals(results)
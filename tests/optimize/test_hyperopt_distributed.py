@@ -0,0 +1,141 @@
+# pragma pylint: disable=missing-docstring
+from copy import deepcopy
+from threading import Thread
+from time import sleep
+
+import optuna
+import pytest
+from optuna.distributions import IntDistribution
+from optuna.trial import TrialState
+
+from binancebot.optimize.hyperopt import hyperopt, hyperopt_worker
+from binancebot.optimize.hyperopt.hyperopt import Hyperopt
+from binancebot.optimize.hyperopt.hyperopt_optimizer import get_study_storage
+from binancebot.optimize.hyperopt.hyperopt_worker import (
+    STUDY_EPOCHS_ATTR,
+    STUDY_STOP_ATTR,
+    TRIAL_HEARTBEAT_ATTR,
+    TRIAL_RESULT_ATTR,
+    HyperoptWorker,
+    is_lost_trial,
+)
+from tests.conftest import generate_test_data, store_test_data
+
+
+DISTRIBUTIONS = {"buy_rsi": IntDistribution(20, 45)}
+
+
+@pytest.fixture
+def hyperopt_conf(hyperopt_conf, tmp_path):
+    hyperopt_conf["hyperopt_storage"] = str(tmp_path / "study.log")
+    return hyperopt_conf
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(hyperopt, "STUDY_POLL_INTERVAL", 0.05)
+    monkeypatch.setattr(hyperopt, "TRIAL_HEARTBEAT_GRACE_PERIOD", 1)
+    monkeypatch.setattr(hyperopt_worker, "STUDY_POLL_INTERVAL", 0.05)
+    monkeypatch.setattr(hyperopt_worker, "TRIAL_HEARTBEAT_INTERVAL", 0.1)
+
+
+def test_fail_lost_trials(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(hyperopt, "monotonic", lambda: now[0])
+    study = optuna.create_study()
+    lost = study.ask(DISTRIBUTIONS)
+    alive = study.ask(DISTRIBUTIONS)
+    alive.set_user_attr(TRIAL_HEARTBEAT_ATTR, 1)
+    hyperopt_obj = Hyperopt.__new__(Hyperopt)
+    hyperopt_obj.opt = study
+
+    def running():
+        return study.get_trials(deepcopy=False, states=(TrialState.RUNNING,))
+
+    heartbeats = hyperopt_obj._fail_lost_trials(running(), {})
+    assert set(heartbeats) == {lost.number, alive.number}
+
+    now[0] += hyperopt.TRIAL_HEARTBEAT_GRACE_PERIOD
+    alive.set_user_attr(TRIAL_HEARTBEAT_ATTR, 2)
+    heartbeats = hyperopt_obj._fail_lost_trials(running(), heartbeats)
+    assert [t.number for t in running()] == [lost.number, alive.number]
+
+    now[0] += 1
+    heartbeats = hyperopt_obj._fail_lost_trials(running(), heartbeats)
+    assert set(heartbeats) == {alive.number}
+    assert [t.number for t in running()] == [alive.number]
+    assert is_lost_trial(study.trials[lost.number])
+    assert not is_lost_trial(study.trials[alive.number])
+
+    # Workers of lost trials may still report their result.
+    study.tell(alive, 1.0)
+    study.tell(lost.number, 1.0, skip_if_finished=True)
+    assert study.trials[lost.number].state == TrialState.FAIL
+
+
+def test_get_epochs_left(monkeypatch):
+    study = optuna.create_study()
+    study.set_user_attr(STUDY_EPOCHS_ATTR, 3)
+    study.tell(study.ask(DISTRIBUTIONS), 1.0)
+    assert HyperoptWorker._get_epochs_left(study) == 2
+
+    running = study.ask(DISTRIBUTIONS)
+    assert HyperoptWorker._get_epochs_left(study) == 1
+
+    lost = study.ask(DISTRIBUTIONS)
+    hyperopt_worker.fail_lost_trial(study, lost)
+    assert HyperoptWorker._get_epochs_left(study) == 1
+
+    # The last epoch is evaluated by another worker - wait for it to finish.
+    def poll(_):
+        study.tell(running, 1.0)
+
+    monkeypatch.setattr(hyperopt_worker, "sleep", poll)
+    study.tell(study.ask(DISTRIBUTIONS), 1.0)
+    assert HyperoptWorker._get_epochs_left(study) == 0
+    assert running.number in [t.number for t in study.get_trials(states=(TrialState.COMPLETE,))]
+
+    study.set_user_attr(STUDY_STOP_ATTR, True)
+    assert HyperoptWorker._get_epochs_left(study) == 0
+
+
+@pytest.mark.usefixtures("patch_exchange", "fast_polling")
+def test_hyperopt_distributed_lost_worker(hyperopt_conf):
+    pairs = hyperopt_conf["exchange"]["pair_whitelist"]
+    store_test_data(
+        hyperopt_conf["datadir"],
+        {pair: generate_test_data("5m", 600, random_seed=42 + i) for i, pair in enumerate(pairs)},
+        "5m",
+    )
+    coordinator = Hyperopt(deepcopy(hyperopt_conf))
+    coordinator_thread = Thread(target=coordinator.start, daemon=True)
+    coordinator_thread.start()
+
+    storage = get_study_storage(hyperopt_conf["hyperopt_storage"])
+    while coordinator_thread.is_alive():
+        try:
+            study = optuna.load_study(study_name="StrategyTestBacktest", storage=storage)
+            if STUDY_EPOCHS_ATTR in study.user_attrs:
+                break
+        except KeyError:
+            pass
+        sleep(0.05)
+    else:
+        pytest.fail("Hyperopt did not create the study.")
+    # Trial of a worker which was killed before the other worker started.
+    lost = study.ask()
+
+    worker = HyperoptWorker(deepcopy(hyperopt_conf))
+    worker_thread = Thread(target=worker.start, daemon=True)
+    worker_thread.start()
+    worker_thread.join(timeout=120)
+    coordinator_thread.join(timeout=10)
+    if worker_thread.is_alive() or coordinator_thread.is_alive():
+        study.set_user_attr(STUDY_STOP_ATTR, True)
+        pytest.fail("Distributed hyperopt did not finish.")
+
+    assert is_lost_trial(study.trials[lost.number])
+    assert worker.num_epochs_evaluated == 4
+    results = [t for t in study.trials if TRIAL_RESULT_ATTR in t.user_attrs]
+    assert coordinator.num_epochs_saved + coordinator.count_skipped_epochs == 4
+    assert coordinator.num_epochs_saved == len(results)
@@ -0,0 +1,86 @@
+# pragma pylint: disable=missing-docstring
+from math import inf
+
+import optuna
+import pytest
+from optuna.trial import TrialState
+
+from binancebot.optimize.hyperopt.hyperopt_optimizer import (
+    MAX_LOSS,
+    PRUNE_STARTUP_EPOCHS,
+    HyperOptimizer,
+)
+from tests.conftest import generate_test_data, store_test_data
+
+
+@pytest.mark.usefixtures("patch_exchange")
+def test_get_prune_bounds(hyperopt_conf, tmp_path):
+    hyperopt_conf["hyperopt_prune_checkpoints"] = 2
+    hyperopter = HyperOptimizer(hyperopt_conf, tmp_path / "data.pkl")
+    study = optuna.create_study()
+    assert hyperopter.get_prune_bounds(study) == [inf, inf]
+
+    for i in range(PRUNE_STARTUP_EPOCHS):
+        trial = study.ask()
+        trial.report(i, 0)
+        trial.report(10 * i, 1)
+        if i < PRUNE_STARTUP_EPOCHS - 1:
+            study.tell(trial, i)
+    # Not enough completed epochs yet.
+    assert hyperopter.get_prune_bounds(study) == [inf, inf]
+
+    study.tell(trial, 0)
+    assert hyperopter.get_prune_bounds(study) == [2, 20]
+
+    # Pruned, failed and running epochs don't count.
+    pruned = study.ask()
+    pruned.report(-100, 0)
+    study.tell(pruned, state=TrialState.PRUNED)
+    failed = study.ask()
+    failed.report(-100, 0)
+    study.tell(failed, state=TrialState.FAIL)
+    study.ask().report(-100, 0)
+    assert hyperopter.get_prune_bounds(study) == [2, 20]
+
+    hyperopter.prune_checkpoints = 0
+    assert hyperopter.get_prune_bounds(study) is None
+
+
+@pytest.mark.usefixtures("patch_exchange")
+def test_generate_optimizer_checkpoints(hyperopt_conf):
+    pairs = hyperopt_conf["exchange"]["pair_whitelist"]
+    store_test_data(
+        hyperopt_conf["datadir"],
+        {pair: generate_test_data("5m", 1000, random_seed=42 + i) for i, pair in enumerate(pairs)},
+        "5m",
+    )
+    hyperopt_conf["hyperopt_prune_checkpoints"] = 3
+    hyperopter = HyperOptimizer(
+        hyperopt_conf, hyperopt_conf["user_data_dir"] / "hyperopt_results" / "data.pkl"
+    )
+    hyperopter.prepare_hyperopt()
+    params = {"buy_rsi": 40, "sell_rsi": 60}
+
+    full = hyperopter.generate_optimizer(params, None)
+    losses = full["checkpoint_losses"]
+    assert len(losses) == 3
+    assert "is_pruned" not in full
+    assert full["results_metrics"]["total_trades"] > 0
+
+    # Checkpoints don't change the result.
+    hyperopter.prune_checkpoints = 0
+    plain = hyperopter.generate_optimizer(params, None)
+    assert "checkpoint_losses" not in plain
+    assert plain["loss"] == full["loss"]
+    assert plain["results_metrics"]["total_trades"] == full["results_metrics"]["total_trades"]
+    hyperopter.prune_checkpoints = 3
+
+    # Checkpoint losses equal to the bounds are not pruned.
+    not_pruned = hyperopter.generate_optimizer(params, losses)
+    assert not_pruned["loss"] == full["loss"]
+    assert not_pruned["checkpoint_losses"] == losses
+
+    pruned = hyperopter.generate_optimizer(params, [inf, losses[1] - 1, inf])
+    assert pruned["is_pruned"] is True
+    assert pruned["loss"] == MAX_LOSS
+    assert pruned["checkpoint_losses"] == losses[:2]
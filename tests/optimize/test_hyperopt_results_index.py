@@ -0,0 +1,107 @@
+# pragma pylint: disable=missing-docstring
+import logging
+
+import rapidjson
+
+from binancebot.optimize.hyperopt_results_index import (
+    OFFSET_KEY,
+    HyperoptResultsIndex,
+    get_index_filename,
+    summarize_epoch,
+)
+
+
+def _epoch(epoch: int) -> dict:
+    return {
+        "loss": 1.0 / (epoch + 1),
+        "params_dict": {"buy_rsi": 20 + epoch, "sell_rsi": 60 + epoch},
+        "is_initial_point": epoch < 2,
+        "is_random": False,
+        "is_best": epoch % 3 == 0,
+        "current_epoch": epoch + 1,
+        "results_metrics": {
+            "total_trades": 10 + epoch,
+            "profit_total": 0.01 * epoch,
+            "holding_avg": "1:00:00",
+            "holding_avg_s": 3600,
+            "trades": [{"pair": "BTC/USDT"}],
+        },
+    }
+
+
+def _write_results(results_file, epochs: list[dict]) -> list[tuple]:
+    entries = []
+    with results_file.open("ab") as f:
+        for epoch in epochs:
+            line = rapidjson.dumps(epoch).encode() + b"\n"
+            entries.append((f.tell(), len(line), summarize_epoch(epoch)))
+            f.write(line)
+    HyperoptResultsIndex.append(results_file, entries)
+    return entries
+
+
+def _load(results_file) -> HyperoptResultsIndex:
+    index = HyperoptResultsIndex(results_file)
+    index.load()
+    return index
+
+
+def test_results_index_load(tmp_path):
+    results_file = tmp_path / "results.fthypt"
+    epochs = [_epoch(i) for i in range(5)]
+    entries = _write_results(results_file, epochs)
+
+    index = _load(results_file)
+    assert [s[OFFSET_KEY] for s in index.summaries] == [e[0] for e in entries]
+    assert [s["current_epoch"] for s in index.summaries] == [1, 2, 3, 4, 5]
+    assert "trades" not in index.summaries[0]["results_metrics"]
+    assert index.read_epochs(index.summaries[3:1:-1]) == [epochs[3], epochs[2]]
+
+
+def test_results_index_missing(tmp_path):
+    results_file = tmp_path / "results.fthypt"
+    epochs = [_epoch(i) for i in range(5)]
+    _write_results(results_file, epochs)
+    index_file = get_index_filename(results_file)
+    expected = index_file.read_bytes()
+    index_file.unlink()
+
+    index = _load(results_file)
+    assert len(index.summaries) == 5
+    assert index_file.read_bytes() == expected
+
+
+def test_results_index_truncated_last_line(tmp_path):
+    results_file = tmp_path / "results.fthypt"
+    epochs = [_epoch(i) for i in range(5)]
+    _write_results(results_file, epochs)
+    index_file = get_index_filename(results_file)
+    expected = index_file.read_bytes()
+    # Hyperopt killed while writing the index.
+    index_file.write_bytes(expected[:-20])
+
+    index = _load(results_file)
+    assert [s["current_epoch"] for s in index.summaries] == [1, 2, 3, 4, 5]
+    assert index.read_epochs(index.summaries[-1:]) == [epochs[-1]]
+    assert index_file.read_bytes() == expected
+
+    # Index lines which are complete, but not terminated by a newline.
+    index_file.write_bytes(expected[:-1])
+    assert len(_load(results_file).summaries) == 5
+
+
+def test_results_index_incomplete_epoch(tmp_path, caplog):
+    results_file = tmp_path / "results.fthypt"
+    epochs = [_epoch(i) for i in range(5)]
+    _write_results(results_file, epochs[:3])
+    # Epochs written to the results file, but not to the index - the last one incomplete.
+    with results_file.open("ab") as f:
+        f.write(rapidjson.dumps(epochs[3]).encode() + b"\n")
+        f.write(rapidjson.dumps(epochs[4]).encode()[:-10])
+
+    with caplog.at_level(logging.WARNING):
+        index = _load(results_file)
+    assert "Ignoring incomplete last epoch" in caplog.text
+    assert [s["current_epoch"] for s in index.summaries] == [1, 2, 3, 4]
+    assert index.read_epochs(index.summaries[-1:]) == [epochs[3]]
+    assert len(get_index_filename(results_file).read_text().splitlines()) == 4
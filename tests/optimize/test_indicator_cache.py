@@ -0,0 +1,64 @@
+# pragma pylint: disable=missing-docstring
+import shutil
+
+import pytest
+
+from binancebot.optimize.backtesting import Backtesting
+from binancebot.optimize.indicator_cache import get_indicator_code_hash
+from binancebot.resolvers import StrategyResolver
+from tests.conftest import STRATEGY_PATH, generate_test_data, store_test_data
+
+
+def test_get_indicator_code_hash_strategy_file(default_conf, tmp_path):
+    strategy_path = tmp_path / "strats"
+    strategy_path.mkdir()
+    strategy_file = strategy_path / "strategy_test_backtest.py"
+    shutil.copy(STRATEGY_PATH / "strategy_test_backtest.py", strategy_file)
+    default_conf["strategy_path"] = str(strategy_path)
+    strategy = StrategyResolver.load_strategy(default_conf)
+
+    code_hash = get_indicator_code_hash(strategy)
+    assert get_indicator_code_hash(strategy) == code_hash
+
+    # Any change to the strategy file (e.g. a helper used by populate_indicators)
+    with strategy_file.open("a") as fp:
+        fp.write("\n\ndef helper():\n    return 1\n")
+    assert get_indicator_code_hash(strategy) != code_hash
+
+
+def test_get_indicator_code_hash_params(default_conf):
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+
+    code_hash = get_indicator_code_hash(strategy)
+    strategy.buy_rsi.value = 40
+    assert get_indicator_code_hash(strategy) != code_hash
+
+
+def test_get_indicator_code_hash_informative_data(default_conf):
+    default_conf["strategy"] = "StrategyTestBacktestInformative"
+    strategy = StrategyResolver.load_strategy(default_conf)
+
+    no_data_hash = get_indicator_code_hash(strategy)
+
+    store_test_data(default_conf["datadir"], {"ETH/USDT": generate_test_data("1h", 100)}, "1h")
+    data_hash = get_indicator_code_hash(strategy)
+    assert data_hash != no_data_hash
+    assert get_indicator_code_hash(strategy) == data_hash
+
+    store_test_data(default_conf["datadir"], {"ETH/USDT": generate_test_data("1h", 120)}, "1h")
+    assert get_indicator_code_hash(strategy) != data_hash
+
+    # Candles of other pairs don't matter.
+    updated_hash = get_indicator_code_hash(strategy)
+    store_test_data(default_conf["datadir"], {"BTC/USDT": generate_test_data("1h", 100)}, "1h")
+    assert get_indicator_code_hash(strategy) == updated_hash
+
+
+@pytest.mark.usefixtures("patch_exchange")
+def test_indicator_cache_disabled_analyze_per_epoch(default_conf):
+    default_conf["indicator_cache"] = "day"
+    assert Backtesting(default_conf).indicator_cache is not None
+
+    default_conf["analyze_per_epoch"] = True
+    assert Backtesting(default_conf).indicator_cache is None
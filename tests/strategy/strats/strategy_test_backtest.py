@@ -0,0 +1,65 @@
+# pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
+
+import talib.abstract as ta
+from pandas import DataFrame
+
+from binancebot.strategy import IntParameter, IStrategy
+
+
+class StrategyTestBacktest(IStrategy):
+    """
+    Strategy used by backtesting and hyperopt tests.
+    """
+
+    INTERFACE_VERSION = 3
+
+    minimal_roi = {"60": 0.01, "30": 0.02, "0": 0.04}
+    stoploss = -0.10
+    timeframe = "5m"
+    startup_candle_count: int = 20
+
+    buy_rsi = IntParameter(20, 45, default=35, space="buy")
+    sell_rsi = IntParameter(55, 80, default=65, space="sell")
+
+    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
+        return dataframe
+
+    def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[dataframe["rsi"] < self.buy_rsi.value, ["enter_long", "enter_tag"]] = (
+            1,
+            "rsi_low",
+        )
+        return dataframe
+
+    def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[dataframe["rsi"] > self.sell_rsi.value, "exit_long"] = 1
+        return dataframe
+
+
+class StrategyTestBacktestHold(StrategyTestBacktest):
+    """
+    Enters on candles marked by a volume above ENTRY_VOLUME, and holds trades until the end
+    of the backtest.
+    """
+
+    ENTRY_VOLUME = 1e6
+
+    minimal_roi = {"0": 100}
+    stoploss = -0.99
+
+    def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[dataframe["volume"] > self.ENTRY_VOLUME, "enter_long"] = 1
+        return dataframe
+
+    def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        return dataframe
+
+
+class StrategyTestBacktestInformative(StrategyTestBacktest):
+    """
+    Uses the 1h candles of ETH/USDT as informative data.
+    """
+
+    def informative_pairs(self):
+        return [("ETH/USDT", "1h")]